@@ -2,6 +2,9 @@ import board
 from neopixel import NeoPixel
 from keypad import ShiftRegisterKeys
 from face_invaders.face_invaders import FaceInvadersGame
+from face_invaders.profiling import LatencyTracker, DutyCycle
+from face_invaders.runtime import FrameLoop
+from face_invaders import constants as C
 
 # Show display
 display = board.DISPLAY
@@ -27,47 +30,24 @@ keys = ShiftRegisterKeys(
     max_events=2
 )
 
-# Main processing loop
-while True:
+# Optional input-to-photon latency measurement reported over serial
+latency_tracker = LatencyTracker(C.STATS_REPORT_SECONDS) if C.LATENCY_STATS else None
 
-    # Get user button input
-    key = keys.events.get()
+# Optional per-state duty cycle measurement reported over serial
+duty_cycle = DutyCycle({
+    getattr(C.GameState, name): name for name in dir(C.GameState) if not name.startswith('_')
+}, C.STATS_REPORT_SECONDS) if C.DUTY_CYCLE_STATS else None
 
-    # Process button event if one exits
-    if key:
+# Game steps shared by the main loop runtimes
+frame_loop = FrameLoop(face_invaders_game, display, keys, latency_tracker, duty_cycle)
 
-        # B button event
-        if key.key_number == 0:
-            face_invaders_game.b_button_event(pressed=key.pressed)
+# Run key handling, simulation, refresh and persistence as asyncio tasks
+if C.ASYNC_RUNTIME:
+    from asyncio import run
+    from face_invaders.async_runtime import main
+    run(main(frame_loop))
 
-        # A button event
-        elif key.key_number == 1:
-            face_invaders_game.a_button_event(pressed=key.pressed)
-
-        # Start button event
-        elif key.key_number == 2:
-            face_invaders_game.start_button_event(pressed=key.pressed)
-
-        # Select button event
-        elif key.key_number == 3:
-            face_invaders_game.select_button_event(pressed=key.pressed)
-
-        # Right button event
-        elif key.key_number == 4:
-            face_invaders_game.right_button_event(pressed=key.pressed)
-
-        # Down button event
-        elif key.key_number == 5:
-            face_invaders_game.down_button_event(pressed=key.pressed)
-
-        # Up button event
-        elif key.key_number == 6:
-            face_invaders_game.up_button_event(pressed=key.pressed)
-
-        # Left button event
-        elif key.key_number == 7:
-            face_invaders_game.left_button_event(pressed=key.pressed)
-
-    # Tick game forward and refresh display
-    face_invaders_game.tick()
-    display.refresh()
+# Otherwise poll keys, tick and refresh in a single loop
+else:
+    while True:
+        frame_loop.run_frame()
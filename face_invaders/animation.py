@@ -0,0 +1,71 @@
+"""Sprite animation timing driven by simulation time."""
+
+class AnimationClock:
+    '''
+    Step through a cycle of animation frames using only the delta time
+    passed to updates, so animations never read the system clock and
+    replay identically for the same sequence of updates
+    '''
+
+    def __init__(self, frame_seconds, frame_count, frame=0):
+        """Create a clock cycling through ``frame_count`` frames."""
+
+        # Duration of a single frame and length of the cycle
+        self.frame_seconds = frame_seconds
+        self.frame_count = frame_count
+
+        # Current frame and time spent in it
+        self.frame = frame
+        self.elapsed = 0
+
+    def advance(self, delta_time):
+        '''
+        Advance the clock by ``delta_time`` seconds.
+        Return True if the current frame changed.
+        '''
+        self.elapsed += delta_time
+        if self.elapsed < self.frame_seconds:
+            return False
+
+        # Skip whole frames covered by long updates
+        steps = int(self.elapsed // self.frame_seconds)
+        self.elapsed -= steps * self.frame_seconds
+        frame = (self.frame + steps) % self.frame_count
+        if frame == self.frame:
+            return False
+        self.frame = frame
+        return True
+
+    def reset(self, frame=0):
+        """Restart the cycle at ``frame``."""
+        self.frame = frame
+        self.elapsed = 0
+
+
+class AnimationScheduler:
+    '''
+    Advance animated sprites in a single pass from one shared frame clock.
+    Sprites are only touched when the shared frame changes.
+    '''
+
+    def __init__(self, frame_seconds, frame_count):
+        '''
+        Create a scheduler stepping one frame every ``frame_seconds``.
+        ``frame_count`` must be a multiple of every sprite's frame count so
+        the shared cycle wraps in step with each sprite's own cycle.
+        '''
+        self.clock = AnimationClock(frame_seconds, frame_count)
+
+    def advance(self, delta_time, sprites):
+        '''
+        Advance the shared clock by ``delta_time`` seconds and show the new
+        frame on each animated sprite if the frame changed
+        '''
+        if not self.clock.advance(delta_time):
+            return
+
+        # Update sprites with more than one frame
+        frame = self.clock.frame
+        for sprite in sprites:
+            if sprite.frame_count > 1:
+                sprite.set_frame(frame)
@@ -0,0 +1,80 @@
+"""Cooperative asyncio main loop splitting the Face Invaders frame into tasks."""
+
+import asyncio
+from time import monotonic
+
+from face_invaders import constants as C
+
+
+async def keypad_task(frame_loop, keys_polled, key_handled):
+    '''
+    Handle all queued key events each poll, signalling the simulation task
+    that input is current and whether any key was handled. Keys are polled
+    less often in states below the full frame rate.
+    '''
+    game = frame_loop.game
+    while True:
+        while frame_loop.poll_key():
+            key_handled.set()
+        keys_polled.set()
+        await asyncio.sleep(C.KEY_POLL_SECONDS if game.frame_seconds() == 0 else C.IDLE_POLL_SECONDS)
+
+async def simulation_task(frame_loop, keys_polled, key_handled, frame_ready):
+    '''
+    Tick the game at a fixed rate, signalling the refresh task after each
+    tick. Each tick waits for a key poll made since the last one, so input
+    read during a refresh is applied to the next frame. A late tick restarts
+    the schedule instead of running extra ticks to catch up. States below
+    the full frame rate tick less often, and static menus tick only after a
+    key is handled.
+    '''
+    game = frame_loop.game
+    next_time = monotonic()
+    while True:
+        await keys_polled.wait()
+        keys_polled.clear()
+        key_handled.clear()
+        frame_loop.tick()
+        frame_ready.set()
+
+        # Wait on input in static menus, without simulating the time waited
+        period = game.frame_seconds()
+        if period is None:
+            await key_handled.wait()
+            game.skip_elapsed()
+            next_time = monotonic()
+            continue
+
+        # Sleep until the next scheduled tick
+        next_time += max(period, C.SIMULATION_TICK_SECONDS)
+        delay = next_time - monotonic()
+        if delay < 0:
+            next_time -= delay
+            delay = 0
+        await asyncio.sleep(delay)
+
+async def refresh_task(frame_loop, frame_ready):
+    """Refresh the display once after each tick."""
+    while True:
+        await frame_ready.wait()
+        frame_ready.clear()
+        frame_loop.refresh()
+        frame_loop.end_frame()
+
+async def persistence_task(frame_loop):
+    """Periodically write state deferred by the game."""
+    while True:
+        await asyncio.sleep(C.PERSIST_SECONDS)
+        frame_loop.persist()
+
+async def main(frame_loop):
+    """Run the keypad, simulation, refresh and persistence tasks."""
+    keys_polled = asyncio.Event()
+    key_handled = asyncio.Event()
+    frame_ready = asyncio.Event()
+    await asyncio.gather(
+        asyncio.create_task(keypad_task(frame_loop, keys_polled, key_handled)),
+        asyncio.create_task(simulation_task(frame_loop, keys_polled, key_handled, frame_ready)),
+        asyncio.create_task(refresh_task(frame_loop, frame_ready)),
+        asyncio.create_task(persistence_task(frame_loop))
+    )
@@ -3,11 +3,24 @@
 from digitalio import DigitalInOut
 from audioio import AudioOut
 from audiomixer import Mixer
+from audiocore import WaveFile
 
 class AudioManager:
-    """Manage audio output using a mixer."""
+    '''
+    Manage audio output using a mixer. Sound files are opened when played,
+    and each mixer voice decodes through one shared buffer, since a voice
+    plays a single sound at a time. Sound files must already be in the
+    mixer's sample format so no conversion happens during playback.
 
-    def __init__(self, board, voice_count=3):
+    Game events queue sounds with ``queue_sound``, and ``flush_sounds``
+    starts them once per frame: each voice plays at most its highest
+    priority request, never interrupts a higher priority sound still
+    playing, and does not restart a sound within its minimum retrigger
+    interval.
+    '''
+
+    def __init__(self, board, voice_count=3, voice_buffer_size=512, sample_rate=22050,
+                 channel_count=1, bits_per_sample=16, samples_signed=True, retrigger_seconds=None):
         """Initialize the audio system for the game."""
 
         # Enable the PyBadge speaker
@@ -17,22 +30,96 @@ class AudioManager:
         # Create audio output object
         self.audio = AudioOut(board.SPEAKER, quiescent_value=0)
 
-        # Create audio mixer object
+        # Create audio mixer object, keeping its sample format for checking
+        # sound files, since the mixer does not expose all of it
         self.voice_count = voice_count
+        self.sample_format = (sample_rate, channel_count, bits_per_sample)
         self.mixer = Mixer(
             voice_count=self.voice_count,
-            sample_rate=22050,
-            channel_count=1,
-            bits_per_sample=16,
-            samples_signed=True,
+            sample_rate=sample_rate,
+            channel_count=channel_count,
+            bits_per_sample=bits_per_sample,
+            samples_signed=samples_signed,
             buffer_size=6144,
         )
         self.audio.play(self.mixer)
         self.sounds = {}
 
+        # Decode buffer shared by the sounds of each voice
+        self.voice_buffer_size = voice_buffer_size
+        self.voice_buffers = [bytearray(voice_buffer_size) for i in range(voice_count)]
+
+        # Name, file and WaveFile of the sound last opened on each voice
+        self.voice_names = [None] * voice_count
+        self.voice_files = [None] * voice_count
+        self.voice_waves = [None] * voice_count
+
+        # Queued (name, priority, loop) request per voice, and the priority
+        # of the sound each voice last started
+        self.pending = [None] * voice_count
+        self.voice_priorities = [0] * voice_count
+
+        # Minimum seconds between starts of each sound, and last start times
+        self.retrigger_seconds = retrigger_seconds or {}
+        self.last_play_times = {}
+
+        # Sound requests and mixer plays, for frame statistics
+        self.requests = 0
+        self.plays = 0
+
     def load_sounds(self, sounds):
-        """Store a dictionary mapping names to (voice_index, WaveFile)."""
+        '''
+        Store a dictionary mapping names to (voice_index, priority, file
+        path), checking that every file matches the mixer format
+        '''
         self.sounds = sounds
+        for sound_name in sounds:
+            self.verify_sound(sound_name)
+
+    def verify_sound(self, sound_name):
+        """Raise ValueError if a sound file's format differs from the mixer's."""
+        voice_index, _, path = self.sounds[sound_name]
+        with open(path, 'rb') as sound_file:
+            wave = WaveFile(sound_file, self.voice_buffers[voice_index])
+            found = (wave.sample_rate, wave.channel_count, wave.bits_per_sample)
+            wave.deinit()
+        expected = self.sample_format
+        if found != expected:
+            raise ValueError('{}: format {} does not match mixer {}; run tools/optimize_sounds.py'.format(
+                path, found, expected))
+
+    def open_sound(self, sound_name):
+        '''
+        Return the voice index and WaveFile for a sound, opening its file
+        on the voice's shared buffer in place of the voice's previous sound
+        '''
+        voice_index, _, path = self.sounds[sound_name]
+        if self.voice_names[voice_index] != sound_name:
+
+            # Release the previous sound and close its file before reusing the buffer
+            wave = self.voice_waves[voice_index]
+            if wave is not None:
+                self.mixer.voice[voice_index].stop()
+                wave.deinit()
+                self.voice_files[voice_index].close()
+                self.voice_waves[voice_index] = None
+                self.voice_files[voice_index] = None
+                self.voice_names[voice_index] = None
+
+            # Open the sound on the voice's shared buffer
+            sound_file = open(path, 'rb')
+            self.voice_waves[voice_index] = WaveFile(sound_file, self.voice_buffers[voice_index])
+            self.voice_files[voice_index] = sound_file
+            self.voice_names[voice_index] = sound_name
+
+        return voice_index, self.voice_waves[voice_index]
+
+    def buffer_savings(self):
+        '''
+        Return the decode buffer bytes saved by sharing per voice buffers
+        instead of giving every sound its own
+        '''
+        return (len(self.sounds) - self.voice_count) * self.voice_buffer_size
 
     def set_volume(self, volume):
         """Set mixer channel levels from 0-100 volume."""
@@ -40,16 +127,58 @@ class AudioManager:
             self.mixer.voice[i].level = volume / 100.0
 
     def play_sound(self, sound_name, loop=False):
-        """Play a sound by name."""
-        voice_index, sound_wav = self.sounds[sound_name]
+        """Play a sound by name immediately."""
+        voice_index, sound_wav = self.open_sound(sound_name)
         self.mixer.voice[voice_index].play(sound_wav, loop=loop)
+        self.voice_priorities[voice_index] = self.sounds[sound_name][1]
+        self.plays += 1
+
+    def queue_sound(self, sound_name, loop=False):
+        '''
+        Request a sound by name for the next flush, replacing any lower
+        priority request queued on the same voice
+        '''
+        self.requests += 1
+        voice_index, priority, _ = self.sounds[sound_name]
+        pending = self.pending[voice_index]
+        if pending is None or priority >= pending[1]:
+            self.pending[voice_index] = (sound_name, priority, loop)
+
+    def flush_sounds(self, timestamp):
+        """Start the sounds queued since the last flush."""
+        for voice_index, pending in enumerate(self.pending):
+            if pending is None:
+                continue
+            self.pending[voice_index] = None
+            sound_name, priority, loop = pending
+
+            # Let a higher priority sound finish
+            if priority < self.voice_priorities[voice_index] and self.mixer.voice[voice_index].playing:
+                continue
+
+            # Skip sounds restarted within their retrigger interval
+            last_time = self.last_play_times.get(sound_name)
+            if last_time is not None and timestamp - last_time < self.retrigger_seconds.get(sound_name, 0):
+                continue
+
+            self.last_play_times[sound_name] = timestamp
+            self.play_sound(sound_name, loop=loop)
+
+    def cancel_sound(self, sound_name):
+        """Drop a queued request for a sound by name."""
+        voice_index = self.sounds[sound_name][0]
+        pending = self.pending[voice_index]
+        if pending is not None and pending[0] == sound_name:
+            self.pending[voice_index] = None
 
     def stop_sound(self, sound_name):
-        """Stop playback of a sound by name."""
-        voice_index, _ = self.sounds[sound_name]
+        """Stop playback of a sound by name, including a queued request."""
+        self.cancel_sound(sound_name)
+        voice_index = self.sounds[sound_name][0]
         self.mixer.voice[voice_index].stop()
 
     def end_sound(self, sound_name):
-        """End playback of a looping sound by name."""
-        voice_index, _ = self.sounds[sound_name]
+        """End playback of a looping sound by name, including a queued request."""
+        self.cancel_sound(sound_name)
+        voice_index = self.sounds[sound_name][0]
         self.mixer.voice[voice_index].end()
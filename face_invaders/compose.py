@@ -0,0 +1,97 @@
+"""Pre-composition of static display layers into a single bitmap."""
+
+from bitmaptools import blit, fill_region
+from displayio import Bitmap, Palette, TileGrid
+
+# Most colors a canvas holds while keeping 4 bits per pixel
+MAX_COLORS = 16
+
+class Composer:
+    '''
+    Bake static images, text and rectangles into one in-RAM bitmap so the
+    display draws a single layer instead of compositing each element
+    '''
+
+    def __init__(self, x, y, width, height, palette_size=MAX_COLORS):
+        """Create an empty, fully transparent canvas placed at (x, y)."""
+
+        # Canvas position on the display
+        self.x = x
+        self.y = y
+
+        # Canvas bitmap, index 0 is reserved for transparency
+        self.bitmap = Bitmap(width, height, palette_size)
+        self.palette = Palette(palette_size)
+        self.palette.make_transparent(0)
+        self.color_count = 1
+
+    def add_color(self, color):
+        '''
+        Return the canvas palette index of an opaque color, adding it to the
+        palette unless already present
+        '''
+        for index in range(1, self.color_count):
+            if self.palette[index] == color and not self.palette.is_transparent(index):
+                return index
+        index = self.color_count
+        if index >= len(self.palette):
+            raise ValueError('canvas palette is full')
+        self.palette[index] = color
+        self.color_count += 1
+        return index
+
+    def fill_rect(self, x, y, width, height, color_index):
+        """Fill a rectangle given in display coordinates."""
+        fill_region(
+            self.bitmap,
+            max(x - self.x, 0),
+            max(y - self.y, 0),
+            min(x - self.x + width, self.bitmap.width),
+            min(y - self.y + height, self.bitmap.height),
+            color_index
+        )
+
+    def draw_bitmap(self, bitmap, palette, x, y):
+        '''
+        Blit an indexed bitmap at display coordinates (x, y), skipping its
+        transparent index 0. Its palette is copied into the canvas palette
+        at the same indices so pixels are copied unchanged, so it must be
+        drawn before any other color is added.
+        '''
+        if self.color_count > 1 or len(palette) > len(self.palette):
+            raise ValueError('bitmap palette does not fit the canvas palette')
+        for i in range(1, len(palette)):
+            self.palette[i] = palette[i]
+            if palette.is_transparent(i):
+                self.palette.make_transparent(i)
+        self.color_count = len(palette)
+        blit(self.bitmap, bitmap, x - self.x, y - self.y, skip_source_index=0)
+
+    def draw_text(self, font, text, x, y, color_index):
+        """Draw text from a fixed width tile font with its top left at (x, y)."""
+        tile_width, tile_height = font.get_bounding_box()[:2]
+        tiles_per_row = font.bitmap.width // tile_width
+        for n, char in enumerate(text):
+
+            # Locate the glyph within the font tile sheet
+            tile_index = font.get_glyph(ord(char)).tile_index
+            glyph_x = (tile_index % tiles_per_row) * tile_width
+            glyph_y = (tile_index // tiles_per_row) * tile_height
+
+            # Copy set glyph pixels within the canvas
+            char_x = x - self.x + n * tile_width
+            char_y = y - self.y
+            for j in range(max(-char_y, 0), min(self.bitmap.height - char_y, tile_height)):
+                for i in range(max(-char_x, 0), min(self.bitmap.width - char_x, tile_width)):
+                    if font.bitmap[glyph_x + i, glyph_y + j]:
+                        self.bitmap[char_x + i, char_y + j] = color_index
+
+    def tilegrid(self):
+        """Return a TileGrid displaying the composed canvas."""
+        return TileGrid(self.bitmap, pixel_shader=self.palette, x=self.x, y=self.y)
+
+
+def text_size(font, text):
+    """Return the (width, height) of ``text`` drawn with a fixed width tile font."""
+    tile_width, tile_height = font.get_bounding_box()[:2]
+    return len(text) * tile_width, tile_height
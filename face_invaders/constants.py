@@ -15,8 +15,37 @@ class GameState:
 # Game settings
 HIGH_SCORES_FNAME = 'face_invaders/scores.json'
 NUM_HIGH_SCORES = 5
+SCORE_DIGITS = 6
 MAX_LIVES = 3
 
+# Seed for gameplay random streams; None seeds from the clock at boot
+RANDOM_SEED = None
+
+# Playfield size in pixels; None uses the display size. A playfield larger
+# than the display plays as a scrolling arena following the ship
+WORLD_WIDTH = None
+WORLD_HEIGHT = None
+
+# Distance from the ship beyond which arena faces skip collision checks;
+# must exceed bullet range plus half a large face
+ARENA_COLLISION_RANGE = 120
+
+# Level of detail; particles past this fraction of their life update at
+# half rate (1 disables this at full effects). The frame governor lowers
+# the fraction while frames run over budget.
+LOD_PARTICLE_AGE = 0.6
+
+# Block sizes of coarse collision masks checked before pixel masks,
+# coarsest first
+COARSE_MASK_BLOCKS = (8, 4)
+
+# Skip collision checks for face pairs proven separated by speed bounds
+PAIR_SCHEDULER = True
+
+# Display settings
+BACKGROUND_IN_RAM = True
+PRECOMPOSE_MENUS = True
+
 # Points awarded for destroying faces
 FACE_POINTS = {
     1: 20,  # Large face
@@ -24,6 +53,15 @@ FACE_POINTS = {
     3: 100  # Small face
 }
 
+# Face wave difficulty curve; wave size grows per level up to a maximum
+# and face speeds are drawn from a range that shifts per level
+WAVE_BASE_SIZE = 1
+WAVE_SIZE_PER_LEVEL = 1
+WAVE_MAX_SIZE = 3
+WAVE_SPEED_MIN = 10
+WAVE_SPEED_MAX = 30
+WAVE_SPEED_PER_LEVEL = 0
+
 # Player input characters
 CHARACTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
@@ -31,3 +69,61 @@ CHARACTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 SHIP_RESET_SECONDS = 2.5
 GAME_OVER_SECONDS = 2
 CREATE_BULLET_SECONDS = 0.25
+FACE_FRAME_SECONDS = 0.2
+
+# Main loop runtime; the asyncio runtime, which needs the asyncio library,
+# runs key polling, fixed-rate ticks, display refresh and deferred saves as
+# separate tasks
+ASYNC_RUNTIME = False
+SIMULATION_TICK_SECONDS = 0.03
+KEY_POLL_SECONDS = 0.002
+PERSIST_SECONDS = 0.5
+
+# Idle throttling; outside active play and the game over delay, scenes of
+# drifting faces refresh every IDLE_FRAME_SECONDS, and static menus refresh
+# only after input, polling keys every IDLE_POLL_SECONDS while waiting
+IDLE_THROTTLE = True
+IDLE_FRAME_SECONDS = 0.066
+IDLE_POLL_SECONDS = 0.01
+
+# Game snapshots; a compact snapshot of the game in progress is saved on
+# entering the options or controls menu during play, or once per game when
+# the battery falls below LOW_BATTERY_VOLTS (None disables), and resumed at
+# boot paused in the options menu
+GAME_SNAPSHOTS = True
+SNAPSHOT_FNAME = 'face_invaders/snapshot.bin'
+LOW_BATTERY_VOLTS = 3.5
+BATTERY_CHECK_SECONDS = 10
+
+# Frame budget governor; degrades particle effects and then the refresh
+# rate while the rolling frame time exceeds the budget
+FRAME_GOVERNOR = True
+FRAME_BUDGET_SECONDS = 0.05
+
+# Mixer sample format; every sound file must match it, as written by
+# tools/optimize_sounds.py
+AUDIO_SAMPLE_RATE = 22050
+AUDIO_CHANNEL_COUNT = 1
+AUDIO_BITS_PER_SAMPLE = 8
+AUDIO_SAMPLES_SIGNED = False
+
+# Decode buffer bytes shared by the sounds of each mixer voice
+AUDIO_VOICE_BUFFER_SIZE = 512
+
+# Minimum seconds between starts of a sound; requests inside the interval
+# are dropped rather than restarting the sample
+AUDIO_RETRIGGER_SECONDS = {
+    'bullet': 0.1,
+    'explosion_small': 0.1,
+    'explosion_medium': 0.1,
+    'explosion_large': 0.1,
+}
+
+# Profiling settings
+BOOT_MEMORY_REPORT = False
+# Time start menu refreshes with the background from flash and from RAM at boot
+REFRESH_BENCHMARK = False
+LATENCY_STATS = False
+DUTY_CYCLE_STATS = False
+FRAME_STATS = False
+STATS_REPORT_SECONDS = 10
@@ -0,0 +1,59 @@
+"""Containers tracking Face Invaders game objects and their display layers."""
+
+from displayio import Group
+
+class EntityList:
+    '''
+    List of game objects kept in sync with a display group holding each
+    object's display layer at the same index. Each object stores its index
+    in ``slot``, so removal swaps the last object into the freed slot
+    instead of searching the list or the display group. Each appended
+    object is also given a ``serial`` unique within the list.
+    '''
+
+    def __init__(self):
+        """Create an empty list and its display group."""
+        self.items = []
+        self.group = Group()
+        self.next_serial = 0
+
+    def __len__(self):
+        """Return the number of tracked objects."""
+        return len(self.items)
+
+    def __getitem__(self, index):
+        """Return the object at ``index``."""
+        return self.items[index]
+
+    def __iter__(self):
+        """Iterate over tracked objects."""
+        return iter(self.items)
+
+    def append(self, obj):
+        """Track and display ``obj``."""
+        obj.slot = len(self.items)
+        obj.serial = self.next_serial
+        self.next_serial += 1
+        self.items.append(obj)
+        self.group.append(obj.layer)
+
+    def remove(self, obj):
+        """Stop tracking and displaying ``obj`` in constant time."""
+        slot = obj.slot
+        last = self.items.pop()
+        last_layer = self.group.pop()
+
+        # Move the last object into the freed slot
+        if last is not obj:
+            self.items[slot] = last
+            self.group[slot] = last_layer
+            last.slot = slot
+        obj.slot = None
+
+    def clear(self):
+        """Stop tracking and displaying all objects."""
+        while len(self.group):
+            self.group.pop()
+        for obj in self.items:
+            obj.slot = None
+        self.items.clear()
@@ -1,21 +1,36 @@
 from time import monotonic
-from random import randrange, choice
 from gc import collect as gc_collect
 from gc import mem_free
-from math import sin, cos, radians
+from math import sin, cos, radians, isfinite
 from adafruit_imageload import load as imageload
 from terminalio import FONT
 from displayio import Group, TileGrid, OnDiskBitmap, Palette
-from audiocore import WaveFile
 from adafruit_display_text import bitmap_label
 from vectorio import Rectangle, Polygon
+from analogio import AnalogIn
 
 from face_invaders.audio import AudioManager
+from face_invaders.labels import CachedLabel, DigitDisplay
+from face_invaders.profiling import FrameStats, MemoryReport
+from face_invaders.governor import FrameGovernor
+from face_invaders.scenes import SceneManager
+from face_invaders.compose import Composer, text_size
+from face_invaders.sprites import SpriteSheet, build_coarse_levels
+from face_invaders.animation import AnimationScheduler
+from face_invaders.waves import WavePlanner
+from face_invaders.rng import XorShift, ANGLES
+from face_invaders.entities import EntityList
+from face_invaders.world import WorldBounds, Camera
+from face_invaders.fixed import TickClock, ONE, TIME_ONE
+from face_invaders.pairs import PairScheduler
 
 from face_invaders.space_objects import Ship, Face
 from face_invaders.space_particles import RectParticle, LineParticle, Bullet
 from face_invaders import constants as C
 from face_invaders import high_scores
+from face_invaders import snapshot
+from face_invaders import ship_sprites
+from face_invaders import sound_manifest
 
 
 class FaceInvadersGame():
@@ -32,31 +47,92 @@ class FaceInvadersGame():
         self.display_center_x = self.display.width // 2
         self.display_center_y = self.display.height // 2
 
+        # Playfield bounds, sized to the display unless configured
+        world_width = C.WORLD_WIDTH or self.display.width
+        world_height = C.WORLD_HEIGHT or self.display.height
+        arena = world_width > self.display.width or world_height > self.display.height
+        self.world = WorldBounds(world_width, world_height, padded=not arena)
+        self.world_center_x = world_width // 2
+        self.world_center_y = world_height // 2
+
+        # Camera following the ship around playfields larger than the display,
+        # with collision checks limited to faces near the ship
+        self.camera = Camera(self.world, self.display.width, self.display.height) if arena else None
+        self.collision_range_squared = C.ARENA_COLLISION_RANGE ** 2
+
+        # Faces per wave grow with the number of screens the playfield covers
+        self.wave_scale = max(1, (world_width * world_height) // (self.display.width * self.display.height))
+
+        # Optional report of free memory after each boot stage
+        boot_memory = MemoryReport('boot') if C.BOOT_MEMORY_REPORT else None
+        if boot_memory:
+            gc_collect()
+            boot_memory.mark('start', mem_free())
+
         # Initialize audio system
-        self.audio_manager = AudioManager(self.board)
+        self.audio_manager = AudioManager(
+            self.board,
+            voice_buffer_size=C.AUDIO_VOICE_BUFFER_SIZE,
+            sample_rate=C.AUDIO_SAMPLE_RATE,
+            channel_count=C.AUDIO_CHANNEL_COUNT,
+            bits_per_sample=C.AUDIO_BITS_PER_SAMPLE,
+            samples_signed=C.AUDIO_SAMPLES_SIGNED,
+            retrigger_seconds=C.AUDIO_RETRIGGER_SECONDS
+        )
         gc_collect()
+        if boot_memory:
+            boot_memory.mark('audio', mem_free())
 
         # Initialize game state variables
         self._init_game_state()
         gc_collect()
+        if boot_memory:
+            boot_memory.mark('state', mem_free())
         
         # Load resources (images, sounds)
         self._load_game_assets()
         gc_collect()
+        if boot_memory:
+            boot_memory.mark('assets', mem_free())
         
         # Create UI elements and display groups
         self._create_ui_elements()
         gc_collect()
+        if boot_memory:
+            boot_memory.mark('ui', mem_free())
         
         # Create game ship
         self._create_ship_object()
         gc_collect()
+        if boot_memory:
+            boot_memory.mark('ship', mem_free())
         
-        # Load high scores
+        # Load high scores; new entries are saved outside key handling
         self.high_scores = high_scores.load_high_scores()
+        self.high_scores_unsaved = False
 
-        # Show start menu
-        self.start_menu()
+        # Resume a game saved before a reset, or show the start menu
+        self.snapshot_layout = self.snapshot_layout_version()
+        restore_start_time = monotonic()
+        restored_size = self.restore_snapshot() if C.GAME_SNAPSHOTS else None
+        if restored_size is None:
+            self.start_menu()
+            if C.REFRESH_BENCHMARK:
+                self.benchmark_refresh()
+
+        # Print the boot memory report with the audio buffer savings
+        if boot_memory:
+            boot_memory.note('shared audio buffers saved {} bytes, {} of {} sound files open at most'.format(
+                self.audio_manager.buffer_savings(),
+                self.audio_manager.voice_count,
+                len(self.sounds)
+            ))
+            if restored_size is not None:
+                boot_memory.note('restored {} byte snapshot in {:.1f} ms'.format(
+                    restored_size,
+                    (monotonic() - restore_start_time) * 1000
+                ))
+            boot_memory.report()
 
 
     def _init_game_state(self):
@@ -70,10 +146,16 @@ class FaceInvadersGame():
         self.volume = 100
         self.set_volume()
         
-        # Initialize game object tracking lists
-        self.faces = []
-        self.particles = []
-        self.bullets = []
+        # Seeded random streams per subsystem, replayable with a fixed seed
+        seed = C.RANDOM_SEED if C.RANDOM_SEED is not None else int(monotonic() * 1000)
+        self.wave_rng = XorShift(seed)
+        self.face_rng = XorShift(seed + 1)
+        self.particle_rng = XorShift(seed + 2)
+
+        # Initialize game object tracking lists, each with its display group
+        self.faces = EntityList()
+        self.particles = EntityList()
+        self.bullets = EntityList()
         
         # Game current level
         self.level = 1
@@ -90,7 +172,38 @@ class FaceInvadersGame():
         
         # Time of last game tick used to calculate delta time
         self.last_tick_time = None
+        self.tick_clock = TickClock()
+
+        # Number of game ticks processed, used to link input to frames
+        self.tick_count = 0
+
+        # Optional per-frame statistics reported over serial
+        self.frame_stats = FrameStats(C.STATS_REPORT_SECONDS) if C.FRAME_STATS else None
+        Face.count_levels = bool(C.FRAME_STATS)
+
+        # Optional governor degrading effects when frames run over budget
+        self.governor = FrameGovernor(
+            C.FRAME_BUDGET_SECONDS,
+            report_seconds=C.STATS_REPORT_SECONDS if C.FRAME_STATS else None
+        ) if C.FRAME_GOVERNOR else None
+
+        # Optional scheduler skipping collision pairs proven separated
+        self.pair_scheduler = PairScheduler(self.world) if C.PAIR_SCHEDULER else None
+
+        # Level of detail setting for the particle pass
+        self.lod_particle_age = C.LOD_PARTICLE_AGE
         
+        # Snapshot packed for writing outside key handling, and whether a
+        # saved snapshot may exist
+        self.snapshot_data = None
+        self.snapshot_saved = C.GAME_SNAPSHOTS
+
+        # Battery voltage monitor used to snapshot the game once on low
+        # battery, only created when snapshots are saved
+        self.battery = AnalogIn(self.board.VOLTAGE_MONITOR) if C.GAME_SNAPSHOTS and C.LOW_BATTERY_VOLTS else None
+        self.battery_check_time = 0
+        self.low_battery_saved = False
+
         # Track ship hit time
         self.ship_hit_time = None
         self.ship_reset_seconds = C.SHIP_RESET_SECONDS
@@ -103,27 +216,33 @@ class FaceInvadersGame():
         self.create_bullet_time = None
         self.create_bullet_seconds = C.CREATE_BULLET_SECONDS
 
+        # Button handlers indexed by keypad key number
+        self.key_handlers = (
+            self.b_button_event,
+            self.a_button_event,
+            self.start_button_event,
+            self.select_button_event,
+            self.right_button_event,
+            self.down_button_event,
+            self.up_button_event,
+            self.left_button_event
+        )
+
     def _load_game_assets(self):
         """Load all game assets (sounds, images, sprites)"""
 
-        # Load game sound effects and define audio channel
-        self.sounds = {
-            'continue': (2, WaveFile(open('face_invaders/snds/continue.wav','rb'))),
-            'game_over': (2, WaveFile(open('face_invaders/snds/game_over.wav','rb'))),
-            'new_ship': (2, WaveFile(open('face_invaders/snds/new_ship.wav','rb'))),
-            'bullet': (0, WaveFile(open('face_invaders/snds/bullet.wav','rb'))),
-            'click': (0, WaveFile(open('face_invaders/snds/click.wav','rb'))),
-            'ship_thrust': (0, WaveFile(open('face_invaders/snds/ship_thrust.wav','rb'))),
-            'ship_explosion': (1, WaveFile(open('face_invaders/snds/ship_explosion.wav','rb'))),
-            'explosion_small': (1, WaveFile(open('face_invaders/snds/face_explosion_small.wav','rb'))),
-            'explosion_medium': (1, WaveFile(open('face_invaders/snds/face_explosion_medium.wav','rb'))),
-            'explosion_large': (1, WaveFile(open('face_invaders/snds/face_explosion_large.wav','rb')))
-        }
+        # Game sound effects with their audio channel and priority, as
+        # written by tools/optimize_sounds.py; files are opened by the audio
+        # manager when played
+        self.sounds = sound_manifest.SOUNDS
         self.audio_manager.load_sounds(self.sounds)
 
-        # Load background image
-        self.background_bitmap = OnDiskBitmap('face_invaders/img/background.bmp')
-        self.background_pallete = self.background_bitmap.pixel_shader
+        # Load background image into RAM, or read it from flash on each refresh
+        if C.BACKGROUND_IN_RAM:
+            self.background_bitmap, self.background_pallete = imageload('face_invaders/img/background.bmp')
+        else:
+            self.background_bitmap = OnDiskBitmap('face_invaders/img/background.bmp')
+            self.background_pallete = self.background_bitmap.pixel_shader
 
         # Load logo image
         self.logo_bitmap = OnDiskBitmap('face_invaders/img/logo.bmp')
@@ -140,26 +259,46 @@ class FaceInvadersGame():
         # Load ship sprites
         self.ships_bitmap, self.ships_pallette = imageload('face_invaders/img/ships.bmp')
         self.ships_pallette.make_transparent(0)
-        self.ships_tile_width = 20
-        self.ships_tile_height = 20
+        self.ships_tile_width = ship_sprites.TILE_WIDTH
+        self.ships_tile_height = ship_sprites.TILE_HEIGHT
         
-        # Load large face sprites
-        self.faces_large_bitmap, self.faces_large_pallette = imageload('face_invaders/img/face_large.bmp')
-        self.faces_large_pallette.make_transparent(0)
-        self.faces_large_tile_width = 40
-        self.faces_large_tile_height = 48
-
-        # Load medium face sprites
-        self.faces_medium_bitmap, self.faces_medium_pallette = imageload('face_invaders/img/face_medium.bmp')
-        self.faces_medium_pallette.make_transparent(0)
-        self.faces_medium_tile_width = 30
-        self.faces_medium_tile_height = 36
-
-        # Load small face sprites
-        self.faces_small_bitmap, self.faces_small_pallette = imageload('face_invaders/img/face_small.bmp')
-        self.faces_small_pallette.make_transparent(0)
-        self.faces_small_tile_width = 20
-        self.faces_small_tile_height = 24
+        # Load face sprite sheets by face size. Each sheet row holds a
+        # personalized face and each column one of its animation frames
+        self.face_sheets = {}
+        face_sprites = [
+            (1, 'face_invaders/img/face_large.bmp', 40, 48),
+            (2, 'face_invaders/img/face_medium.bmp', 30, 36),
+            (3, 'face_invaders/img/face_small.bmp', 20, 24)
+        ]
+        for size, fname, tile_width, tile_height in face_sprites:
+            faces_bitmap, faces_pallette = imageload(fname)
+            faces_pallette.make_transparent(0)
+            self.face_sheets[size] = SpriteSheet(
+                faces_bitmap,
+                faces_pallette,
+                tile_width,
+                tile_height,
+                coarse_blocks=C.COARSE_MASK_BLOCKS
+            )
+
+        # Shared clock advancing face animation frames, cycling through a
+        # multiple of every sheet's frame count
+        frame_counts = set(sheet.frame_count for sheet in self.face_sheets.values())
+        cycle_frames = 1
+        for frame_count in frame_counts:
+            cycle_frames *= frame_count
+        self.animation_scheduler = AnimationScheduler(C.FACE_FRAME_SECONDS, cycle_frames)
+
+        # Planner precomputing large face waves, spawning them just outside the display
+        large_sheet = self.face_sheets[1]
+        self.wave_planner = WavePlanner(
+            self.world,
+            large_sheet.tile_width // 2,
+            large_sheet.tile_height // 2,
+            large_sheet.variant_count,
+            self.wave_rng,
+            scale=self.wave_scale
+        )
         
         # Palette colors used for display objects
         self.palette = Palette(2)
@@ -175,7 +314,6 @@ class FaceInvadersGame():
 
         # Background display group
         self.background_group = Group()
-        self.main_group.append(self.background_group)
 
         # Display background image
         self.background_group.append(TileGrid(
@@ -185,7 +323,9 @@ class FaceInvadersGame():
         
         # Game objects display group
         self.game_group = Group()
-        self.main_group.append(self.game_group)
+        self.game_group.append(self.faces.group)
+        self.game_group.append(self.particles.group)
+        self.game_group.append(self.bullets.group)
         
         # Create and initialize all UI groups (start menu, options, etc)
         self._create_start_menu()
@@ -196,18 +336,31 @@ class FaceInvadersGame():
         self._create_options_menu()
         self._create_controls_menu()
 
+        # Map each game state to its display groups. Options and controls
+        # menus are shown over the scene of the state they were opened from
+        play_groups = (self.background_group, self.game_group)
+        self.scene_manager = SceneManager(self.main_group, {
+            C.GameState.START_MENU: play_groups + (self.start_menu_group,),
+            C.GameState.ACTIVE_GAME: play_groups + (self.ui_group,),
+            C.GameState.GAME_OVER: play_groups + (self.game_over_group,),
+            C.GameState.SCORE_INPUT: play_groups + (self.score_input_group,),
+            C.GameState.HIGH_SCORES: play_groups + (self.high_scores_group,),
+            C.GameState.OPTIONS_MENU: (self.options_menu_group,),
+            C.GameState.CONTROLS_MENU: (self.controls_menu_group,)
+        })
+
     def _create_start_menu(self):
         """Create start menu UI elements"""
 
-        # Start menu display group and hide
+        # Start menu display group
         self.start_menu_group = Group()
-        self.main_group.append(self.start_menu_group)
-        self.start_menu_group.hidden = True
+        self.start_menu_composed = False
 
-        # Create start menu text and hide display group
+        # Create start menu text
+        self.start_menu_text = 'Press A to Start'
         self.start_menu_group.append(bitmap_label.Label(
             FONT,
-            text='Press A to Start',
+            text=self.start_menu_text,
             color=self.palette[0],
             anchor_point=(0.5, 1.0),
             anchored_position=(self.display_center_x, self.display.height-5)
@@ -222,20 +375,19 @@ class FaceInvadersGame():
     def _create_game_ui(self):
         """ Create game user interface elements """
 
-        # UI display group and hide
+        # UI display group
         self.ui_group = Group()
-        self.main_group.append(self.ui_group)
-        self.ui_group.hidden = True
 
-        # Create game UI elements and hide display group
-        self.score_text = bitmap_label.Label(
+        # Create game UI elements
+        self.score_text = DigitDisplay(
             FONT,
-            text='0',
-            color=self.palette[0],
-            anchor_point=(1.0, 0.0),
-            anchored_position=(self.display.width-3, 3)
+            C.SCORE_DIGITS,
+            self.palette[0],
+            right=self.display.width-3,
+            y=3
         )
-        self.ui_group.append(self.score_text)
+        self.score_text.show(0)
+        self.ui_group.append(self.score_text.tilegrid)
         self.lives_tilegrids = []
         for i in range(3):
             live_tilegrid = TileGrid(
@@ -253,10 +405,8 @@ class FaceInvadersGame():
     def _create_game_over_ui(self):
         """ Create game over user interface elements """
 
-        # Game over display group and hide
+        # Game over display group
         self.game_over_group = Group()
-        self.main_group.append(self.game_over_group)
-        self.game_over_group.hidden = True
 
         # Create game over menu text
         self.game_over_text_group =Group()
@@ -281,10 +431,8 @@ class FaceInvadersGame():
     def _create_score_input_ui(self):
         """ Create score input user interface elements """
 
-        # Score entry display group and hide
+        # Score entry display group
         self.score_input_group = Group()
-        self.main_group.append(self.score_input_group)
-        self.score_input_group.hidden = True
 
         # Create score entry text elements
         self.score_input_group.append(bitmap_label.Label(
@@ -314,15 +462,15 @@ class FaceInvadersGame():
         self.initial_inputs = []
         self.initial_spacing = 22
         for i in range(self.num_initials):
-            initial_input = bitmap_label.Label(
+            initial_input = CachedLabel(bitmap_label.Label(
                 FONT,
                 text='_',
                 color=self.palette[0],
                 scale=2,
                 anchor_point=(0.5, 0),
                 anchored_position=(self.display_center_x - self.initial_spacing + i * self.initial_spacing, self.display_center_y-5)
-            )
-            self.score_input_group.append(initial_input)
+            ))
+            self.score_input_group.append(initial_input.label)
             self.initial_inputs.append(initial_input)
 
         # Create initials cursor group
@@ -350,10 +498,8 @@ class FaceInvadersGame():
     def _create_high_scores_ui(self):
         """ Create high score interface elements """
 
-        # High scores display group and hide
+        # High scores display group
         self.high_scores_group = Group()
-        self.main_group.append(self.high_scores_group)
-        self.high_scores_group.hidden = True
 
         # Create high scores title and text
         self.high_scores_group.append(bitmap_label.Label(
@@ -385,34 +531,32 @@ class FaceInvadersGame():
             ))
 
             # Score player initials
-            score_name = bitmap_label.Label(
+            score_name = CachedLabel(bitmap_label.Label(
                 FONT,
                 text="-",
                 color=self.palette[0],
                 anchor_point=(0.0, 0.0),
                 anchored_position=(self.display_center_x-25, 30 + i*13)
-            )
-            self.high_scores_group.append(score_name)
+            ))
+            self.high_scores_group.append(score_name.label)
             self.high_scores_names.append(score_name)
 
             # Score number
-            score_number = bitmap_label.Label(
+            score_number = DigitDisplay(
                 FONT,
-                text="-",
-                color=self.palette[0],
-                anchor_point=(1.0, 0.0),
-                anchored_position=(self.display_center_x+37, 30 + i*13)
+                C.SCORE_DIGITS,
+                self.palette[0],
+                right=self.display_center_x+37,
+                y=30 + i*13
             )
-            self.high_scores_group.append(score_number)
+            self.high_scores_group.append(score_number.tilegrid)
             self.high_scores_numbers.append(score_number)
 
     def _create_options_menu(self):
         """ Create game options interface elements """
 
-        # Options menu display group and hide
+        # Options menu display group
         self.options_menu_group = Group()
-        self.main_group.append(self.options_menu_group)
-        self.options_menu_group.hidden = True
 
         # Create options menu and title
         self.options_menu_group.append(Rectangle(
@@ -452,14 +596,14 @@ class FaceInvadersGame():
                 anchor_point=(0.0, 0.0),
                 anchored_position=(self.display_center_x-60, self.options_y_start+i*self.options_spacing)
             ))
-            self.option_values.append(bitmap_label.Label(
+            self.option_values.append(CachedLabel(bitmap_label.Label(
                 FONT,
                 text=str(option[1]),
                 color=self.palette[0],
                 anchor_point=(0.5, 0.0),
                 anchored_position=(self.display_center_x+35, self.options_y_start+i*self.options_spacing)
-            ))
-            self.options_menu_group.append(self.option_values[i])
+            )))
+            self.options_menu_group.append(self.option_values[i].label)
 
         # Create options cursor group
         self.options_cursor_group = Group(x=self.display_center_x+17)
@@ -486,10 +630,9 @@ class FaceInvadersGame():
     def _create_controls_menu(self):
         """ Create controls menu elements """
 
-        # Controls menu display group and hide
+        # Controls menu display group
         self.controls_menu_group = Group()
-        self.main_group.append(self.controls_menu_group)
-        self.controls_menu_group.hidden = True
+        self.controls_menu_composed = False
 
         # Create controls menu and title
         self.controls_menu_group.append(Rectangle(
@@ -517,8 +660,8 @@ class FaceInvadersGame():
         ))
 
         # Create controls menu text
-        controls = [('Fire','A'), ('Thrust', 'B [hold]'), ('Rotate', 'Left/Right')]
-        for i, control in enumerate(controls):
+        self.controls = [('Fire','A'), ('Thrust', 'B [hold]'), ('Rotate', 'Left/Right')]
+        for i, control in enumerate(self.controls):
             self.controls_menu_group.append(bitmap_label.Label(
                 FONT,
                 text=control[0]+':',
@@ -535,6 +678,98 @@ class FaceInvadersGame():
             ))
 
 
+    def _compose_start_menu(self):
+        '''
+        Replace the start menu logo and text layers with a single
+        pre-composed bitmap layer
+        '''
+
+        # Load logo into RAM so its pixels can be read
+        logo_bitmap, logo_pallete = imageload('face_invaders/img/logo.bmp')
+        logo_pallete.make_transparent(0)
+
+        # Calculate logo and text positions
+        text_width, text_height = text_size(FONT, self.start_menu_text)
+        logo_x = self.display_center_x - logo_bitmap.width//2
+        logo_y = self.display_center_y - logo_bitmap.height//2 - 2
+        text_x = self.display_center_x - text_width//2
+        text_y = self.display.height - 5 - text_height
+
+        # Draw logo and text onto a canvas covering both
+        x = min(logo_x, text_x)
+        width = max(logo_x + logo_bitmap.width, text_x + text_width) - x
+        height = text_y + text_height - logo_y
+        composer = Composer(x, logo_y, width, height)
+        composer.draw_bitmap(logo_bitmap, logo_pallete, logo_x, logo_y)
+        composer.draw_text(FONT, self.start_menu_text, text_x, text_y, composer.add_color(self.palette[0]))
+
+        # Replace start menu layers with the composed layer
+        while len(self.start_menu_group):
+            self.start_menu_group.pop()
+        self.start_menu_group.append(composer.tilegrid())
+        self.start_menu_composed = True
+
+    def benchmark_refresh(self, count=20):
+        '''
+        Print the mean time of full start menu refreshes with the background
+        read from flash and from RAM. Each refresh mirrors the background so
+        the whole display is redrawn.
+        '''
+
+        # Background layers read from flash and from RAM
+        flash_bitmap = OnDiskBitmap('face_invaders/img/background.bmp')
+        ram_bitmap, ram_pallete = imageload('face_invaders/img/background.bmp')
+        backgrounds = (
+            ('flash', TileGrid(flash_bitmap, pixel_shader=flash_bitmap.pixel_shader)),
+            ('RAM', TileGrid(ram_bitmap, pixel_shader=ram_pallete))
+        )
+
+        # Time refreshes with each background in place of the game's own
+        menu = 'composed' if self.start_menu_composed else 'layered'
+        background = self.background_group.pop(0)
+        for name, layer in backgrounds:
+            self.background_group.insert(0, layer)
+            total = 0
+            for _ in range(count):
+                layer.flip_x = not layer.flip_x
+                start_time = monotonic()
+                self.display.refresh()
+                total += monotonic() - start_time
+            self.background_group.pop(0)
+            print('refresh: {} start menu, background from {}: {:.1f} ms'.format(
+                menu, name, total * 1000 / count
+            ))
+        self.background_group.insert(0, background)
+        self.display.refresh()
+
+    def _compose_controls_menu(self):
+        '''
+        Replace the controls menu frame and text layers with a single
+        pre-composed bitmap layer
+        '''
+
+        # Canvas covering the menu frame
+        composer = Composer(10, 10, self.display.width-20, self.display.height-20, 3)
+        light = composer.add_color(self.palette[0])
+        dark = composer.add_color(self.palette[1])
+
+        # Draw menu frame
+        composer.fill_rect(10, 10, self.display.width-20, self.display.height-20, light)
+        composer.fill_rect(12, 12, self.display.width-24, self.display.height-24, dark)
+
+        # Draw menu title and controls text
+        title_width, _ = text_size(FONT, 'Controls')
+        composer.draw_text(FONT, 'Controls', self.display_center_x - title_width//2, 17, light)
+        for i, control in enumerate(self.controls):
+            composer.draw_text(FONT, control[0]+':', self.display_center_x-55, 40+i*15, light)
+            composer.draw_text(FONT, str(control[1]), self.display_center_x-2, 40+i*15, light)
+
+        # Replace controls menu layers with the composed layer
+        while len(self.controls_menu_group):
+            self.controls_menu_group.pop()
+        self.controls_menu_group.append(composer.tilegrid())
+        self.controls_menu_composed = True
+
     def _create_ship_object(self):
         """Create game ship object"""
 
@@ -546,18 +781,49 @@ class FaceInvadersGame():
                 tile_width=self.ships_tile_width,
                 tile_height=self.ships_tile_height
             ),
-            self.display,
-            self.display_center_x,
-            self.display_center_y,
+            self.world,
+            self.world_center_x,
+            self.world_center_y,
             v=0,
             angle=radians(0),
-            heading=radians(0)
+            heading=radians(0),
+            coarse_levels=build_coarse_levels(
+                ship_sprites.MASKS,
+                None,
+                ship_sprites.TILE_WIDTH,
+                C.COARSE_MASK_BLOCKS
+            )
         )
-        self.game_group.append(self.ship.tilegrid)
+        self.game_group.insert(0, self.ship.tilegrid)
 
         # Initially hide ship
         self.ship.hidden = True
 
+    def reset_ship(self):
+        '''
+        Reset the ship at the playfield center and display it, centering
+        the camera on it when the playfield scrolls
+        '''
+        self.ship.reset(x=self.world_center_x, y=self.world_center_y)
+
+        # The ship moved without a speed bound, so check all faces against it
+        for face in self.faces:
+            face.ship_check_time = 0
+
+        if self.camera is not None:
+            self.camera.follow(self.ship.x, self.ship.y)
+            self.ship.place(self.camera, cull=False)
+        self.ship.hidden = False
+
+    def add_object(self, entities, obj):
+        '''
+        Track and display a game object, positioning it in the camera view
+        when the playfield scrolls
+        '''
+        if self.camera is not None:
+            obj.place(self.camera)
+        entities.append(obj)
+
     def create_sub_faces(self, face):
         '''
         Create sub faces
@@ -565,54 +831,47 @@ class FaceInvadersGame():
         # Determine size of sub faces
         sub_face_size = face.size + 1
 
-        # Determine face sprites based on size
-        if sub_face_size == 2:
-            face_bitmap = self.faces_medium_bitmap
-            face_pallette = self.faces_medium_pallette
-            face_tile_width = self.faces_medium_tile_width
-            face_tile_height = self.faces_medium_tile_height
-        elif sub_face_size == 3:
-            face_bitmap = self.faces_small_bitmap
-            face_pallette = self.faces_small_pallette
-            face_tile_width = self.faces_small_tile_width
-            face_tile_height = self.faces_small_tile_height
+        # Determine face sprites based on size, keeping the same
+        # personalized face when the sheet has it
+        face_sheet = self.face_sheets[sub_face_size]
+        variant = face.variant % face_sheet.variant_count
 
         # Create two sub faces
+        rng = self.face_rng
         for i in range(2):
 
             # Define face tilegrid
-            sub_face_tilegrid = TileGrid(
-                face_bitmap,
-                pixel_shader=face_pallette,
-                tile_width=face_tile_width,
-                tile_height=face_tile_height,
-                default_tile=choice([0])
-            )
+            sub_face_tilegrid = face_sheet.tilegrid(variant)
 
             # Randomly flip tilegrid around x axis
-            sub_face_tilegrid.flip_x = choice([True, False])
+            sub_face_tilegrid.flip_x = rng.flip()
 
             # Define settings based on input face
             x = face.x
             y = face.y
             v = face.v * (1.1 + self.level * .05)
-            angle = face.angle + (radians(randrange(15,70) * (-1 if i == 0 else 1)))
+            angle = face.angle + ANGLES[rng.randrange(15,70)] * (-1 if i == 0 else 1)
 
             # Create face object and update
             sub_face = Face(
                 sub_face_tilegrid,
-                self.display,
+                self.world,
                 x=x,
                 y=y,
                 v=v,
                 angle=angle,
-                size=sub_face_size
+                size=sub_face_size,
+                variant=variant,
+                masks=face_sheet.masks,
+                flipped_masks=face_sheet.flipped_masks,
+                coarse_levels=face_sheet.coarse_levels,
+                frame_count=face_sheet.frame_count,
+                frame_phase=rng.randrange(face_sheet.frame_count)
             )
             sub_face.update()
 
             # Track and display face
-            self.faces.append(sub_face)
-            self.game_group.append(sub_face.tilegrid)
+            self.add_object(self.faces, sub_face)
 
     def create_hit_particles(self, obj):
         '''
@@ -621,22 +880,28 @@ class FaceInvadersGame():
 
         # Flag if object is ship or face
         is_ship = isinstance(obj, Ship)
+        rng = self.particle_rng
 
-        # Create 5 particles
-        for i in range(5):
+        # Reduce effects when the frame governor is degrading them
+        governor = self.governor
+        particle_count = governor.particle_count(5) if governor else 5
+        debris = governor.debris() if governor else True
+
+        # Create particles
+        for i in range(particle_count):
 
             # Define particle settings base on object
-            x = obj.x + randrange(-obj.display_width//3, obj.display_width//3)
-            y = obj.y + randrange(-obj.display_height//3, obj.display_height//3)
-            v = randrange(10,15)
-            max_age = randrange(2,4) / 2.
-            angle = radians(randrange(360))
+            x = obj.x + rng.randrange(-obj.display_width//3, obj.display_width//3)
+            y = obj.y + rng.randrange(-obj.display_height//3, obj.display_height//3)
+            v = rng.randrange(10,15)
+            max_age = rng.randrange(2,4) / 2.
+            angle = rng.angle()
             if is_ship:
                 palette = self.palette
                 color_index = 0
             else:
                 palette = obj.tilegrid.pixel_shader
-                color_index = randrange(len(palette))
+                color_index = rng.randrange(len(palette))
 
             # Create particle object and display
             particle = RectParticle(
@@ -646,105 +911,80 @@ class FaceInvadersGame():
                 height=1,
                 v=v,
                 angle=angle,
-                display=self.display,
+                world=self.world,
                 palette=palette,
                 max_age=max_age,
                 color_index=color_index
             )
-            self.particles.append(particle)
-            self.game_group.append(particle.shape)
+            self.add_object(self.particles, particle)
 
         # Create line particles
-        if is_ship:
+        if is_ship and debris:
             for i in range(3):
 
                 # Define particle settings base on object
                 length = 6
-                rot_angle = radians(randrange(360))
-                x0 = obj.x + randrange(-obj.display_width//10,obj.display_width//10)
-                y0 = obj.y + randrange(-obj.display_height//10,obj.display_height//10)
+                rot_angle = rng.angle()
+                x0 = obj.x + rng.randrange(-obj.display_width//10,obj.display_width//10)
+                y0 = obj.y + rng.randrange(-obj.display_height//10,obj.display_height//10)
                 x1 = x0 + length * cos(rot_angle)
                 y1 = y0 + length * sin(rot_angle)
-                v = randrange(10,15)
-                angle = radians(randrange(360))
-                max_age = randrange(2,4) / 2.
+                v = rng.randrange(10,15)
+                angle = rng.angle()
+                max_age = rng.randrange(2,4) / 2.
 
                 # Create particle object and track/display
-                particle = LineParticle(x0=x0, y0=y0, x1=x1, y1=y1, v=v, angle=angle, display=self.display, palette=self.palette, max_age=max_age)
-                self.particles.append(particle)
-                self.game_group.append(particle.shape)
+                particle = LineParticle(x0=x0, y0=y0, x1=x1, y1=y1, v=v, angle=angle, world=self.world, palette=self.palette, max_age=max_age)
+                self.add_object(self.particles, particle)
 
-    def create_face_wave(self, count):
+    def create_face_wave(self, level, count=None, next_level=None):
         '''
-        Create wave of faces
+        Create wave of faces from the planned spawn table for ``level``,
+        then start planning the wave for ``next_level``, by default the
+        following level
         '''
 
-        # Loop through face count
-        for i in range(count):
+        # Large face sprites
+        face_sheet = self.face_sheets[1]
 
-            # Define astroid tilegrid using large face sprites
-            face_tilegrid = TileGrid(
-                self.faces_large_bitmap,
-                pixel_shader=self.faces_large_pallette,
-                tile_width=self.faces_large_tile_width,
-                tile_height=self.faces_large_tile_height,
-                default_tile=choice([0]),
-            )
+        # Loop through planned face spawns
+        for x, y, v, angle, flip_x, variant in self.wave_planner.take(level, count):
 
-            # Randomly flip tilegrid around x axis
-            face_tilegrid.flip_x = choice([True, False])
-
-            # Calculate random start position along the display border
-            border_x = face_tilegrid.width * face_tilegrid.tile_width // 2
-            border_y = face_tilegrid.height * face_tilegrid.tile_height // 2
-            x_min = -border_x
-            x_max = self.display.width + border_x
-            y_min = -border_y
-            y_max = self.display.height + border_y
-            start_position = choice([
-                (randrange(x_min,x_max), y_min),
-                (randrange(x_min,x_max), y_max),
-                (x_min, randrange(y_min,y_max)),
-                (x_max, randrange(y_min,y_max))
-            ])
-
-            # Randomize face velocity and angle
-            v = randrange(10,30)
-            angle = radians(randrange(360))
+            # Define face tilegrid using the planned personalized large face
+            face_tilegrid = face_sheet.tilegrid(variant)
+            face_tilegrid.flip_x = flip_x
 
             # Create face object
             face = Face(
                 face_tilegrid,
-                self.display,
-                x=start_position[0],
-                y=start_position[1],
+                self.world,
+                x=x,
+                y=y,
                 v=v,
                 angle=angle,
-                size=1
+                size=1,
+                variant=variant,
+                masks=face_sheet.masks,
+                flipped_masks=face_sheet.flipped_masks,
+                coarse_levels=face_sheet.coarse_levels,
+                frame_count=face_sheet.frame_count,
+                frame_phase=self.face_rng.randrange(face_sheet.frame_count)
             )
 
-            # Track and display astreroid
-            self.faces.append(face)
-            self.game_group.append(face.tilegrid)
+            # Track and display face
+            self.add_object(self.faces, face)
+
+        # Plan the next wave during the following frames
+        self.wave_planner.plan(level + 1 if next_level is None else next_level)
 
     def clear_game_elements(self):
         '''
         Clear face/bullet/particle elements from tracking and display
         '''
 
-        # Clear faces from display and tracking
-        for face in self.faces:
-            self.game_group.remove(face.tilegrid)
+        # Clear faces, particles and bullets from display and tracking
         self.faces.clear()
-
-        # Clear particles from display and tracking
-        for particle in self.particles:
-            self.game_group.remove(particle.shape)
         self.particles.clear()
-
-        # Clear bullets from display and tracking
-        for bullet in self.bullets:
-            self.game_group.remove(bullet.shape)
         self.bullets.clear()
 
     def start_menu(self):
@@ -758,15 +998,16 @@ class FaceInvadersGame():
         # Clear face/particles/bullets
         self.clear_game_elements()
 
-        # Create background faces
-        self.create_face_wave(3)
+        # Create background faces, then plan the first wave of a new game
+        # while the menu shows
+        self.create_face_wave(1, count=3 * self.wave_scale, next_level=1)
 
-        # Show/hide required display groups
-        self.ui_group.hidden = True
-        self.game_over_group.hidden = True
-        self.score_input_group.hidden = True
-        self.high_scores_group.hidden = True
-        self.start_menu_group.hidden = False
+        # Bake static start menu layers on first display
+        if C.PRECOMPOSE_MENUS and not self.start_menu_composed:
+            self._compose_start_menu()
+
+        # Show start menu display groups
+        self.scene_manager.show(self.current_state)
 
     def options_menu(self):
         '''
@@ -777,24 +1018,44 @@ class FaceInvadersGame():
         if self.current_state != C.GameState.OPTIONS_MENU:
             self.prev_state = self.current_state
             self.current_state = C.GameState.OPTIONS_MENU
-            self.options_menu_group.hidden = False
+            self.scene_manager.show(self.current_state, base_state=self.prev_state)
+
+            # Snapshot the paused game
+            if self.prev_state == C.GameState.ACTIVE_GAME:
+                self.request_snapshot()
         else:
             self.current_state = self.prev_state
-            self.options_menu_group.hidden = True
+            self.scene_manager.show(self.current_state)
+
+            # Drop the paused game's snapshot once play continues
+            if self.current_state == C.GameState.ACTIVE_GAME:
+                self.resume_play()
 
     def controls_menu(self):
         '''
         Show controls menu graphics.
         '''
 
+        # Bake static controls menu layers on first display
+        if C.PRECOMPOSE_MENUS and not self.controls_menu_composed:
+            self._compose_controls_menu()
+
         # Update current game state and show/hide controls menu
         if self.current_state != C.GameState.CONTROLS_MENU:
             self.prev_state = self.current_state
             self.current_state = C.GameState.CONTROLS_MENU
-            self.controls_menu_group.hidden = False
+            self.scene_manager.show(self.current_state, base_state=self.prev_state)
+
+            # Snapshot the paused game
+            if self.prev_state == C.GameState.ACTIVE_GAME:
+                self.request_snapshot()
         else:
             self.current_state = self.prev_state
-            self.controls_menu_group.hidden = True
+            self.scene_manager.show(self.current_state)
+
+            # Drop the paused game's snapshot once play continues
+            if self.current_state == C.GameState.ACTIVE_GAME:
+                self.resume_play()
 
     def new_game(self):
         '''
@@ -804,16 +1065,11 @@ class FaceInvadersGame():
         # Update current game state
         self.current_state = C.GameState.ACTIVE_GAME
 
-        # Show/hide required display groups
-        self.start_menu_group.hidden = True
-        self.ui_group.hidden = False
-        self.game_over_group.hidden = True
-        self.high_scores_group.hidden = True
-        self.score_input_group.hidden = True
+        # Show game display groups
+        self.scene_manager.show(self.current_state)
 
         # Reset ship position
-        self.ship.reset(x=self.display_center_x, y=self.display_center_y)
-        self.ship.hidden = False
+        self.reset_ship()
 
         # Reset game over continue text
         self.game_over_text_group.hidden = True
@@ -823,6 +1079,10 @@ class FaceInvadersGame():
         self.lives = C.MAX_LIVES
         self.score = 0
 
+        # Replace any snapshot of a previous game
+        self.discard_snapshot()
+        self.low_battery_saved = False
+
         # Clear face/particles/bullets
         self.clear_game_elements()
 
@@ -834,7 +1094,7 @@ class FaceInvadersGame():
         self.current_initial = 0
         self.update_initials_cursor()
 
-        # Create faces
+        # Create faces from the wave planned in the start menu
         self.create_face_wave(self.level)
 
     def score_input_menu(self):
@@ -845,12 +1105,8 @@ class FaceInvadersGame():
         # Update current game state
         self.current_state = C.GameState.SCORE_INPUT
 
-        # Show/hide required display groups
-        self.start_menu_group.hidden = True
-        self.ui_group.hidden = True
-        self.game_over_group.hidden = True
-        self.high_scores_group.hidden = True
-        self.score_input_group.hidden = False
+        # Show score input display groups
+        self.scene_manager.show(self.current_state)
 
     def high_scores_menu(self):
         '''
@@ -863,14 +1119,10 @@ class FaceInvadersGame():
         # Update display elements with scores
         for i, high_score in enumerate(self.high_scores):
             self.high_scores_names[i].text = high_score[0]
-            self.high_scores_numbers[i].text = str(high_score[1])
+            self.high_scores_numbers[i].show(high_score[1])
 
-        # Show/hide required display groups
-        self.start_menu_group.hidden = True
-        self.ui_group.hidden = True
-        self.game_over_group.hidden = True
-        self.score_input_group.hidden = True
-        self.high_scores_group.hidden = False
+        # Show high scores display groups
+        self.scene_manager.show(self.current_state)
 
     def game_over(self):
         '''
@@ -880,12 +1132,11 @@ class FaceInvadersGame():
         # Update current game state
         self.current_state = C.GameState.GAME_OVER
 
-        # Show/hide required display groups
-        self.start_menu_group.hidden = True
-        self.ui_group.hidden = True
-        self.score_input_group.hidden = True
-        self.high_scores_group.hidden = True
-        self.game_over_group.hidden = False
+        # The snapshot of the finished game can no longer be resumed
+        self.discard_snapshot()
+
+        # Show game over display groups
+        self.scene_manager.show(self.current_state)
 
 
     def update_initials_cursor(self):
@@ -967,7 +1218,8 @@ class FaceInvadersGame():
             # If at last position, update scores and proceed to high scores menu
             else:
                 initials = ''.join([input.text for input in self.initial_inputs])
-                high_scores.update_high_scores(self.high_scores, initials, self.score)
+                high_scores.update_high_scores(self.high_scores, initials, self.score, save=False)
+                self.high_scores_unsaved = True
                 self.high_scores_menu()
 
 
@@ -982,17 +1234,16 @@ class FaceInvadersGame():
         v = self.ship.vmax + 20
 
         # Create bullet object and display
-        bullet = Bullet(x=x, y=y, radius=1, v=v, angle=self.ship.heading, display=self.display, palette=self.palette)
+        bullet = Bullet(x=x, y=y, radius=1, v=v, angle=self.ship.heading, world=self.world, palette=self.palette)
 
         # Add to tracking list and display
-        self.bullets.append(bullet)
-        self.game_group.append(bullet.shape)
+        self.add_object(self.bullets, bullet)
 
     def display_score(self):
         '''
         Display updated score..
         '''
-        self.score_text.text = str(self.score)
+        self.score_text.show(self.score)
 
     def display_lives(self):
         '''
@@ -1025,7 +1276,7 @@ class FaceInvadersGame():
 
             # Begin new game and play continue sound
             self.new_game()
-            self.audio_manager.play_sound('new_ship')
+            self.audio_manager.queue_sound('new_ship')
 
         # Game in active play state and button pressed
         elif self.current_state == C.GameState.ACTIVE_GAME and pressed and self.ship.hidden == False:
@@ -1035,7 +1286,7 @@ class FaceInvadersGame():
             if self.create_bullet_time == None or now - self.create_bullet_time > self.create_bullet_seconds:
                 self.create_bullet_time = now
                 self.create_bullet()
-                self.audio_manager.play_sound('bullet')
+                self.audio_manager.queue_sound('bullet')
 
         # Game in game over state and button pressed
         elif self.current_state == C.GameState.GAME_OVER and pressed:
@@ -1049,7 +1300,7 @@ class FaceInvadersGame():
                     self.score_input_menu()
                 else:
                     self.high_scores_menu()
-                self.audio_manager.play_sound('continue')
+                self.audio_manager.queue_sound('continue')
 
         # Game in score input state and button pressed
         elif self.current_state == C.GameState.SCORE_INPUT and pressed:
@@ -1057,14 +1308,14 @@ class FaceInvadersGame():
             # Confirm selected character and proceed to next initial or
             # high scores menu
             self.confirm_char()
-            self.audio_manager.play_sound('continue')
+            self.audio_manager.queue_sound('continue')
 
         # Game in high score state and button pressed
         elif self.current_state == C.GameState.HIGH_SCORES and pressed:
 
             # Start new game and play continue sound
             self.start_menu()
-            self.audio_manager.play_sound('continue')
+            self.audio_manager.queue_sound('continue')
 
     def b_button_event(self, pressed=True):
         '''
@@ -1078,7 +1329,7 @@ class FaceInvadersGame():
             # Enable ship thrusting and sound when button pressed
             if pressed:
                 self.ship.thrusting = 1
-                self.audio_manager.play_sound('ship_thrust', loop=True)
+                self.audio_manager.queue_sound('ship_thrust', loop=True)
 
             # Disable thrusting and sound when button released
             else:
@@ -1111,7 +1362,7 @@ class FaceInvadersGame():
 
             # Show/hide options menu and play continue sound
             self.options_menu()
-            self.audio_manager.play_sound('continue')
+            self.audio_manager.queue_sound('continue')
 
     def start_button_event(self, pressed=True):
         '''
@@ -1131,7 +1382,7 @@ class FaceInvadersGame():
 
             # Show/hide options menu and play continue sound
             self.controls_menu()
-            self.audio_manager.play_sound('continue')
+            self.audio_manager.queue_sound('continue')
 
     def left_button_event(self, pressed=True):
         '''
@@ -1150,7 +1401,7 @@ class FaceInvadersGame():
 
             # Update selected option value and play click sound
             self.update_option(decrease=True)
-            self.audio_manager.play_sound('click')
+            self.audio_manager.queue_sound('click')
 
     def right_button_event(self, pressed=True):
         '''
@@ -1169,7 +1420,7 @@ class FaceInvadersGame():
 
             # Update selected option value and play click sound
             self.update_option()
-            self.audio_manager.play_sound('click')
+            self.audio_manager.queue_sound('click')
 
     def up_button_event(self, pressed=True):
         '''
@@ -1189,7 +1440,7 @@ class FaceInvadersGame():
 
             # Update initial input with next character
             self.update_char()
-            self.audio_manager.play_sound('click')
+            self.audio_manager.queue_sound('click')
 
     def down_button_event(self, pressed=True):
         '''
@@ -1209,95 +1460,468 @@ class FaceInvadersGame():
 
             # Update initial input with previous character
             self.update_char(backwards=True)
-            self.audio_manager.play_sound('click')
+            self.audio_manager.queue_sound('click')
 
 
-    def tick(self):
+    def process_ship_hit(self):
         '''
-        Game tick that advances elements
+        Destroy the ship after a collision with a face
         '''
 
-        # Calculate delta time between game ticks
-        current_tick_time = monotonic()
-        delta_time = current_tick_time - self.last_tick_time if self.last_tick_time else 0.02
-        self.last_tick_time = current_tick_time
+        # Play/stop sounds
+        self.audio_manager.stop_sound('ship_thrust')
+        self.audio_manager.queue_sound('ship_explosion')
 
-        # Garbage collect memory
-        gc_collect()
-        #print( mem_free() )
+        # Remove ship from display
+        self.ship.hidden = True
 
-        # If options/controls menu is not open, process game objects
-        if self.current_state not in [C.GameState.OPTIONS_MENU, C.GameState.CONTROLS_MENU]:
+        # Create debris particles
+        self.create_hit_particles(self.ship)
 
-            # Update ship position and rotation
-            self.ship.update(delta_time)
+        # Update ship reset time
+        self.ship_hit_time = monotonic()
 
-            # Update faces position
-            for face in self.faces:
-                face.update(delta_time)
+        # Update player lives and display
+        self.lives -= 1
+        self.display_lives()
 
-            # Update bullet positions and age
-            for bullet in self.bullets:
-                bullet.update(delta_time)
+    def process_face_hit(self, face):
+        '''
+        Score and break apart a face hit by the ship or a bullet
+        '''
 
-            # Update update positions and age
-            for paritcle in self.particles:
-                paritcle.update(delta_time)
+        # Play explosion sound based on size
+        if self.ship.is_hit == False:
+            if face.size == 1:
+                self.audio_manager.queue_sound('explosion_large')
+            elif face.size == 2:
+                self.audio_manager.queue_sound('explosion_medium')
+            elif face.size == 3:
+                self.audio_manager.queue_sound('explosion_small')
 
-            # Process active gameplay state
-            if self.current_state == C.GameState.ACTIVE_GAME:
+        # Update score, displayed once after all hits are processed
+        self.score += C.FACE_POINTS[face.size]
 
-                # Check for collisions between faces and ship/bullets
-                for face in self.faces:
+        # Create debris particles
+        self.create_hit_particles(face)
 
-                    # Detect ship hit
-                    if self.ship.is_hit == False and face.detect_hit(self.ship):
+        # Create sub faces
+        if face.size < 3:
+            self.create_sub_faces(face)
 
-                            # Play/stop sounds
-                            self.audio_manager.stop_sound('ship_thrust')
-                            self.audio_manager.play_sound('ship_explosion')
+    def battery_volts(self):
+        """Return the battery voltage, read through the PyBadge's halving divider."""
+        return self.battery.value / 65535 * self.battery.reference_voltage * 2
 
-                            # Remove ship from display
-                            self.ship.hidden = True
+    def request_snapshot(self):
+        '''
+        Pack a snapshot of the game in progress, written later by
+        ``save_snapshot`` so the write does not delay key handling
+        '''
+        if not C.GAME_SNAPSHOTS:
+            return
+        ship = self.ship
+        self.snapshot_data = snapshot.pack_snapshot(
+            self.snapshot_layout,
+            self.score,
+            self.lives,
+            self.level,
+            (ship.fx, ship.fy, ship.vx, ship.vy, ship.rx, ship.ry, ship.heading_fx, ship.heading_rem,
+             int(ship.hidden)),
+            ((face.fx, face.fy, face.vx, face.vy, face.rx, face.ry, face.v, face.angle, face.size,
+              face.variant, int(face.tilegrid.flip_x), face.frame_phase) for face in self.faces),
+            ((bullet.fx, bullet.fy, bullet.vx, bullet.vy, bullet.rx, bullet.ry, bullet.age)
+             for bullet in self.bullets)
+        )
 
-                            # Create debris particles
-                            self.create_hit_particles(self.ship)
+    def save_snapshot(self):
+        """Write a requested snapshot, recording its size and write time."""
+        if self.snapshot_data is None:
+            return
+        start_time = monotonic()
+        snapshot.save_snapshot(C.SNAPSHOT_FNAME, self.snapshot_data)
+        self.snapshot_saved = True
+        if self.frame_stats:
+            self.frame_stats.add_time('snapshot_write', monotonic() - start_time)
+            self.frame_stats.count('snapshot_bytes', len(self.snapshot_data))
+        self.snapshot_data = None
+
+    def resume_play(self):
+        '''
+        Discard the snapshot of a game leaving a menu, which no longer
+        matches the game in progress, and rearm the low battery snapshot
+        '''
+        self.discard_snapshot()
+        self.low_battery_saved = False
 
-                            # Update ship reset time
-                            self.ship_hit_time = monotonic()
+    def discard_snapshot(self):
+        """Delete the saved snapshot and any snapshot waiting to be written."""
+        self.snapshot_data = None
+        if self.snapshot_saved:
+            snapshot.remove_snapshot(C.SNAPSHOT_FNAME)
+            self.snapshot_saved = False
 
-                            # Update player lives and display
-                            self.lives -= 1
-                            self.display_lives()
+    def snapshot_layout_version(self):
+        '''
+        Return the layout version of snapshots saved with the loaded sprite
+        sheets and playfield, so regenerated assets reject old snapshots
+        '''
+        values = [
+            self.world.width,
+            self.world.height,
+            int(self.world.padded),
+            ship_sprites.TILE_WIDTH,
+            ship_sprites.TILE_HEIGHT,
+            ship_sprites.TILE_COUNT,
+            ship_sprites.HEADING_STEPS
+        ]
+        for size in sorted(self.face_sheets):
+            face_sheet = self.face_sheets[size]
+            values.extend((size, face_sheet.tile_width, face_sheet.tile_height,
+                           face_sheet.frame_count, face_sheet.variant_count))
+        return snapshot.layout_version(values)
+
+    def snapshot_valid(self, saved):
+        '''
+        Return whether unpacked snapshot values are in range for the loaded
+        sprites and tables, so a corrupt snapshot cannot fail the restore
+        '''
+        score, lives, level, ship_values, face_values, bullet_values = saved
+        if lives > C.MAX_LIVES or level < 1:
+            return False
+        fx, fy, vx, vy, rx, ry, heading_fx, heading_rem, hidden = ship_values
+        if rx >= TIME_ONE or ry >= TIME_ONE or heading_rem >= TIME_ONE or heading_fx >= self.ship.heading_units:
+            return False
+        for fx, fy, vx, vy, rx, ry, v, angle, size, variant, flip_x, frame_phase in face_values:
+            face_sheet = self.face_sheets.get(size)
+            if face_sheet is None or variant >= face_sheet.variant_count or rx >= TIME_ONE or ry >= TIME_ONE \
+               or not (isfinite(v) and isfinite(angle)):
+                return False
+        for fx, fy, vx, vy, rx, ry, age in bullet_values:
+            if rx >= TIME_ONE or ry >= TIME_ONE:
+                return False
+        return True
+
+    def restore_snapshot(self):
+        '''
+        Resume the game saved in the snapshot, paused in the options menu.
+        Returns the snapshot size in bytes, or None if there is none. A
+        snapshot that cannot be restored is deleted.
+        '''
+        data = snapshot.read_snapshot(C.SNAPSHOT_FNAME)
+        if data is None:
+            return None
+        saved = snapshot.unpack_snapshot(data, self.snapshot_layout)
+        if saved is None or not self.snapshot_valid(saved):
+            self.discard_snapshot()
+            return None
+        score, lives, level, ship_values, face_values, bullet_values = saved
+
+        # Show the game with the saved settings
+        self.current_state = C.GameState.ACTIVE_GAME
+        self.scene_manager.show(self.current_state)
+        self.game_over_text_group.hidden = True
+        self.level = level
+        self.lives = lives
+        self.score = score
+        self.display_score()
+        self.display_lives()
+        self.current_initial = 0
+        self.update_initials_cursor()
+        self.clear_game_elements()
 
-                    # Detect bullet hit
-                    if not face.is_hit:
-                        for bullet in [b for b in self.bullets if b.is_hit == False]:
+        # Restore the ship, waiting to reset if it was destroyed
+        fx, fy, vx, vy, rx, ry, heading_fx, heading_rem, hidden = ship_values
+        ship = self.ship
+        ship.reset(x=fx / ONE, y=fy / ONE)
+        ship.vx = vx
+        ship.vy = vy
+        ship.heading_fx = heading_fx
+        ship.update()
+        ship.rx = rx
+        ship.ry = ry
+        ship.heading_rem = heading_rem
+        if self.camera is not None:
+            self.camera.follow(ship.x, ship.y)
+            ship.place(self.camera, cull=False)
+        ship.hidden = bool(hidden)
+        if hidden:
+            ship.is_hit = True
+            self.ship_hit_time = monotonic()
+
+        # Restore faces with their sprites, keeping the sub face speed and
+        # angle alongside the exact saved velocity
+        for fx, fy, vx, vy, rx, ry, v, angle, size, variant, flip_x, frame_phase in face_values:
+            face_sheet = self.face_sheets[size]
+            face_tilegrid = face_sheet.tilegrid(variant)
+            face_tilegrid.flip_x = bool(flip_x)
+            face = Face(
+                face_tilegrid,
+                self.world,
+                x=fx / ONE,
+                y=fy / ONE,
+                v=v,
+                angle=angle,
+                size=size,
+                variant=variant,
+                masks=face_sheet.masks,
+                flipped_masks=face_sheet.flipped_masks,
+                coarse_levels=face_sheet.coarse_levels,
+                frame_count=face_sheet.frame_count,
+                frame_phase=frame_phase
+            )
+            face.set_velocity(vx, vy)
+            face.rx = rx
+            face.ry = ry
+            self.add_object(self.faces, face)
+
+        # Restore bullets with their velocity and age
+        for fx, fy, vx, vy, rx, ry, age in bullet_values:
+            bullet = Bullet(x=fx / ONE, y=fy / ONE, radius=1, v=0, angle=0, world=self.world, palette=self.palette)
+            bullet.set_velocity(vx, vy)
+            bullet.rx = rx
+            bullet.ry = ry
+            bullet.age = age
+            self.add_object(self.bullets, bullet)
+
+        # Plan the next wave and pause in the options menu, which would
+        # otherwise snapshot the game again
+        self.wave_planner.plan(level + 1)
+        self.options_menu()
+        self.snapshot_data = None
+        return len(data)
+
+    def key_event(self, key_number, pressed=True):
+        '''
+        Keypad event function invoked with the key number of a hardware
+        button press or release
+        '''
+        self.key_handlers[key_number](pressed=pressed)
+
+    def save_high_scores(self):
+        '''
+        Write high scores changed since the last save, kept out of key
+        handlers so the write does not delay the frame showing the input
+        '''
+        if self.high_scores_unsaved:
+            high_scores.save_high_scores(self.high_scores)
+            self.high_scores_unsaved = False
+
+    def input_signature(self):
+        '''
+        Return the game state values changed by button handlers, used to
+        detect which key events had a visible effect
+        '''
+        return (
+            self.current_state,
+            self.ship.turning,
+            self.ship.thrusting,
+            self.create_bullet_time
+        )
+
+    def frame_seconds(self):
+        '''
+        Return the minimum seconds between frames in the current state: 0
+        for full rate during play and the game over delay, or None for
+        static menus that only change on input
+        '''
+        state = self.current_state
+        if not C.IDLE_THROTTLE or state == C.GameState.ACTIVE_GAME:
+            return 0
+        if state == C.GameState.GAME_OVER and self.game_over_text_group.hidden:
+            return 0
+        if state == C.GameState.OPTIONS_MENU or state == C.GameState.CONTROLS_MENU:
+            return None
+        return C.IDLE_FRAME_SECONDS
+
+    def skip_elapsed(self):
+        '''
+        Discard the time elapsed since the last tick, so objects do not jump
+        after waiting on input
+        '''
+        self.last_tick_time = None
+
+    def tick(self):
+        '''
+        Game tick that advances elements
+        '''
+
+        # Count processed ticks
+        self.tick_count += 1
+
+        # Calculate delta time between game ticks
+        current_tick_time = monotonic()
+        delta_time = current_tick_time - self.last_tick_time if self.last_tick_time else 0.02
+        self.last_tick_time = current_tick_time
+
+        # Integer time units used by the fixed-point movement
+        dt = self.tick_clock.units(delta_time)
+
+        # Garbage collect memory
+        gc_collect()
+        #print( mem_free() )
+
+        # If options/controls menu is not open, process game objects
+        if self.current_state not in [C.GameState.OPTIONS_MENU, C.GameState.CONTROLS_MENU]:
+
+            # Cache values used by the entity passes
+            active_game = self.current_state == C.GameState.ACTIVE_GAME
+            ship = self.ship
+            camera = self.camera
+
+            # Update ship position and rotation during play, centering the
+            # camera on it
+            if active_game:
+                ship.update(dt)
+                if camera is not None:
+                    camera.follow(ship.x, ship.y)
+                    ship.place(camera, cull=False)
+
+            # Update bullet positions and age, removing expired bullets. Lists
+            # are walked backwards as removal swaps the last object into the
+            # freed slot. With frame stats on, each pass is timed.
+            frame_stats = self.frame_stats
+            if frame_stats:
+                pass_start_time = monotonic()
+            bullets = self.bullets
+            for i in range(len(bullets) - 1, -1, -1):
+                bullet = bullets[i]
+                bullet.update(dt)
+                if bullet.check_expired():
+                    bullets.remove(bullet)
+                elif camera is not None:
+                    bullet.place(camera)
+            if frame_stats:
+                frame_stats.add_time('bullet_pass', monotonic() - pass_start_time)
+
+            # Update particle positions and age, removing expired particles.
+            # Particles near the end of their life update at half rate,
+            # carrying the skipped time into their next update. The governor
+            # brings the half rate forward while frames run over budget.
+            particles = self.particles
+            lod_particle_age = self.lod_particle_age
+            if self.governor is not None:
+                lod_particle_age = self.governor.particle_age(lod_particle_age)
+            lod_particle_age = int(lod_particle_age * 256)
+            particle_skips = 0
+            if frame_stats:
+                pass_start_time = monotonic()
+            for i in range(len(particles) - 1, -1, -1):
+                particle = particles[i]
+                if not particle.deferred_time and (particle.age << 8) >= particle.lifetime * lod_particle_age:
+                    particle.deferred_time = dt
+                    particle_skips += 1
+                    continue
+                particle.update(dt + particle.deferred_time)
+                particle.deferred_time = 0
+                if particle.check_expired():
+                    particles.remove(particle)
+                elif camera is not None:
+                    particle.place(camera)
+            if frame_stats:
+                frame_stats.add_time('particle_pass', monotonic() - pass_start_time)
+
+            # Track score to coalesce score display updates
+            tick_score = self.score
+
+            # Ship bounds for the collision broad phase
+            ship_xmin, ship_xmax, ship_ymin, ship_ymax = ship.get_bounds()
+            narrow_checks = 0
+
+            # Collision pair schedule for this tick
+            scheduler = self.pair_scheduler
+            if scheduler is not None:
+                scheduler.advance(dt)
+                now = scheduler.time
+
+            # Update face positions and, during active gameplay, check for
+            # collisions with the ship and bullets, removing hit faces. Faces
+            # outside the camera view are hidden, and faces beyond the
+            # collision range of the ship are not checked
+            faces = self.faces
+            if frame_stats:
+                pass_start_time = monotonic()
+            for i in range(len(faces) - 1, -1, -1):
+                face = faces[i]
+                face.update(dt)
+                if camera is not None:
+                    face.place(camera)
+                    if active_game and self.world.distance_squared(face.x, face.y, ship.x, ship.y) > self.collision_range_squared:
+                        continue
+                if not active_game:
+                    continue
+
+                # Face bounds; only objects inside them are passed to the
+                # narrow phase, saving the call for the rest
+                tilegrid = face.tilegrid
+                xmin = tilegrid.x
+                xmax = tilegrid.x + face.display_width
+                ymin = tilegrid.y
+                ymax = tilegrid.y + face.display_height
+
+                # Detect ship hit, unless the pair is scheduled for a later check
+                if ship.is_hit == False:
+                    if scheduler is not None:
+                        face.ship_check_time = scheduler.due(face.ship_check_time, face, ship)
+                    if (scheduler is None or face.ship_check_time <= now) and \
+                       ship_xmin < xmax and ship_xmax > xmin and ship_ymin < ymax and ship_ymax > ymin:
+                        narrow_checks += 1
+                        if face.detect_hit(ship):
+                            self.process_ship_hit()
+
+                # Detect bullet hit, removing the hit bullet
+                if not face.is_hit:
+                    for bullet in bullets:
+                        if scheduler is not None:
+                            next_time = scheduler.due(bullet.face_checks.get(face.serial, 0), face, bullet)
+                            if next_time > now:
+                                bullet.face_checks[face.serial] = next_time
+                                continue
+                        shape = bullet.shape
+                        if xmin <= shape.x <= xmax and ymin <= shape.y <= ymax:
+                            narrow_checks += 1
                             if face.detect_hit(bullet):
+                                bullets.remove(bullet)
                                 break
 
-                    # Process face hit
-                    if face.is_hit:
+                # Process and remove hit face
+                if face.is_hit:
+                    self.process_face_hit(face)
+                    faces.remove(face)
+            if frame_stats:
+                frame_stats.add_time('face_pass', monotonic() - pass_start_time)
+
+            # Advance face animation frames
+            self.animation_scheduler.advance(delta_time, faces)
+
+            # Record level of detail savings
+            if self.frame_stats:
+                self.frame_stats.count('particle_skips', particle_skips)
+                self.frame_stats.count('narrow_checks', narrow_checks)
+                if scheduler is not None:
+                    self.frame_stats.count('pair_checks', scheduler.checks)
+                    self.frame_stats.count('pair_skips', scheduler.skips)
+                for name, counts in Face.level_counts.items():
+                    self.frame_stats.count_rate('narrow_' + name, counts[1], counts[0])
+                    counts[0] = 0
+                    counts[1] = 0
+            if scheduler is not None:
+                scheduler.checks = 0
+                scheduler.skips = 0
 
-                        # Play explosion sound based on size
-                        if self.ship.is_hit == False:
-                            if face.size == 1:
-                                self.audio_manager.play_sound('explosion_large')
-                            elif face.size == 2:
-                                self.audio_manager.play_sound('explosion_medium')
-                            elif face.size == 3:
-                                self.audio_manager.play_sound('explosion_small')
-
-                        # Update score
-                        self.score += C.FACE_POINTS[face.size]
-                        self.display_score()
+            # Process active gameplay state
+            if active_game:
 
-                        # Create debris particles
-                        self.create_hit_particles(face)
+                # Snapshot the game once when the battery runs low
+                if self.battery is not None and current_tick_time - self.battery_check_time > C.BATTERY_CHECK_SECONDS:
+                    self.battery_check_time = current_tick_time
+                    if not self.low_battery_saved and self.battery_volts() < C.LOW_BATTERY_VOLTS:
+                        self.low_battery_saved = True
+                        self.request_snapshot()
 
-                        # Create sub faces
-                        if face.size < 3:
-                            self.create_sub_faces(face)
+                # Display score once if any faces were hit this tick
+                if self.score != tick_score:
+                    self.display_score()
 
                 # Process hit ship
                 if self.ship.is_hit:
@@ -1312,16 +1936,15 @@ class FaceInvadersGame():
                             buffer = 30
                             blocked = False
                             for face in self.faces:
-                                if self.display_center_x-buffer <= face.x <= self.display_center_x+buffer and \
-                                   self.display_center_y-buffer <= face.y <= self.display_center_y+buffer:
+                                if self.world_center_x-buffer <= face.x <= self.world_center_x+buffer and \
+                                   self.world_center_y-buffer <= face.y <= self.world_center_y+buffer:
                                     blocked = True
                                     break
 
                             # Reset ship position and settings and display
                             if blocked == False:
-                                self.ship.reset(x=self.display_center_x, y=self.display_center_y)
-                                self.ship.hidden = False
-                                self.audio_manager.play_sound('new_ship')
+                                self.reset_ship()
+                                self.audio_manager.queue_sound('new_ship')
 
                     # If zero lives remain
                     else:
@@ -1329,7 +1952,7 @@ class FaceInvadersGame():
                         # Display game over menu
                         self.game_over_time = monotonic()
                         self.game_over()
-                        self.audio_manager.play_sound('game_over')
+                        self.audio_manager.queue_sound('game_over')
 
             # Process game over game step
             elif self.current_state == C.GameState.GAME_OVER:
@@ -1338,27 +1961,29 @@ class FaceInvadersGame():
                 if self.game_over_text_group.hidden and monotonic() - self.game_over_time > self.game_over_seconds:
                     self.game_over_text_group.hidden = False
 
-            # Clear hit faces from tracking and display
-            hit_faces = [face for face in self.faces if face.is_hit]
-            for face in hit_faces:
-                self.game_group.remove(face.tilegrid)
-                self.faces.remove(face)
-
-            # Clear expired particles from tracking and display
-            expired_particles = [particle for particle in self.particles if particle.check_expired()]
-            for particle in expired_particles:
-                self.game_group.remove(particle.shape)
-                self.particles.remove(particle)
-
-            # Clear expired bullets from tracking and display
-            expired_bullets = [bullet for bullet in self.bullets if bullet.check_expired() or bullet.is_hit]
-            for bullet in expired_bullets:
-                self.game_group.remove(bullet.shape)
-                self.bullets.remove(bullet)
-
             # Check if all faces destroyed
-            if len(self.faces) == 0:
+            if len(faces) == 0:
 
                 # Initiate next wave of faces
                 self.level += 1
-                self.create_face_wave(min(self.level, 3))
+                self.create_face_wave(self.level)
+
+            # Plan part of the next wave each frame
+            else:
+                self.wave_planner.step()
+
+        # Start the sounds requested by input and game events this frame
+        audio_manager = self.audio_manager
+        audio_manager.flush_sounds(current_tick_time)
+
+        # Record label re-renders made since the last tick
+        if self.frame_stats:
+            self.frame_stats.count('label_renders', CachedLabel.renders)
+            CachedLabel.renders = 0
+
+        # Record sound requests and the mixer plays they started
+        if self.frame_stats:
+            self.frame_stats.count('sound_requests', audio_manager.requests)
+            self.frame_stats.count('sound_plays', audio_manager.plays)
+        audio_manager.requests = 0
+        audio_manager.plays = 0
@@ -0,0 +1,141 @@
+"""Fixed-point movement helpers used by Face Invaders game objects."""
+
+from array import array
+from math import sin, pi
+
+# Positions and velocities are stored in Q8; 256 units per pixel
+FRAC_BITS = 8
+ONE = 1 << FRAC_BITS
+
+# Elapsed time is measured in 1/1024 second units
+TIME_BITS = 10
+TIME_ONE = 1 << TIME_BITS
+TIME_MASK = TIME_ONE - 1
+
+# Sine table covering a quarter turn of a 4096 step circle in Q14
+TRIG_BITS = 14
+ANGLE_STEPS = 4096
+ANGLE_MASK = ANGLE_STEPS - 1
+QUARTER_STEPS = ANGLE_STEPS // 4
+SINE = array('h', (int(sin(i * 2 * pi / ANGLE_STEPS) * (1 << TRIG_BITS) + 0.5) for i in range(QUARTER_STEPS + 1)))
+
+# Scale from radians to angle steps
+ANGLE_SCALE = ANGLE_STEPS / (2 * pi)
+
+
+def sin_q14(index):
+    """Return the Q14 sine of an angle step."""
+    index &= ANGLE_MASK
+    if index < QUARTER_STEPS:
+        return SINE[index]
+    if index < 2 * QUARTER_STEPS:
+        return SINE[2 * QUARTER_STEPS - index]
+    if index < 3 * QUARTER_STEPS:
+        return -SINE[index - 2 * QUARTER_STEPS]
+    return -SINE[ANGLE_STEPS - index]
+
+def cos_q14(index):
+    """Return the Q14 cosine of an angle step."""
+    return sin_q14(index + QUARTER_STEPS)
+
+def scale_q14(value, factor):
+    """Return ``value`` multiplied by a Q14 factor, rounded to nearest."""
+    return (value * factor + (1 << (TRIG_BITS - 1))) >> TRIG_BITS
+
+def sin_q14_fine(position):
+    '''
+    Return the Q14 sine of an angle given in 1/256 angle steps,
+    interpolating between table steps for directions that must hold over
+    long distances
+    '''
+    index = position >> 8
+    low = sin_q14(index)
+    return low + (((sin_q14(index + 1) - low) * (position & 255) + 128) >> 8)
+
+def fine_position(angle):
+    """Return an angle in radians as a count of 1/256 angle steps."""
+    return int(angle * ANGLE_SCALE * 256 + 0.5)
+
+def velocity(v, angle):
+    '''
+    Return the (vx, vy) components in Q8 pixels per second of speed ``v``
+    along heading ``angle`` in radians, where 0 points up the display
+    '''
+    v = int(v * ONE + 0.5)
+    position = fine_position(angle)
+    return scale_q14(v, sin_q14_fine(position)), -scale_q14(v, sin_q14_fine(position + (QUARTER_STEPS << 8)))
+
+
+class TickClock:
+    '''
+    Convert per-tick float delta times into integer time units, carrying
+    the fractional remainder so no time is lost between ticks
+    '''
+
+    def __init__(self):
+        """Create a clock with no carried time."""
+        self.remainder = 0
+
+    def units(self, delta_time):
+        """Return the time units elapsed over ``delta_time`` seconds."""
+        total = delta_time * TIME_ONE + self.remainder
+        units = int(total)
+        self.remainder = total - units
+        return units
+
+
+class FixedMotion:
+    '''
+    Mixin holding a Q8 position moving at a constant Q8 velocity, wrapped
+    within spans using integer arithmetic. ``x`` and ``y`` hold the whole
+    pixel position after each move.
+    '''
+
+    def init_motion(self, x, y, v, angle, half_width=0, span_x=1, half_height=0, span_y=1):
+        """Set the position, velocity and wrap extents, given in pixels."""
+
+        # Whole pixel and Q8 position
+        self.set_position(x, y)
+
+        # Q8 velocity components, and bounds on their magnitudes
+        self.set_velocity(*velocity(v, angle))
+
+        # Q8 wrap extents
+        self.half_fx = int(half_width * ONE)
+        self.span_fx = int(span_x * ONE)
+        self.half_fy = int(half_height * ONE)
+        self.span_fy = int(span_y * ONE)
+
+    def set_position(self, x, y):
+        """Move to pixel position (x, y), discarding any carried movement."""
+        self.fx = int(x * ONE)
+        self.fy = int(y * ONE)
+        self.x = self.fx >> FRAC_BITS
+        self.y = self.fy >> FRAC_BITS
+        self.rx = 0
+        self.ry = 0
+
+    def set_velocity(self, vx, vy):
+        """Set the Q8 velocity components and the bounds on their magnitudes."""
+        self.vx = vx
+        self.vy = vy
+        self.bound_vx = abs(vx) + 1
+        self.bound_vy = abs(vy) + 1
+
+    def move(self, dt):
+        '''
+        Advance the position by ``dt`` time units and apply wrapping
+        '''
+        # Q8 distance moved, carrying the remainder below one Q8 unit
+        nx = self.vx * dt + self.rx
+        ny = self.vy * dt + self.ry
+        self.rx = nx & TIME_MASK
+        self.ry = ny & TIME_MASK
+
+        # Update position and apply wrapping
+        half_fx = self.half_fx
+        half_fy = self.half_fy
+        self.fx = (self.fx + (nx >> TIME_BITS) + half_fx) % self.span_fx - half_fx
+        self.fy = (self.fy + (ny >> TIME_BITS) + half_fy) % self.span_fy - half_fy
+        self.x = self.fx >> FRAC_BITS
+        self.y = self.fy >> FRAC_BITS
@@ -0,0 +1,128 @@
+"""Frame budget governor that trades visual effects for frame time."""
+
+# Governor levels, each adding a reduction to those below it
+FULL_EFFECTS = 0
+FEWER_PARTICLES = 1
+NO_DEBRIS = 2
+HALF_REFRESH = 3
+
+
+class FrameGovernor:
+    '''
+    Track a rolling average of frame time, the game tick plus display
+    refresh, against a target budget. The governor steps up a level,
+    degrading effects, while the average is over budget and steps back down
+    once it falls well under, holding each level for a minimum number of
+    frames so it does not oscillate.
+    '''
+
+    def __init__(self, target_seconds, window=16, raise_ratio=1.0, lower_ratio=0.75,
+                 hold_frames=30, report_seconds=None):
+        """Create a governor for a ``target_seconds`` frame budget."""
+
+        # Frame budget and hysteresis thresholds
+        self.target = target_seconds
+        self.raise_time = target_seconds * raise_ratio
+        self.lower_time = target_seconds * lower_ratio
+        self.hold_frames = hold_frames
+
+        # Rolling window of recent frame times
+        self.samples = [0] * window
+        self.sample_index = 0
+        self.sample_count = 0
+        self.total = 0
+
+        # Refresh time applied to frames that skip the refresh, so the
+        # average reflects the cost of refreshing every frame
+        self.refresh_time = 0
+
+        # Current level and frames spent at it
+        self.level = FULL_EFFECTS
+        self.level_frames = 0
+
+        # Telemetry of frames spent at each level and level changes
+        self.frames_at_level = [0] * (HALF_REFRESH + 1)
+        self.raises = 0
+        self.lowers = 0
+
+        # Optional serial report period
+        self.report_seconds = report_seconds
+        self.last_report_time = None
+
+    def particle_count(self, count):
+        """Return the number of particles to create in place of ``count``."""
+        return count if self.level < FEWER_PARTICLES else (count + 1) // 2
+
+    def particle_age(self, age):
+        '''
+        Return the fraction of their life past which particles update at
+        half rate, lowered from ``age`` at each level so more particles do
+        '''
+        return age * (HALF_REFRESH + 1 - self.level) / (HALF_REFRESH + 1)
+
+    def debris(self):
+        """Return whether line debris particles should be created."""
+        return self.level < NO_DEBRIS
+
+    def refresh_due(self, tick):
+        """Return whether the display should be refreshed after ``tick``."""
+        return self.level < HALF_REFRESH or tick % 2 == 0
+
+    def add_frame(self, tick_seconds, refresh_seconds=None, timestamp=None):
+        '''
+        Record a frame's tick and refresh times, with a refresh time of None
+        for frames that skipped the refresh, and adjust the governor level
+        '''
+        # Substitute the last refresh time for skipped refreshes
+        if refresh_seconds is None:
+            refresh_seconds = self.refresh_time
+        else:
+            self.refresh_time = refresh_seconds
+
+        # Replace the oldest sample in the rolling window
+        frame_seconds = tick_seconds + refresh_seconds
+        samples = self.samples
+        self.total += frame_seconds - samples[self.sample_index]
+        samples[self.sample_index] = frame_seconds
+        self.sample_index = (self.sample_index + 1) % len(samples)
+        if self.sample_count < len(samples):
+            self.sample_count += 1
+
+        # Track time spent at the current level
+        self.frames_at_level[self.level] += 1
+        self.level_frames += 1
+
+        # Change level once the window is full and the level has been held
+        if self.sample_count == len(samples) and self.level_frames >= self.hold_frames:
+            average = self.total / self.sample_count
+            if average > self.raise_time and self.level < HALF_REFRESH:
+                self.level += 1
+                self.level_frames = 0
+                self.raises += 1
+            elif average < self.lower_time and self.level > FULL_EFFECTS:
+                self.level -= 1
+                self.level_frames = 0
+                self.lowers += 1
+
+        # Periodically report over serial
+        if self.report_seconds is not None and timestamp is not None:
+            if self.last_report_time is None:
+                self.last_report_time = timestamp
+            elif timestamp - self.last_report_time > self.report_seconds:
+                self.last_report_time = timestamp
+                self.report()
+
+    def average(self):
+        """Return the rolling average frame time in seconds."""
+        return self.total / self.sample_count if self.sample_count else 0
+
+    def report(self):
+        """Print governor level telemetry over serial."""
+        print('governor: level={} avg_ms={:.1f} target_ms={:.1f} raises={} lowers={} frames_at_level={}'.format(
+            self.level,
+            self.average() * 1000,
+            self.target * 1000,
+            self.raises,
+            self.lowers,
+            self.frames_at_level
+        ))
@@ -27,11 +27,15 @@ def check_high_score(high_scores, score):
                 return True
     return False
 
-def update_high_scores(high_scores, initials, score):
-    """Update ``high_scores`` with a new entry and persist to disk."""
+def update_high_scores(high_scores, initials, score, save=True):
+    '''
+    Update ``high_scores`` with a new entry and, unless ``save`` is False,
+    persist to disk
+    '''
     high_scores.append((initials, score))
     high_scores.sort(key=lambda item: item[1], reverse=True)
     if len(high_scores) > C.NUM_HIGH_SCORES:
         high_scores.pop()
-    save_high_scores(high_scores)
+    if save:
+        save_high_scores(high_scores)
 
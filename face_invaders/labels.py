@@ -0,0 +1,95 @@
+"""Display label helpers for Face Invaders."""
+
+from displayio import TileGrid, Palette
+
+class CachedLabel:
+    """Wrap a bitmap label so its bitmap is only re-rendered when text changes."""
+
+    # Number of label re-renders since the counter was last cleared
+    renders = 0
+
+    def __init__(self, label):
+        """Wrap ``label``, caching its current text."""
+        self.label = label
+        self._text = label.text
+
+    @property
+    def text(self):
+        """The label's current text."""
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        """Update the label text, re-rendering only if it changed."""
+        if text != self._text:
+            self._text = text
+            self.label.text = text
+            CachedLabel.renders += 1
+
+
+class DigitDisplay:
+    '''
+    Fixed width, right aligned number display drawn with a TileGrid over
+    the font's glyph sheet. Numbers are updated by changing tile indices,
+    so updates never allocate new bitmaps.
+    '''
+
+    def __init__(self, font, digits, color, right=0, y=0, blank='-'):
+        """Create a number display whose right edge is placed at ``right``."""
+
+        # Glyph size of the font's tile sheet
+        tile_width, tile_height = font.get_bounding_box()[:2]
+
+        # Two color palette with transparent background
+        self.palette = Palette(2)
+        self.palette.make_transparent(0)
+        self.palette[1] = color
+
+        # Tile indices of digit, space and blank glyphs
+        self.digit_tiles = [font.get_glyph(ord(char)).tile_index for char in '0123456789']
+        self.space_tile = font.get_glyph(ord(' ')).tile_index
+        self.blank_tile = font.get_glyph(ord(blank)).tile_index
+
+        # One tile per digit
+        self.digits = digits
+        self.tilegrid = TileGrid(
+            font.bitmap,
+            pixel_shader=self.palette,
+            width=digits,
+            height=1,
+            tile_width=tile_width,
+            tile_height=tile_height,
+            default_tile=self.space_tile,
+            x=right - digits * tile_width,
+            y=y
+        )
+
+        # Currently displayed value, None when blank
+        self.value = None
+        self.clear()
+
+    def _set_tile(self, index, tile):
+        """Set a tile index only if it differs from the current one."""
+        if self.tilegrid[index] != tile:
+            self.tilegrid[index] = tile
+
+    def show(self, value):
+        """Display a non-negative integer ``value``."""
+        if value == self.value:
+            return
+        self.value = value
+
+        # Fill digits from the right, padding with spaces
+        for i in range(self.digits - 1, -1, -1):
+            if value or i == self.digits - 1:
+                self._set_tile(i, self.digit_tiles[value % 10])
+                value //= 10
+            else:
+                self._set_tile(i, self.space_tile)
+
+    def clear(self):
+        """Display the blank glyph in place of a number."""
+        self.value = None
+        for i in range(self.digits - 1):
+            self._set_tile(i, self.space_tile)
+        self._set_tile(self.digits - 1, self.blank_tile)
@@ -0,0 +1,102 @@
+"""Temporal coherence scheduling of Face Invaders collision pair checks."""
+
+from face_invaders.fixed import FRAC_BITS, TIME_BITS
+
+# Horizon used when a pair can never close or an object cannot wrap
+NEVER = 1 << 24
+
+
+class PairScheduler:
+    '''
+    Skip collision checks for object pairs that are proven separated.
+    Each object moves at most ``bound_vx`` and ``bound_vy`` Q8 pixels per
+    second along each axis, so the gap between two bounding boxes gives a
+    time before which they cannot touch. On padded playfields wrapping
+    teleports objects across the playfield, so the skip time also ends
+    before either object could reach a wrap edge. Seamless playfields wrap
+    every object within the same span, so gaps are measured the short way
+    around instead. Times are counted in fixed-point time units.
+    '''
+
+    def __init__(self, world, slack=2):
+        '''
+        Create a scheduler for objects moving within ``world``, treating
+        boxes within ``slack`` pixels as touching
+        '''
+
+        # Simulation time in time units
+        self.time = 0
+
+        # Q8 wrap spans of a seamless playfield, or 0 on padded playfields
+        self.span_fx = 0 if world.padded else world.width << FRAC_BITS
+        self.span_fy = 0 if world.padded else world.height << FRAC_BITS
+
+        # Q8 distance covering pixel rounding of display positions
+        self.slack = slack << FRAC_BITS
+
+        # Pair checks skipped and made, for frame statistics
+        self.skips = 0
+        self.checks = 0
+
+    def advance(self, dt):
+        """Advance simulation time by ``dt`` time units."""
+        self.time += dt
+
+    def wrap_horizon(self, obj):
+        """Return the time units before ``obj`` could reach a wrap edge."""
+        horizon = NEVER
+        if obj.bound_vx:
+            edge = min(obj.fx + obj.half_fx, obj.span_fx - obj.half_fx - obj.fx)
+            horizon = (edge << TIME_BITS) // obj.bound_vx
+        if obj.bound_vy:
+            edge = min(obj.fy + obj.half_fy, obj.span_fy - obj.half_fy - obj.fy)
+            horizon = min(horizon, (edge << TIME_BITS) // obj.bound_vy)
+        return horizon
+
+    def horizon(self, obj_1, obj_2):
+        '''
+        Return the time units before the boxes of two objects could touch,
+        or 0 if they may touch now
+        '''
+        # Distances between centers along each axis, the short way around
+        # seamless playfields
+        dx = abs(obj_1.fx - obj_2.fx)
+        dy = abs(obj_1.fy - obj_2.fy)
+        span_fx = self.span_fx
+        if span_fx:
+            span_fy = self.span_fy
+            dx %= span_fx
+            dy %= span_fy
+            dx = min(dx, span_fx - dx)
+            dy = min(dy, span_fy - dy)
+
+        # Gaps between boxes along each axis
+        gap_x = dx - obj_1.extent_fx - obj_2.extent_fx - self.slack
+        gap_y = dy - obj_1.extent_fy - obj_2.extent_fy - self.slack
+
+        # Both axes must close before the boxes touch
+        horizon = 0
+        if gap_x > 0:
+            speed = obj_1.bound_vx + obj_2.bound_vx
+            horizon = (gap_x << TIME_BITS) // speed if speed else NEVER
+        if gap_y > 0:
+            speed = obj_1.bound_vy + obj_2.bound_vy
+            horizon = max(horizon, (gap_y << TIME_BITS) // speed if speed else NEVER)
+        if horizon == 0 or span_fx:
+            return horizon
+
+        # On padded playfields neither object may wrap before the next check
+        return min(horizon, self.wrap_horizon(obj_1), self.wrap_horizon(obj_2))
+
+    def due(self, next_time, obj_1, obj_2):
+        '''
+        Return the time of the pair's next check given its previous
+        ``next_time``; the pair must be checked this tick when the returned
+        time is not in the future
+        '''
+        time = self.time
+        if next_time > time:
+            self.skips += 1
+            return next_time
+        self.checks += 1
+        return time + self.horizon(obj_1, obj_2)
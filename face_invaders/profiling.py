@@ -0,0 +1,260 @@
+"""Profiling helpers for measuring Face Invaders performance on the device."""
+
+class Histogram:
+    """Count samples, such as millisecond timings, into fixed width buckets."""
+
+    def __init__(self, bucket_ms=10, bucket_count=10):
+        """Create an empty histogram with an overflow bucket at the end."""
+
+        # Bucket layout; the last bucket collects all samples past the range
+        self.bucket_ms = bucket_ms
+        self.buckets = [0] * (bucket_count + 1)
+
+        # Running sample totals
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value):
+        """Record a single sample."""
+        index = min(int(value // self.bucket_ms), len(self.buckets) - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def mean(self):
+        """Return the mean of all recorded samples."""
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, fraction):
+        """Return the upper bucket edge below which ``fraction`` of samples fall."""
+        target = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target and seen > 0:
+                return min((i + 1) * self.bucket_ms, self.max)
+        return 0
+
+    def reset(self):
+        """Discard all recorded samples."""
+        for i in range(len(self.buckets)):
+            self.buckets[i] = 0
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def format(self):
+        """Return a single line summary suitable for serial output."""
+        return 'n={} mean={:.1f} p50<={:.0f} p90<={:.0f} max={:.1f} buckets={}'.format(
+            self.count,
+            self.mean(),
+            self.percentile(0.5),
+            self.percentile(0.9),
+            self.max,
+            self.buckets
+        )
+
+
+class LatencyTracker:
+    """Measure input-to-photon latency from keypad read to display refresh."""
+
+    def __init__(self, report_seconds=10, bucket_ms=10, bucket_count=10):
+        """Create a tracker that reports over serial every ``report_seconds``."""
+
+        # Latency from key read to the refresh showing its effect
+        self.histogram = Histogram(bucket_ms, bucket_count)
+
+        # Key events awaiting the refresh that displays them, stored
+        # as (key_number, read_time, tick) entries
+        self.pending = []
+
+        # Key read awaiting its handler result
+        self.current_key = None
+        self.current_time = None
+
+        # Number of key events that did not change game state
+        self.ignored = 0
+
+        # Serial report period
+        self.report_seconds = report_seconds
+        self.last_report_time = None
+
+    def key_read(self, key_number, timestamp):
+        """Record the time a key event was read from the keypad queue."""
+        self.current_key = key_number
+        self.current_time = timestamp
+
+    def key_handled(self, tick, changed):
+        '''
+        Link the last key read to the tick that applies its state change.
+        Events whose handler changed nothing are counted but not timed.
+        '''
+        if self.current_time is None:
+            return
+        if changed:
+            self.pending.append((self.current_key, self.current_time, tick))
+        else:
+            self.ignored += 1
+        self.current_key = None
+        self.current_time = None
+
+    def refreshed(self, tick, timestamp):
+        '''
+        Complete all pending events simulated at or before ``tick`` using the
+        time the display refresh finished
+        '''
+        if self.pending:
+            remaining = []
+            for key_number, read_time, event_tick in self.pending:
+                if event_tick <= tick:
+                    self.histogram.add((timestamp - read_time) * 1000)
+                else:
+                    remaining.append((key_number, read_time, event_tick))
+            self.pending = remaining
+
+        # Periodically report over serial
+        if self.last_report_time is None:
+            self.last_report_time = timestamp
+        elif timestamp - self.last_report_time > self.report_seconds:
+            self.last_report_time = timestamp
+            self.report()
+
+    def report(self):
+        """Print the latency histogram over serial."""
+        print('input latency ms:', self.histogram.format(), 'ignored={}'.format(self.ignored))
+
+
+class MemoryReport:
+    """Record free memory at named stages and report the change between them."""
+
+    def __init__(self, title):
+        """Create an empty report."""
+        self.title = title
+        self.stages = []
+        self.notes = []
+
+    def mark(self, stage, free):
+        """Record ``free`` bytes of memory at the end of ``stage``."""
+        self.stages.append((stage, free))
+
+    def note(self, text):
+        """Add a line of text to the report."""
+        self.notes.append(text)
+
+    def report(self):
+        """Print free memory and its change per stage over serial."""
+        print(self.title, 'memory:')
+        previous = None
+        for stage, free in self.stages:
+            used = previous - free if previous is not None else 0
+            print(' ', stage + ':', 'free={} used={}'.format(free, used))
+            previous = free
+        for text in self.notes:
+            print(' ', text)
+
+
+class FrameStats:
+    """Collect per-frame counters and report their distributions over serial."""
+
+    def __init__(self, report_seconds=10):
+        """Create an empty set of frame statistics."""
+
+        # Counter values accumulated during the current frame
+        self.counters = {}
+
+        # Per-frame counter and timing distributions
+        self.histograms = {}
+
+        # Running (hits, tests) totals of hit rates
+        self.rates = {}
+
+        # Number of completed frames
+        self.frames = 0
+
+        # Serial report period
+        self.report_seconds = report_seconds
+        self.last_report_time = None
+
+    def count(self, name, amount=1):
+        """Add ``amount`` to a named counter for the current frame."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def count_rate(self, name, hits, tests):
+        """Add ``hits`` out of ``tests`` to a named hit rate."""
+        if tests:
+            totals = self.rates.get(name)
+            if totals is None:
+                totals = self.rates[name] = [0, 0]
+            totals[0] += hits
+            totals[1] += tests
+
+    def add_time(self, name, seconds):
+        """Record a section duration for the current frame in milliseconds."""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(bucket_ms=5)
+        self.histograms[name].add(seconds * 1000)
+
+    def end_frame(self, timestamp):
+        """Fold the current frame counters into their histograms."""
+        for name in self.counters:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram(bucket_ms=1)
+            self.histograms[name].add(self.counters[name])
+            self.counters[name] = 0
+        self.frames += 1
+
+        # Periodically report over serial
+        if self.last_report_time is None:
+            self.last_report_time = timestamp
+        elif timestamp - self.last_report_time > self.report_seconds:
+            self.last_report_time = timestamp
+            self.report()
+
+    def report(self):
+        """Print all counter distributions over serial."""
+        print('frames:', self.frames)
+        for name in sorted(self.histograms):
+            print(' ', name + ':', self.histograms[name].format())
+        for name in sorted(self.rates):
+            hits, tests = self.rates[name]
+            print(' ', name + ':', 'hits={}/{} rate={:.0f}%'.format(hits, tests, 100 * hits / tests))
+
+
+class DutyCycle:
+    '''
+    Measure the share of time spent working rather than sleeping, per game
+    state, and report it over serial
+    '''
+
+    def __init__(self, names, report_seconds=10):
+        """Create a duty cycle report labelling states with ``names``."""
+
+        # State names, and busy and total seconds per state
+        self.names = names
+        self.busy = {}
+        self.total = {}
+
+        # Serial report period
+        self.report_seconds = report_seconds
+        self.last_report_time = None
+
+    def add(self, state, busy_seconds, total_seconds, timestamp):
+        """Record a frame spent in ``state`` and the part of it spent busy."""
+        self.busy[state] = self.busy.get(state, 0) + busy_seconds
+        self.total[state] = self.total.get(state, 0) + total_seconds
+
+        # Periodically report over serial
+        if self.last_report_time is None:
+            self.last_report_time = timestamp
+        elif timestamp - self.last_report_time > self.report_seconds:
+            self.last_report_time = timestamp
+            self.report()
+
+    def report(self):
+        """Print the duty cycle of each state over serial."""
+        print('duty cycle:', ' '.join('{}={:.0f}%'.format(
+            self.names.get(state, state),
+            100 * self.busy[state] / self.total[state]
+        ) for state in sorted(self.total) if self.total[state]))
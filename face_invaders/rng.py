@@ -0,0 +1,54 @@
+"""Fast seeded pseudo-random number streams for Face Invaders gameplay."""
+
+from math import pi
+
+# Angle in radians for each whole degree
+ANGLES = tuple(pi * degree / 180 for degree in range(360))
+
+class XorShift:
+    '''
+    16-bit xorshift generator. State stays within small integers so draws
+    never allocate on CircuitPython, and each subsystem can own a separately
+    seeded stream that replays identically on the device and a host.
+    '''
+
+    def __init__(self, seed=1):
+        """Create a stream from an integer ``seed``."""
+        self.seed(seed)
+
+    def seed(self, seed):
+        """Reset the stream to the sequence for an integer ``seed``."""
+
+        # Scramble nearby seeds, avoiding the all zero state
+        self.state = ((seed & 0xFFFF) * 40503 + 1) & 0xFFFF or 1
+
+        # Discard the first values, which stay close for similar seeds
+        for i in range(4):
+            self.next()
+
+    def next(self):
+        """Return the next value in the range 1-65535."""
+        x = self.state
+        x ^= (x << 7) & 0xFFFF
+        x ^= x >> 9
+        x ^= (x << 8) & 0xFFFF
+        self.state = x
+        return x
+
+    def randrange(self, start, stop=None):
+        """Return an integer in ``range(start, stop)``, or ``range(start)``."""
+        if stop is None:
+            start, stop = 0, start
+        return start + self.next() % (stop - start)
+
+    def choice(self, seq):
+        """Return a random element of a non-empty sequence."""
+        return seq[self.next() % len(seq)]
+
+    def flip(self):
+        """Return True or False with equal chance."""
+        return self.next() & 0x100 == 0
+
+    def angle(self):
+        """Return a random whole degree angle in radians."""
+        return ANGLES[self.next() % 360]
@@ -0,0 +1,161 @@
+"""Frame loop steps shared by the Face Invaders main loop runtimes."""
+
+from time import monotonic, sleep
+
+from face_invaders import constants as C
+
+
+class FrameLoop:
+    '''
+    Drive a game through key handling, game ticks and display refreshes,
+    feeding frame times to the game's governor and statistics. Both the
+    polling main loop and the asyncio runtime call these steps, so they
+    measure input latency and frame timing the same way.
+    '''
+
+    def __init__(self, game, display, keys, latency_tracker=None, duty_cycle=None):
+        """Create a loop driving ``game`` from ``keys`` onto ``display``."""
+        self.game = game
+        self.display = display
+        self.keys = keys
+        self.latency_tracker = latency_tracker
+        self.duty_cycle = duty_cycle
+
+        # Start and end times of the last tick
+        self.tick_start_time = None
+        self.tick_end_time = None
+
+        # End time of the last refresh, for frame intervals
+        self.last_refresh_time = None
+
+        # Start of the current frame and the seconds of it spent working
+        self.frame_start_time = monotonic()
+        self.busy_time = 0
+
+    def poll_key(self):
+        """Handle one queued key event, returning whether one was handled."""
+        key = self.keys.events.get()
+        if not key:
+            return False
+        game = self.game
+        latency_tracker = self.latency_tracker
+        read_time = monotonic()
+
+        # Timestamp key read and capture state before handling
+        if latency_tracker:
+            latency_tracker.key_read(key.key_number, read_time)
+            input_signature = game.input_signature()
+
+        game.key_event(key.key_number, pressed=key.pressed)
+
+        # Link key to the next tick if its handler changed game state
+        if latency_tracker:
+            latency_tracker.key_handled(game.tick_count + 1, game.input_signature() != input_signature)
+        self.busy_time += monotonic() - read_time
+        return True
+
+    def tick(self):
+        """Tick the game forward."""
+        self.tick_start_time = monotonic()
+        self.game.tick()
+        self.tick_end_time = monotonic()
+        self.busy_time += self.tick_end_time - self.tick_start_time
+
+    def refresh(self):
+        '''
+        Refresh the display after the last tick, unless the frame governor
+        has lowered the refresh rate, and record the frame's timing. The
+        governor only manages states running at the full frame rate, since
+        throttled states must show every frame they tick.
+        '''
+        game = self.game
+        governor = game.governor if game.frame_seconds() == 0 else None
+        frame_stats = game.frame_stats
+        tick_seconds = self.tick_end_time - self.tick_start_time
+
+        refresh_start_time = monotonic()
+        refreshed = governor is None or governor.refresh_due(game.tick_count)
+        if refreshed:
+            self.display.refresh()
+        refresh_end_time = monotonic()
+        self.busy_time += refresh_end_time - refresh_start_time
+
+        # Feed frame time to the governor
+        if governor:
+            governor.add_frame(
+                tick_seconds,
+                refresh_end_time - refresh_start_time if refreshed else None,
+                refresh_end_time
+            )
+
+        # Time game tick, display refresh and the interval between refreshes
+        if frame_stats:
+            frame_stats.add_time('tick', tick_seconds)
+            if refreshed:
+                frame_stats.add_time('refresh', refresh_end_time - refresh_start_time)
+                if self.last_refresh_time is not None:
+                    frame_stats.add_time('frame_interval', refresh_end_time - self.last_refresh_time)
+            if governor:
+                frame_stats.count('governor_level', governor.level)
+        if refreshed:
+            self.last_refresh_time = refresh_end_time
+
+        # Record refresh completion for pending key events
+        if self.latency_tracker and refreshed:
+            self.latency_tracker.refreshed(game.tick_count, refresh_end_time)
+
+        # Complete per-frame statistics
+        if frame_stats:
+            frame_stats.end_frame(monotonic())
+
+    def idle(self):
+        '''
+        Sleep until the next frame is due in states that do not need the
+        full frame rate, waking early for key events
+        '''
+        game = self.game
+        period = game.frame_seconds()
+        if period == 0:
+            return
+        deadline = None if period is None else self.frame_start_time + period
+        events = self.keys.events
+        while not events:
+            now = monotonic()
+            if deadline is not None and now >= deadline:
+                break
+            sleep(C.IDLE_POLL_SECONDS if deadline is None else min(C.IDLE_POLL_SECONDS, deadline - now))
+
+        # Time spent waiting on input is not simulated
+        if period is None:
+            game.skip_elapsed()
+
+    def end_frame(self):
+        """Record the share of the frame spent working for the duty cycle."""
+        now = monotonic()
+        if self.duty_cycle:
+            self.duty_cycle.add(self.game.current_state, self.busy_time, now - self.frame_start_time, now)
+        self.frame_start_time = now
+        self.busy_time = 0
+
+    def run_frame(self):
+        """Run one frame of the polling main loop."""
+
+        # Process button event if one exists
+        self.poll_key()
+
+        # Tick game forward and refresh display, unless the frame governor
+        # has lowered the refresh rate
+        self.tick()
+        self.refresh()
+
+        # Write state saved outside key handling
+        self.persist()
+
+        # Sleep until the next frame in idle states, waking for key events
+        self.idle()
+        self.end_frame()
+
+    def persist(self):
+        """Write state deferred by the game: new high scores and snapshots."""
+        self.game.save_high_scores()
+        self.game.save_snapshot()
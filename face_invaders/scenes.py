@@ -0,0 +1,44 @@
+"""Scene switching for the Face Invaders display."""
+
+class SceneManager:
+    '''
+    Attach the display groups of the current game state to a root group.
+    Groups of inactive scenes are detached from the root group so they are
+    not traversed on display refresh.
+    '''
+
+    def __init__(self, root_group, scenes):
+        """Store ``scenes``, a dict mapping game states to tuples of groups."""
+
+        # Root display group holding the attached scene groups
+        self.root_group = root_group
+
+        # Display groups for each game state, in drawing order
+        self.scenes = scenes
+
+        # Currently attached groups and state
+        self.groups = ()
+        self.state = None
+
+    def show(self, state, base_state=None):
+        '''
+        Attach the groups of ``state``, drawn over the groups of
+        ``base_state`` when given, and detach all other groups
+        '''
+        groups = self.scenes[state]
+        if base_state is not None:
+            groups = self.scenes[base_state] + groups
+
+        # Keep leading groups shared with the attached scene
+        keep = 0
+        while keep < len(groups) and keep < len(self.groups) and groups[keep] is self.groups[keep]:
+            keep += 1
+
+        # Detach remaining groups and attach the new ones
+        while len(self.root_group) > keep:
+            self.root_group.pop()
+        for group in groups[keep:]:
+            self.root_group.append(group)
+
+        self.groups = groups
+        self.state = state
@@ -0,0 +1,102 @@
+"""Ship sprite tables generated by tools/make_ship_sheet.py; do not edit."""
+
+TILE_WIDTH = 20
+TILE_HEIGHT = 20
+TILE_COUNT = 36
+HEADING_STEPS = 256
+
+# Tile index for each heading step
+HEADING_TILES = bytes((
+    0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2,
+    2, 2, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4,
+    5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 7, 7,
+    7, 7, 7, 7, 7, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9,
+    9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11, 11, 11,
+    11, 11, 12, 12, 12, 12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13,
+    14, 14, 14, 14, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 16, 16,
+    16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18,
+    18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20,
+    20, 20, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22,
+    23, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 24, 24, 25, 25,
+    25, 25, 25, 25, 25, 26, 26, 26, 26, 26, 26, 26, 27, 27, 27, 27,
+    27, 27, 27, 27, 28, 28, 28, 28, 28, 28, 28, 29, 29, 29, 29, 29,
+    29, 29, 30, 30, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31,
+    32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 34, 34,
+    34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 35, 0, 0, 0, 0,
+))
+
+# Opaque pixel bitmask per row of each tile
+MASKS = (
+    (0, 0, 0, 0, 1536, 1536, 3840, 2304, 6528, 4224, 12480, 9792, 20320, 31200, 32736, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 1024, 3584, 2816, 6400, 4480, 4288, 12352, 13856, 12208, 10480, 32640, 30720, 0, 0, 0, 0),
+    (0, 0, 0, 0, 6144, 7168, 5632, 4864, 4480, 12480, 12384, 13240, 14328, 13792, 16128, 15360, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 14336, 15872, 13056, 12736, 12384, 12312, 5112, 4720, 6080, 5888, 7680, 6144, 0, 0, 0),
+    (0, 0, 0, 0, 0, 12288, 15360, 10112, 12512, 12344, 4600, 5104, 7008, 2752, 2944, 3584, 3072, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 31744, 28544, 8440, 12312, 12784, 5024, 7008, 3008, 3968, 1792, 1536, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 32256, 65528, 16408, 8304, 12784, 6496, 2368, 3520, 1408, 896, 768, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 2032, 65520, 49200, 24800, 12704, 6624, 3520, 1728, 960, 384, 128, 0, 0, 0),
+    (0, 0, 0, 0, 0, 32, 1008, 7984, 61680, 49568, 29088, 6304, 3296, 1632, 448, 192, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 224, 992, 3680, 14560, 57760, 57760, 14560, 3680, 992, 224, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 192, 448, 1632, 3296, 14496, 29088, 49568, 61680, 7984, 1008, 48, 0, 0, 0, 0, 0),
+    (0, 0, 0, 384, 384, 960, 1728, 3520, 6624, 12704, 24816, 49200, 65520, 2032, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 768, 768, 1408, 3520, 2368, 6496, 12784, 8304, 24600, 32760, 32256, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 1536, 1792, 3968, 3008, 7008, 5024, 4592, 12312, 8440, 28544, 31744, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 3072, 3584, 2944, 2752, 7008, 5104, 4600, 12344, 12512, 10112, 15872, 12288, 0, 0, 0, 0, 0),
+    (0, 0, 0, 6144, 7680, 5888, 6080, 4720, 5112, 12344, 12384, 12736, 13056, 13824, 14336, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 15360, 16128, 13792, 14328, 13240, 12384, 12480, 4480, 4864, 5632, 7168, 6144, 0, 0, 0, 0),
+    (0, 0, 0, 0, 14336, 32704, 10480, 10160, 14112, 12352, 4288, 4480, 6400, 2560, 3584, 3072, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 32736, 31200, 28512, 9792, 12480, 4224, 6528, 2304, 3840, 1536, 1536, 0, 0, 0, 0),
+    (0, 0, 0, 0, 448, 8160, 61760, 57152, 18112, 8384, 12416, 6272, 3456, 3328, 1792, 512, 0, 0, 0, 0),
+    (0, 0, 0, 0, 960, 4032, 31424, 128704, 56512, 24768, 12480, 6272, 3200, 1664, 896, 384, 0, 0, 0, 0),
+    (0, 0, 0, 384, 896, 3712, 16000, 58496, 130176, 98496, 24768, 14528, 3264, 1728, 448, 0, 0, 0, 0, 0),
+    (0, 0, 0, 768, 1792, 7424, 13568, 28032, 64640, 120960, 114880, 28864, 7744, 1984, 192, 0, 0, 0, 0, 0),
+    (0, 0, 0, 1536, 3584, 7936, 15616, 28032, 23680, 63680, 98496, 127040, 16224, 992, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 3072, 7168, 6656, 15104, 10496, 27008, 63680, 57408, 98336, 131040, 2016, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 4096, 6144, 15360, 13824, 15104, 31104, 22720, 61536, 49200, 65520, 65024, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 12288, 15360, 9728, 29440, 20864, 22624, 22576, 61680, 53120, 64512, 16384, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 28672, 27648, 26368, 29120, 22640, 22640, 29120, 25344, 31744, 28672, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 49152, 64512, 53184, 61680, 22576, 22752, 20864, 29440, 9728, 14336, 12288, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 65024, 65520, 49200, 61536, 22720, 31104, 15104, 13824, 15360, 6144, 4096, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 2016, 131040, 98336, 57408, 63680, 27008, 10496, 15104, 6656, 7168, 3072, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 992, 8032, 127040, 98496, 63680, 23680, 28032, 14592, 7936, 3584, 1536, 0, 0, 0),
+    (0, 0, 0, 0, 0, 192, 1984, 7744, 28864, 114880, 129152, 64640, 28032, 13696, 7424, 1792, 768, 0, 0, 0),
+    (0, 0, 0, 0, 0, 448, 1728, 3264, 14528, 24768, 98496, 130176, 58496, 16000, 3712, 1920, 384, 0, 0, 0),
+    (0, 0, 0, 0, 384, 896, 1664, 3200, 6272, 12416, 24768, 56512, 130752, 31424, 4032, 960, 0, 0, 0, 0),
+    (0, 0, 0, 0, 768, 1792, 1408, 2432, 6272, 12416, 8384, 18112, 56896, 61760, 16352, 480, 0, 0, 0, 0),
+    (0, 0, 0, 0, 1536, 1536, 2304, 2304, 4480, 4224, 8256, 9792, 20320, 31200, 32736, 8064, 3328, 1536, 0, 0),
+    (0, 0, 0, 0, 3072, 3584, 2560, 4352, 4480, 4288, 12352, 13856, 12208, 10480, 32704, 15552, 1920, 768, 0, 0),
+    (0, 0, 0, 0, 6144, 7168, 5632, 4864, 4480, 12480, 12384, 13232, 14072, 13792, 16320, 15936, 960, 192, 0, 0),
+    (0, 0, 0, 0, 4096, 14336, 13824, 13056, 12736, 12384, 12304, 5112, 4720, 6112, 6048, 7968, 6624, 0, 0, 0),
+    (0, 0, 0, 0, 0, 12288, 15360, 10112, 12512, 12344, 4600, 5104, 4976, 2800, 2992, 4080, 3168, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 31744, 12224, 8440, 12312, 4592, 5040, 7024, 2520, 4056, 2032, 1536, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 32256, 32760, 16408, 8304, 12784, 6520, 2408, 3532, 1528, 896, 256, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 1008, 65520, 49200, 24816, 12728, 6504, 3564, 1784, 960, 448, 128, 0, 0, 0),
+    (0, 0, 0, 0, 0, 32, 1008, 7984, 57584, 49592, 29092, 6308, 3324, 1648, 448, 192, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 224, 864, 3184, 12536, 49588, 57780, 12536, 3184, 864, 224, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 192, 448, 1632, 3320, 14508, 29100, 49592, 24816, 7984, 1008, 32, 0, 0, 0, 0, 0),
+    (0, 0, 0, 128, 448, 960, 1784, 3564, 6504, 12728, 24816, 49200, 65520, 2032, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 256, 896, 1528, 3532, 2408, 6520, 12784, 8304, 16408, 32760, 32256, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 1536, 2032, 4088, 3032, 7024, 5040, 4592, 12312, 8440, 12160, 31744, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 3168, 4064, 2960, 6896, 7024, 4592, 4344, 12344, 12512, 10112, 15360, 12288, 0, 0, 0, 0, 0),
+    (0, 0, 64, 6624, 7968, 6048, 6112, 4720, 5112, 12336, 12384, 12736, 13056, 13824, 14336, 0, 0, 0, 0, 0),
+    (0, 0, 192, 960, 15936, 16320, 13792, 14072, 13232, 12384, 12480, 4480, 4864, 5632, 7168, 6144, 0, 0, 0, 0),
+    (0, 0, 768, 1408, 15552, 32704, 10480, 12208, 13856, 12352, 4288, 4480, 6400, 2560, 3584, 3072, 0, 0, 0, 0),
+    (0, 0, 1536, 2304, 7040, 32736, 31200, 28448, 9792, 8256, 4224, 4224, 2304, 2304, 1536, 1536, 0, 0, 0, 0),
+    (0, 0, 3072, 4608, 13248, 16352, 61760, 57152, 20160, 8384, 12416, 6272, 2176, 1280, 1792, 512, 0, 0, 0, 0),
+    (0, 0, 4096, 15360, 10176, 16320, 64128, 128704, 56512, 24768, 12480, 6272, 3200, 1664, 896, 384, 0, 0, 0, 0),
+    (0, 0, 0, 31104, 20352, 24192, 32384, 58496, 130176, 32896, 24704, 14528, 3264, 1728, 448, 0, 0, 0, 0, 0),
+    (0, 0, 0, 25344, 65280, 56576, 29952, 60544, 64640, 129152, 114880, 28864, 7744, 960, 192, 0, 0, 0, 0, 0),
+    (0, 0, 0, 1536, 65024, 130816, 113920, 60800, 56448, 63616, 98496, 122944, 8032, 992, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 2048, 7168, 129536, 80640, 92416, 125312, 63680, 57408, 98336, 131040, 480, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 4096, 14336, 15360, 259584, 226048, 92544, 121024, 61536, 49200, 65520, 65024, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 12288, 14336, 58880, 127744, 219584, 252128, 120880, 61536, 53120, 64512, 16384, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 28672, 27648, 58112, 127168, 186416, 186416, 127168, 59136, 31744, 28672, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 16384, 64512, 53120, 57456, 120880, 219232, 217472, 127744, 28160, 15360, 12288, 0, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 65024, 65520, 49200, 61536, 121024, 223616, 228096, 259584, 15360, 6144, 4096, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 2016, 131040, 98336, 57408, 63680, 125312, 92416, 211456, 129536, 7168, 2048, 0, 0, 0),
+    (0, 0, 0, 0, 0, 0, 992, 8032, 127040, 98496, 61568, 55424, 60800, 113920, 114432, 56832, 1536, 0, 0, 0),
+    (0, 0, 0, 0, 0, 192, 960, 7744, 28864, 114880, 129152, 64640, 60800, 62720, 56576, 65280, 25344, 0, 0, 0),
+    (0, 0, 0, 0, 0, 448, 1728, 3264, 14528, 24768, 32896, 130176, 58496, 32384, 24192, 20352, 31104, 0, 0, 0),
+    (0, 0, 0, 0, 384, 896, 1664, 3200, 6272, 12480, 24768, 56512, 128704, 64192, 16320, 10176, 15360, 6144, 0, 0),
+    (0, 0, 0, 0, 768, 1792, 1280, 2176, 6272, 12416, 8384, 18112, 65088, 61760, 16352, 13248, 7680, 3072, 0, 0),
+)
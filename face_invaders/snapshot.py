@@ -0,0 +1,98 @@
+"""Compact binary snapshots of a Face Invaders game in progress."""
+
+from os import remove
+from struct import calcsize, pack_into, unpack_from
+
+# Snapshot layout: header, ship, then each face and bullet as fixed-size
+# little-endian records. Positions and velocities are Q8 pixels (per
+# second), with the movement remainders carried below one Q8 unit so a
+# resumed game moves exactly as it would have, and ages are time units.
+# The layout version identifies the sprite sheets and playfield the
+# snapshot was saved with.
+MAGIC = b'FIS2'
+HEADER = '<4sIIBHHH'        # magic, layout version, score, lives, level, face count, bullet count
+SHIP = '<iiiiHHIHB'         # fx, fy, vx, vy, rx, ry, heading_fx, heading_rem, hidden
+FACE = '<iiiiHHffBBBB'      # fx, fy, vx, vy, rx, ry, v, angle, size, variant, flip_x, frame_phase
+BULLET = '<iiiiHHH'         # fx, fy, vx, vy, rx, ry, age
+
+HEADER_SIZE = calcsize(HEADER)
+SHIP_SIZE = calcsize(SHIP)
+FACE_SIZE = calcsize(FACE)
+BULLET_SIZE = calcsize(BULLET)
+
+
+def layout_version(values):
+    '''
+    Return a 32-bit FNV-1a hash of the non-negative integer asset and
+    playfield ``values`` a snapshot depends on
+    '''
+    version = 2166136261
+    for value in values:
+        for shift in (0, 8, 16, 24):
+            version = ((version ^ (value >> shift & 255)) * 16777619) & 0xFFFFFFFF
+    return version
+
+def pack_snapshot(layout, score, lives, level, ship, faces, bullets):
+    '''
+    Return the snapshot bytes of a game with layout version ``layout``,
+    given its ship as a SHIP tuple and iterables of FACE and BULLET tuples
+    '''
+    faces = tuple(faces)
+    bullets = tuple(bullets)
+    data = bytearray(HEADER_SIZE + SHIP_SIZE + len(faces) * FACE_SIZE + len(bullets) * BULLET_SIZE)
+    pack_into(HEADER, data, 0, MAGIC, layout, score, lives, level, len(faces), len(bullets))
+    offset = HEADER_SIZE
+    pack_into(SHIP, data, offset, *ship)
+    offset += SHIP_SIZE
+    for face in faces:
+        pack_into(FACE, data, offset, *face)
+        offset += FACE_SIZE
+    for bullet in bullets:
+        pack_into(BULLET, data, offset, *bullet)
+        offset += BULLET_SIZE
+    return data
+
+def unpack_snapshot(data, layout):
+    '''
+    Return (score, lives, level, ship, faces, bullets) from snapshot bytes,
+    or None if they do not hold a complete snapshot with layout version
+    ``layout``
+    '''
+    if len(data) < HEADER_SIZE + SHIP_SIZE:
+        return None
+    magic, version, score, lives, level, face_count, bullet_count = unpack_from(HEADER, data, 0)
+    if magic != MAGIC or version != layout or \
+       len(data) != HEADER_SIZE + SHIP_SIZE + face_count * FACE_SIZE + bullet_count * BULLET_SIZE:
+        return None
+    offset = HEADER_SIZE
+    ship = unpack_from(SHIP, data, offset)
+    offset += SHIP_SIZE
+    faces = []
+    for i in range(face_count):
+        faces.append(unpack_from(FACE, data, offset))
+        offset += FACE_SIZE
+    bullets = []
+    for i in range(bullet_count):
+        bullets.append(unpack_from(BULLET, data, offset))
+        offset += BULLET_SIZE
+    return score, lives, level, ship, faces, bullets
+
+def save_snapshot(path, data):
+    """Write snapshot bytes to storage in a single write."""
+    with open(path, 'wb') as file:
+        file.write(data)
+
+def read_snapshot(path):
+    """Return the snapshot bytes saved at ``path``, or None if there are none."""
+    try:
+        with open(path, 'rb') as file:
+            return file.read()
+    except OSError:
+        return None
+
+def remove_snapshot(path):
+    """Delete a saved snapshot if one exists."""
+    try:
+        remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,15 @@
+"""Sound manifest generated by tools/optimize_sounds.py; do not edit."""
+
+# Sound name: (mixer voice, priority, file path)
+SOUNDS = {
+    'continue': (2, 2, 'face_invaders/snds/continue.wav'),
+    'game_over': (2, 3, 'face_invaders/snds/game_over.wav'),
+    'new_ship': (2, 2, 'face_invaders/snds/new_ship.wav'),
+    'bullet': (0, 0, 'face_invaders/snds/bullet.wav'),
+    'click': (0, 1, 'face_invaders/snds/click.wav'),
+    'ship_thrust': (0, 0, 'face_invaders/snds/ship_thrust.wav'),
+    'ship_explosion': (1, 3, 'face_invaders/snds/ship_explosion.wav'),
+    'explosion_small': (1, 1, 'face_invaders/snds/face_explosion_small.wav'),
+    'explosion_medium': (1, 1, 'face_invaders/snds/face_explosion_medium.wav'),
+    'explosion_large': (1, 2, 'face_invaders/snds/face_explosion_large.wav'),
+}
@@ -1,38 +1,69 @@
 """Core game object classes for Face Invaders."""
 
-from math import sin, cos, radians, pi, sqrt, atan2, degrees
-from time import monotonic
+from math import pi
 
 # Import utilities
-from face_invaders.utils import find_overlap_bounds
+from face_invaders.utils import find_overlap_bounds, masks_overlap, coarse_overlaps
+from face_invaders.animation import AnimationClock
+from face_invaders.fixed import FixedMotion, FRAC_BITS, TIME_BITS, TIME_ONE, TIME_MASK, ANGLE_STEPS, \
+    QUARTER_STEPS, sin_q14_fine, scale_q14
+from face_invaders import ship_sprites
 
-class SpaceTilegrid:
+class SpaceTilegrid(FixedMotion):
     '''
     Base class for all game objects with tilegrid representation
     '''
 
-    def __init__(self, tilegrid, display, x=0, y=0, v=0, angle=0):
+    def __init__(self, tilegrid, world, x=0, y=0, v=0, angle=0, masks=None,
+                 flipped_masks=None, frame_count=1, frame_phase=0, coarse_levels=()):
         """Initialize the tilegrid-backed game object."""
 
         # Tilegrid
         self.tilegrid = tilegrid
 
-        # Display object - dimensions used for position wrapping
-        self.display = display
+        # Collision masks per tile index, unflipped and flipped around x axis
+        self.masks = masks
+        self.flipped_masks = flipped_masks
 
-        # Object movement parameters
-        self.x = x
-        self.y = y
-        self.v = v
-        self.angle = angle
+        # Coarse block occupancy levels as (name, block, masks, flipped_masks)
+        self.coarse_levels = coarse_levels
+
+        # Animation frames following the initial tile, and this object's
+        # offset into the shared animation cycle
+        self.base_tile = tilegrid[0]
+        self.frame_count = frame_count
+        self.frame_phase = frame_phase
+
+        # Playfield bounds used for position wrapping
+        self.world = world
 
         # Pixel height and width of the tilegrid
         self.display_width = tilegrid.width * tilegrid.tile_width
         self.display_height = tilegrid.height * tilegrid.tile_height
 
+        # Precomputed wrap extents for the tilegrid size
+        self.half_width, span_x, self.half_height, span_y = world.wrap_extents(
+            self.display_width,
+            self.display_height
+        )
+
+        # Object movement parameters, with speed and angle kept as given
+        self.v = v
+        self.angle = angle
+        self.init_motion(x, y, v, angle, self.half_width, span_x, self.half_height, span_y)
+
+        # Q8 half extents of the collision box
+        self.extent_fx = self.half_fx
+        self.extent_fy = self.half_fy
+
         # Flag designating object as hit
         self.is_hit = False
 
+    @property
+    def layer(self):
+        """Display layer of the object."""
+        return self.tilegrid
+
     @property
     def hidden(self):
         """Whether the object's tilegrid is hidden."""
@@ -43,6 +74,24 @@ class SpaceTilegrid:
         """Show or hide the object's tilegrid."""
         self.tilegrid.hidden = hide
 
+    def place(self, camera, cull=True):
+        '''
+        Position the tilegrid relative to the camera view. When culling,
+        the tilegrid is hidden while it lies outside the view.
+        '''
+        half_width = self.half_width
+        half_height = self.half_height
+        x = camera.view_x(self.x, half_width)
+        y = camera.view_y(self.y, half_height)
+        tilegrid = self.tilegrid
+        tilegrid.x = x - half_width
+        tilegrid.y = y - half_height
+        if cull:
+            visible = -half_width < x < camera.view_width + half_width and \
+                      -half_height < y < camera.view_height + half_height
+            if tilegrid.hidden == visible:
+                tilegrid.hidden = not visible
+
     def get_bounds(self):
         '''
         Return display bounds as (xmin, xmax, ymin, ymax)
@@ -55,6 +104,36 @@ class SpaceTilegrid:
 
         return xmin, xmax, ymin, ymax
 
+    def get_mask(self):
+        '''
+        Return collision mask of the displayed tile as (rows, x, y), or None
+        if no masks are available for the tilegrid
+        '''
+        if self.masks is None or self.tilegrid.width * self.tilegrid.height != 1:
+            return None
+        masks = self.flipped_masks if self.tilegrid.flip_x else self.masks
+        return masks[self.tilegrid[0]], self.tilegrid.x, self.tilegrid.y
+
+    def coarse_hit(self, level, bounds):
+        '''
+        Return True if an occupied block of the displayed tile at coarse
+        ``level`` lies within bounds, or if the level is unavailable
+        '''
+        if level >= len(self.coarse_levels) or self.tilegrid.width * self.tilegrid.height != 1:
+            return True
+        name, block, masks, flipped_masks = self.coarse_levels[level]
+        if self.tilegrid.flip_x:
+            masks = flipped_masks
+        return coarse_overlaps(masks[self.tilegrid[0]], block, self.tilegrid.x, self.tilegrid.y, bounds)
+
+    def set_frame(self, frame):
+        '''
+        Show an animation frame of the shared animation cycle
+        '''
+        tile = self.base_tile + (frame + self.frame_phase) % self.frame_count
+        if self.tilegrid[0] != tile:
+            self.tilegrid[0] = tile
+
     def get_pixel_locs(self, bounds):
         '''
         Return array of pixel locations where the bitmap represents the image
@@ -133,31 +212,55 @@ class Ship(SpaceTilegrid):
     Player spaceship class
     '''
 
-    def __init__(self, tilegrid, display, x=0, y=0, v=0, angle=0, heading=0):
+    def __init__(self, tilegrid, world, x=0, y=0, v=0, angle=0, heading=0, coarse_levels=()):
         """Create the player's ship."""
 
-        super().__init__(tilegrid, display, x=x, y=y, v=v, angle=angle)
+        super().__init__(tilegrid, world, x=x, y=y, v=v, angle=angle, masks=ship_sprites.MASKS,
+                         coarse_levels=coarse_levels)
+
+        # Heading to tile lookup table generated with the sprite sheet. The
+        # heading is kept in Q8 sprite heading steps
+        self.heading_tiles = ship_sprites.HEADING_TILES
+        self.heading_units = ship_sprites.HEADING_STEPS << FRAC_BITS
+        self.heading_scale = self.heading_units / (2 * pi)
+
+        # Ship heading angle controlling, with turning carried between updates
+        self.heading_fx = int(heading * self.heading_scale) % self.heading_units
+        self.heading_rem = 0
 
-        # Ship heading angle controlling
-        self.heading = heading
+        # 1/256 trig table steps per turn, for scaling heading units to them
+        self.heading_positions = ANGLE_STEPS << 8
 
         # Maximum ship velocity
         self.vmax = 110
+        self.vmax_fx = self.vmax << FRAC_BITS
+        self.bound_vx = self.vmax_fx
+        self.bound_vy = self.vmax_fx
 
         # Turning flag; -1 Left, 0 No Turning; 1 Right
         self.turning = 0
 
-        # Delta angle applied while turning on each update
+        # Delta angle applied per second while turning, in heading units
         self.turning_angle = pi / 36 * 60
+        self.turning_fx = int(self.turning_angle * self.heading_scale)
 
         # Thrusting flag
         self.thrusting = 0
 
-        # Thrust added on each update while thrusting
+        # Thrust added per second while thrusting
         self.thrust_value = 80
+        self.thrust_fx = self.thrust_value << FRAC_BITS
 
-        # Dropoff factor applied on each update while not thrusting
+        # Thrust flame animation, alternating flame on/off frames
+        self.thrust_clock = AnimationClock(0.05, 2)
+
+        # Dropoff factor applied per second while not thrusting, with Q12
+        # decay factors per elapsed time unit up to a quarter second
         self.v_dropoff = .5
+        self.decay = tuple(
+            int((1 << 12) * (1 - self.v_dropoff) ** (t / TIME_ONE) + 0.5)
+            for t in range(TIME_ONE // 4 + 1)
+        )
 
         # Number of tiles per row in tilegrid bitmap
         self.num_tiles = self.tilegrid.bitmap.width // self.tilegrid.tile_width
@@ -165,47 +268,51 @@ class Ship(SpaceTilegrid):
         # Update the ship position
         self.update()
 
-    def update(self, delta_time=0):
+    @property
+    def heading(self):
+        """Ship heading in radians."""
+        return self.heading_fx / self.heading_scale
+
+    def update(self, dt=0):
         '''
-        Update position based on heading, thrust, and delta time
+        Update position based on heading, thrust, and elapsed time units
         '''
         # Update ship heading based on turning status and apply angle wrapping
         if self.turning != 0:
-            self.heading += self.turning * self.turning_angle * delta_time
-            self.heading %= 2 * pi
-
-        # Calculate current velocity components
-        vx = sin(self.angle) * self.v
-        vy = -cos(self.angle) * self.v
+            turn = self.turning * self.turning_fx * dt + self.heading_rem
+            self.heading_rem = turn & TIME_MASK
+            self.heading_fx = (self.heading_fx + (turn >> TIME_BITS)) % self.heading_units
 
         # Update velocity components based on thrusting status
+        vx = self.vx
+        vy = self.vy
         if self.thrusting:
-            thrust_x = sin(self.heading) * self.thrust_value * delta_time
-            thrust_y = -cos(self.heading) * self.thrust_value * delta_time
-            vx = max(min(vx + thrust_x, self.vmax), -self.vmax)
-            vy = max(min(vy + thrust_y, self.vmax), -self.vmax)
-        else:
-            vx *= (1 - self.v_dropoff) ** delta_time
-            vy *= (1 - self.v_dropoff) ** delta_time
+            thrust = (self.thrust_fx * dt + (TIME_ONE >> 1)) >> TIME_BITS
+            position = self.heading_fx * self.heading_positions // self.heading_units
+            vmax = self.vmax_fx
+            vx = max(min(vx + scale_q14(thrust, sin_q14_fine(position)), vmax), -vmax)
+            vy = max(min(vy - scale_q14(thrust, sin_q14_fine(position + (QUARTER_STEPS << 8))), vmax), -vmax)
+        elif dt:
+            decay = self.decay[min(dt, len(self.decay) - 1)]
+            vx = (vx * decay) >> 12 if vx >= 0 else -((-vx * decay) >> 12)
+            vy = (vy * decay) >> 12 if vy >= 0 else -((-vy * decay) >> 12)
+        self.vx = vx
+        self.vy = vy
 
         # Update ship position and apply screen wrapping
-        self.x = ((self.x + vx * delta_time + self.display_width/2) % (self.display.width + self.display_width)) - self.display_width/2
-        self.y = ((self.y + vy * delta_time + self.display_height/2) % (self.display.height + self.display_height)) - self.display_height/2
+        self.move(dt)
 
         # Update tilegrid position centered on the ship position
-        self.tilegrid.x = int(self.x - self.display_width/2)
-        self.tilegrid.y = int(self.y - self.display_height/2)
-
-        # Recalculate velocity and angle
-        self.v = sqrt(vx**2 + vy**2)
-        self.angle = atan2(vx, -vy)
+        self.tilegrid.x = (self.fx - self.half_fx) >> FRAC_BITS
+        self.tilegrid.y = (self.fy - self.half_fy) >> FRAC_BITS
 
-        # Determine tile index based on current heading
-        tile_idx = round(degrees(self.heading) / (360 / self.num_tiles)) % self.num_tiles
+        # Look up tile index based on current heading
+        tile_idx = self.heading_tiles[self.heading_fx >> FRAC_BITS]
 
-        # Determine tile index offset based on thrust state
-        if self.thrusting and ((monotonic() % 1) // 0.05 % 2) == 0:
-            tile_offset = 1
+        # Determine tile index offset based on thrust state and flame frame
+        if self.thrusting:
+            self.thrust_clock.advance(dt / TIME_ONE)
+            tile_offset = 1 if self.thrust_clock.frame == 0 else 0
         else:
             tile_offset = 0
 
@@ -217,14 +324,15 @@ class Ship(SpaceTilegrid):
         Reset ship position and movement parameters
         '''
         # Set position and flag values
-        self.x = x
-        self.y = y
-        self.v = 0
+        self.set_position(x, y)
+        self.vx = 0
+        self.vy = 0
         self.thrusting = 0
         self.turning = 0
-        self.angle = radians(0)
-        self.heading = radians(0)
+        self.heading_fx = 0
+        self.heading_rem = 0
         self.is_hit = False
+        self.thrust_clock.reset()
 
         # Update the ship position
         self.update()
@@ -235,32 +343,50 @@ class Face(SpaceTilegrid):
     Enemy face class (renamed from Asteroid)
     '''
 
-    def __init__(self, tilegrid, display, x=0, y=0, v=0, angle=0, size=1):
+    # Narrow phase tests and hits per level, as {name: [tests, hits]},
+    # since the counters were last cleared; only counted while profiling
+    count_levels = False
+    level_counts = {}
+
+    def __init__(self, tilegrid, world, x=0, y=0, v=0, angle=0, size=1, variant=0,
+                 masks=None, flipped_masks=None, frame_count=1, frame_phase=0, coarse_levels=()):
         """Create an enemy face object."""
 
-        super().__init__(tilegrid, display, x=x, y=y, v=v, angle=angle)
+        super().__init__(tilegrid, world, x=x, y=y, v=v, angle=angle, masks=masks,
+                         flipped_masks=flipped_masks, frame_count=frame_count, frame_phase=frame_phase,
+                         coarse_levels=coarse_levels)
 
         # Size of face (1-3)
         self.size = size
 
+        # Sprite sheet row of the personalized face
+        self.variant = variant
+
+        # Time of the next scheduled collision check against the ship
+        self.ship_check_time = 0
+
         # Update the face position
         self.update()
 
-    def update(self, delta_time=0):
+    def update(self, dt=0):
         '''
-        Update face position and apply screen wrapping
+        Update face position by elapsed time units and apply screen wrapping
         '''
-        # Calculate velocity components
-        vx = sin(self.angle) * self.v * delta_time
-        vy = -cos(self.angle) * self.v * delta_time
-
         # Update position and apply screen wrapping
-        self.x = ((self.x + vx + self.display_width/2) % (self.display.width + self.display_width)) - self.display_width/2
-        self.y = ((self.y + vy + self.display_height/2) % (self.display.height + self.display_height)) - self.display_height/2
+        self.move(dt)
 
         # Update tilegrid position centered on the face position
-        self.tilegrid.x = int(self.x - self.display_width/2)
-        self.tilegrid.y = int(self.y - self.display_height/2)
+        self.tilegrid.x = (self.fx - self.half_fx) >> FRAC_BITS
+        self.tilegrid.y = (self.fy - self.half_fy) >> FRAC_BITS
+
+    def count_level(self, name, hit):
+        """Count a narrow phase test at level ``name`` and whether it hit."""
+        counts = Face.level_counts.get(name)
+        if counts is None:
+            counts = Face.level_counts[name] = [0, 0]
+        counts[0] += 1
+        if hit:
+            counts[1] += 1
 
     def detect_hit(self, obj):
         '''
@@ -272,9 +398,34 @@ class Face(SpaceTilegrid):
         overlap_bounds = find_overlap_bounds(self_bounds, obj_bounds)
 
         # Return if no overlap exists
+        counting = Face.count_levels
+        if counting:
+            self.count_level('bounds', overlap_bounds is not None)
         if overlap_bounds == None:
             return False
 
+        # Return if either object has no occupied block within the overlap,
+        # checking the coarsest levels first
+        for level in range(len(self.coarse_levels)):
+            hit = self.coarse_hit(level, overlap_bounds) and obj.coarse_hit(level, overlap_bounds)
+            if counting:
+                self.count_level(self.coarse_levels[level][0], hit)
+            if not hit:
+                return False
+
+        # Compare precomputed collision masks when both objects have them
+        self_mask = self.get_mask()
+        obj_mask = obj.get_mask()
+        if self_mask and obj_mask:
+            hit = masks_overlap(self_mask, obj_mask, overlap_bounds)
+            if counting:
+                self.count_level('pixel', hit)
+            if hit:
+                self.is_hit = True
+                obj.is_hit = True
+                return True
+            return False
+
         # Get non-background pixel locations within overlap bounds
         self_pixel_locs = self.get_pixel_locs(overlap_bounds)
         obj_pixel_locs = obj.get_pixel_locs(overlap_bounds)
@@ -283,8 +434,12 @@ class Face(SpaceTilegrid):
         for self_pixel in self_pixel_locs:
             for obj_pixel in obj_pixel_locs:
                 if self_pixel == obj_pixel:
+                    if counting:
+                        self.count_level('pixel', True)
                     self.is_hit = True
                     obj.is_hit = True
                     return True
 
+        if counting:
+            self.count_level('pixel', False)
         return False
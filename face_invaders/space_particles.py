@@ -1,73 +1,95 @@
 """Particle effect classes used to draw explosions and bullets."""
 
-from math import sin, cos
 from vectorio import Rectangle, Circle
 from adafruit_display_shapes.line import Line
+from face_invaders.fixed import FixedMotion, FRAC_BITS, TIME_ONE
 
-class SpaceParticle:
+class SpaceParticle(FixedMotion):
     '''
     Base class for all particle effects in the game
     '''
-    def __init__(self, x, y, v, angle, display, palette, max_age=0.7, color_index=0):
+    def __init__(self, x, y, v, angle, world, palette, max_age=0.7, color_index=0):
         """Initialize a particle effect."""
 
-        # Display object - dimensions used for position wrapping
-        self.display = display
+        # Playfield bounds used for position wrapping
+        self.world = world
 
-        # Object movement parameters
-        self.x = x
-        self.y = y
+        # Object movement parameters, wrapping within the playfield
         self.v = v
         self.angle = angle
+        self.init_motion(x, y, v, angle, 0, world.width, 0, world.height)
 
         # Particle color palette and selection
         self.palette = palette
         self.color_index = color_index
 
-        # Particle life parameters (seconds)
+        # Particle life parameters (seconds), with age and lifetime counted
+        # in time units
         self.age = 0
         self.max_age = max_age
+        self.lifetime = int(max_age * TIME_ONE)
 
-        # Particle shape object
+        # Elapsed time units not yet applied while updating at reduced rate
+        self.deferred_time = 0
+
+        # Particle shape object and the distance it may extend past its
+        # position, used when culling outside the camera view
         self.shape = None
+        self.view_margin = 0
+
+    @property
+    def layer(self):
+        """Display layer of the particle."""
+        return self.shape
 
-    def update(self, delta_time=0):
+    def update(self, dt=0):
         '''
-        Update particle position and age
+        Update particle position and age by elapsed time units
         '''
-        # Calculate velocity components
-        vx = sin(self.angle) * self.v * delta_time
-        vy = -cos(self.angle) * self.v * delta_time
-
         # Update position and apply screen wrapping
-        self.x = (self.x + vx) % self.display.width
-        self.y = (self.y + vy) % self.display.height
+        self.move(dt)
 
         # Update shape position
-        self.shape.x = int(self.x)
-        self.shape.y = int(self.y)
+        self.shape.x = self.x
+        self.shape.y = self.y
 
         # Update age
-        self.age += delta_time
+        self.age += dt
+
+    def place(self, camera):
+        '''
+        Position the shape relative to the camera view, hiding it while it
+        lies outside the view
+        '''
+        margin = self.view_margin
+        x = camera.view_x(self.x, margin)
+        y = camera.view_y(self.y, margin)
+        shape = self.shape
+        shape.x = x
+        shape.y = y
+        visible = -margin < x < camera.view_width + margin and -margin < y < camera.view_height + margin
+        if shape.hidden == visible:
+            shape.hidden = not visible
 
     def check_expired(self):
         '''
         Check if particle has exceeded its maximum age
         '''
-        return self.age > self.max_age
+        return self.age > self.lifetime
 
 
 class CircleParticle(SpaceParticle):
     '''
     Circular particle effect
     '''
-    def __init__(self, x, y, radius, v, angle, display, palette, max_age=0.9, color_index=0):
+    def __init__(self, x, y, radius, v, angle, world, palette, max_age=0.9, color_index=0):
         """Create a circular particle effect."""
 
-        super().__init__(x, y, v, angle, display, palette, max_age=max_age, color_index=color_index)
+        super().__init__(x, y, v, angle, world, palette, max_age=max_age, color_index=color_index)
 
         # Circle radius
         self.radius = radius
+        self.view_margin = radius
 
         # Circle display object
         self.shape = Circle(
@@ -83,14 +105,15 @@ class RectParticle(SpaceParticle):
     '''
     Rectangular particle effect
     '''
-    def __init__(self, x, y, width, height, v, angle, display, palette, max_age=0.9, color_index=0):
+    def __init__(self, x, y, width, height, v, angle, world, palette, max_age=0.9, color_index=0):
         """Create a rectangular particle effect."""
 
-        super().__init__(x, y, v, angle, display, palette, max_age=max_age, color_index=color_index)
+        super().__init__(x, y, v, angle, world, palette, max_age=max_age, color_index=color_index)
 
         # Rectangle dimensions
         self.width = width
         self.height = height
+        self.view_margin = max(width, height)
 
         # Rectangle display object
         self.shape = Rectangle(
@@ -107,48 +130,46 @@ class LineParticle(SpaceParticle):
     '''
     Line segment particle effect
     '''
-    def __init__(self, x0, y0, x1, y1, v, angle, display, palette, color_index=0, max_age=0.9):
+    def __init__(self, x0, y0, x1, y1, v, angle, world, palette, color_index=0, max_age=0.9):
         """Create a line segment particle effect."""
 
-        super().__init__(x0, y0, v, angle, display, palette, max_age=max_age, color_index=color_index)
+        super().__init__(x0, y0, v, angle, world, palette, max_age=max_age, color_index=color_index)
         self.x0 = x0
         self.y0 = y0
         self.x1 = x1
         self.y1 = y1
         self.width = abs(self.x0 - self.x1)
         self.height = abs(self.y0 - self.y1)
+        self.view_margin = int(max(self.width, self.height))
         self.shape = Line(int(self.x0), int(self.y0), int(self.x1), int(self.y1), color=self.palette[self.color_index])
-        self.x = self.shape.x
-        self.y = self.shape.y
 
-    def update(self, delta_time=0):
-        '''
-        Update line particle position and age
-        '''
-        # Update the line position
-        vx = sin(self.angle) * self.v * delta_time
-        vy = -cos(self.angle) * self.v * delta_time
-        self.x = ((self.x + vx + self.width/2) % (self.display.width + self.width)) - self.width/2
-        self.y = ((self.y + vy + self.height/2) % (self.display.height + self.height)) - self.height/2
-        self.shape.x = int(self.x)
-        self.shape.y = int(self.y)
-
-        # Update age
-        self.age += delta_time
+        # Move from the line's upper left corner using wrap extents for the line size
+        half_width, span_x, half_height, span_y = world.wrap_extents(
+            int(self.width),
+            int(self.height)
+        )
+        self.init_motion(self.shape.x, self.shape.y, v, angle, half_width, span_x, half_height, span_y)
 
 
 class Bullet(CircleParticle):
     '''
     Player bullet projectile
     '''
-    def __init__(self, x, y, radius, v, angle, display, palette, max_age=0.6, color_index=0):
+    def __init__(self, x, y, radius, v, angle, world, palette, max_age=0.6, color_index=0):
         """Create a player bullet."""
 
-        super().__init__(x, y, radius, v, angle, display, palette, max_age=max_age, color_index=color_index)
+        super().__init__(x, y, radius, v, angle, world, palette, max_age=max_age, color_index=color_index)
 
         # Collision status flag
         self.is_hit = False
 
+        # Q8 half extents of the collision box
+        self.extent_fx = radius << FRAC_BITS
+        self.extent_fy = radius << FRAC_BITS
+
+        # Times of the next scheduled collision checks keyed by face serial
+        self.face_checks = {}
+
     def get_bounds(self):
         '''
         Get bullet bounds for collision detection
@@ -161,6 +182,19 @@ class Bullet(CircleParticle):
 
         return xmin, xmax, ymin, ymax
 
+    def coarse_hit(self, level, bounds):
+        '''
+        Return True as the single pixel bullet fills its bounds at every
+        coarse collision level
+        '''
+        return True
+
+    def get_mask(self):
+        '''
+        Get single pixel collision mask as (rows, x, y)
+        '''
+        return (1,), int(self.shape.x), int(self.shape.y)
+
     def get_pixel_locs(self, overlap_bounds):
         '''
         Get pixel locations for collision detection
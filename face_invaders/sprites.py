@@ -0,0 +1,121 @@
+"""Sprite sheet metadata and collision masks for Face Invaders."""
+
+from displayio import TileGrid
+
+def build_tile_masks(bitmap, tile_width, tile_height):
+    '''
+    Return collision masks for every tile of a sprite sheet, ordered by
+    tile index. Each mask is a tuple with one bitmask per tile row, where
+    bit n is set if column n differs from the sheet's background value.
+    '''
+    # Determine background value
+    background_value = bitmap[0, 0]
+
+    masks = []
+    for tile_y in range(0, bitmap.height - tile_height + 1, tile_height):
+        for tile_x in range(0, bitmap.width - tile_width + 1, tile_width):
+            rows = []
+            for y in range(tile_y, tile_y + tile_height):
+                row = 0
+                for x in range(tile_width):
+                    if bitmap[tile_x + x, y] != background_value:
+                        row |= 1 << x
+                rows.append(row)
+            masks.append(tuple(rows))
+
+    return masks
+
+def flip_masks(masks, tile_width):
+    """Return ``masks`` mirrored around the vertical axis of the tile."""
+    flipped = []
+    for rows in masks:
+        flipped_rows = []
+        for row in rows:
+            flipped_row = 0
+            for x in range(tile_width):
+                if row & (1 << x):
+                    flipped_row |= 1 << (tile_width - 1 - x)
+            flipped_rows.append(flipped_row)
+        flipped.append(tuple(flipped_rows))
+
+    return flipped
+
+def build_coarse_masks(masks, tile_width, block):
+    '''
+    Return block occupancy masks for tile ``masks``, with one bitmask per
+    row of ``block`` pixel rows where bit n is set if any pixel of block
+    column n is opaque
+    '''
+    columns = (tile_width + block - 1) // block
+    block_bits = (1 << block) - 1
+    coarse = []
+    for rows in masks:
+        coarse_rows = []
+        for start in range(0, len(rows), block):
+            merged = 0
+            for row in rows[start:start + block]:
+                merged |= row
+            coarse_row = 0
+            for column in range(columns):
+                if (merged >> (column * block)) & block_bits:
+                    coarse_row |= 1 << column
+            coarse_rows.append(coarse_row)
+        coarse.append(tuple(coarse_rows))
+
+    return coarse
+
+def build_coarse_levels(masks, flipped_masks, tile_width, blocks):
+    '''
+    Return coarse collision levels for each block size in ``blocks``, as
+    (name, block, masks, flipped_masks) tuples in the given order
+    '''
+    levels = []
+    for block in blocks:
+        levels.append((
+            'block{}'.format(block),
+            block,
+            build_coarse_masks(masks, tile_width, block),
+            build_coarse_masks(flipped_masks, tile_width, block) if flipped_masks is not None else None
+        ))
+
+    return tuple(levels)
+
+
+class SpriteSheet:
+    '''
+    Sprite sheet of equal sized tiles, laid out with one row per sprite
+    variant and one column per animation frame
+    '''
+
+    def __init__(self, bitmap, palette, tile_width, tile_height, masks=None, coarse_blocks=()):
+        '''
+        Describe a loaded sheet, building collision masks if not given and
+        coarse collision levels for each block size in ``coarse_blocks``
+        '''
+
+        # Sheet bitmap, palette and tile size
+        self.bitmap = bitmap
+        self.palette = palette
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+
+        # Sheet layout
+        self.frame_count = bitmap.width // tile_width
+        self.variant_count = bitmap.height // tile_height
+
+        # Collision masks per tile, unflipped and flipped around x axis
+        self.masks = masks if masks is not None else build_tile_masks(bitmap, tile_width, tile_height)
+        self.flipped_masks = flip_masks(self.masks, tile_width)
+
+        # Block occupancy masks checked before the pixel masks
+        self.coarse_levels = build_coarse_levels(self.masks, self.flipped_masks, tile_width, coarse_blocks)
+
+    def tilegrid(self, variant=0, frame=0):
+        """Create a single tile TileGrid showing a frame of a variant."""
+        return TileGrid(
+            self.bitmap,
+            pixel_shader=self.palette,
+            tile_width=self.tile_width,
+            tile_height=self.tile_height,
+            default_tile=variant * self.frame_count + frame
+        )
@@ -24,3 +24,69 @@ def find_overlap_bounds(bounds_1, bounds_2):
     else:
         # No overlap
         return None
+
+
+def coarse_overlaps(rows, block, x, y, bounds):
+    '''
+    Return True if any occupied block of a coarse mask lies within bounds.
+
+    Parameters:
+    - rows: Tuple with one bitmask per block row, with bit n set for an
+      occupied block column n
+    - block: Block size in pixels
+    - x, y: Display coordinates of the mask's upper left corner
+    - bounds: Tuple of (xmin, xmax, ymin, ymax) limiting the checked region
+
+    Returns:
+    - True if an occupied block overlaps the region, otherwise False
+    '''
+    # Block range covering the region
+    column_min = max((bounds[0] - x) // block, 0)
+    column_max = (bounds[1] - 1 - x) // block
+    row_min = max((bounds[2] - y) // block, 0)
+    row_max = min((bounds[3] - 1 - y) // block, len(rows) - 1)
+    if column_max < column_min:
+        return False
+
+    # Check block rows within the column window
+    window = ((1 << (column_max - column_min + 1)) - 1) << column_min
+    for row in range(row_min, row_max + 1):
+        if rows[row] & window:
+            return True
+
+    return False
+
+def masks_overlap(mask_1, mask_2, bounds):
+    '''
+    Return True if two sprites share an opaque pixel within bounds.
+
+    Parameters:
+    - mask_1: Tuple of (rows, x, y) for first object, where rows holds one
+      bitmask per pixel row with bit n set for opaque column n, and x, y
+      are the display coordinates of the mask's upper left corner
+    - mask_2: Tuple of (rows, x, y) for second object
+    - bounds: Tuple of (xmin, xmax, ymin, ymax) limiting the compared region
+
+    Returns:
+    - True if any pixel is opaque in both masks, otherwise False
+    '''
+    rows_1, x_1, y_1 = mask_1
+    rows_2, x_2, y_2 = mask_2
+
+    # Limit the compared region to both masks
+    xmin = max(bounds[0], x_1, x_2)
+    xmax = bounds[1]
+    ymin = max(bounds[2], y_1, y_2)
+    ymax = min(bounds[3], y_1 + len(rows_1), y_2 + len(rows_2))
+    if xmin >= xmax or ymin >= ymax:
+        return False
+
+    # Align both masks to the region's left edge and compare rows
+    window = (1 << (xmax - xmin)) - 1
+    shift_1 = xmin - x_1
+    shift_2 = xmin - x_2
+    for y in range(ymin, ymax):
+        if (rows_1[y - y_1] >> shift_1) & (rows_2[y - y_2] >> shift_2) & window:
+            return True
+
+    return False
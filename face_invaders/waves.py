@@ -0,0 +1,100 @@
+"""Face wave planning for Face Invaders."""
+
+from face_invaders import constants as C
+
+def wave_size(level):
+    """Return the number of large faces in the wave for ``level``."""
+    return min(C.WAVE_BASE_SIZE + (level - 1) * C.WAVE_SIZE_PER_LEVEL, C.WAVE_MAX_SIZE)
+
+def wave_speed_range(level):
+    """Return the (min, max) face speed range for ``level``."""
+    extra = int((level - 1) * C.WAVE_SPEED_PER_LEVEL)
+    return C.WAVE_SPEED_MIN + extra, C.WAVE_SPEED_MAX + extra
+
+
+class WavePlanner:
+    '''
+    Precompute spawn tables for the next wave of faces a few spawns per
+    frame, so starting a wave only reads a finished table
+    '''
+
+    def __init__(self, world, border_x, border_y, variant_count, rng, scale=1):
+        '''
+        Create a planner for faces spawning just outside the playfield, with
+        wave sizes multiplied by ``scale``
+        '''
+
+        # Random stream used for spawn values
+        self.rng = rng
+
+        # Spawn area along the playfield border
+        self.x_min = -border_x
+        self.x_max = world.width + border_x
+        self.y_min = -border_y
+        self.y_max = world.height + border_y
+
+        # Number of personalized faces to choose from
+        self.variant_count = variant_count
+
+        # Wave size multiplier
+        self.scale = scale
+
+        # Wave being planned and its spawn table of
+        # (x, y, v, angle, flip_x, variant) entries
+        self.level = None
+        self.count = 0
+        self.spawns = []
+
+    def plan(self, level, count=None):
+        '''
+        Start planning the wave for ``level``, sized by the difficulty curve
+        unless ``count`` is given
+        '''
+        self.level = level
+        self.count = wave_size(level) * self.scale if count is None else count
+        self.spawns = []
+
+    def step(self, spawn_count=1):
+        '''
+        Plan up to ``spawn_count`` more spawns of the current wave.
+        Return True when the wave is fully planned.
+        '''
+        if self.level is None:
+            return True
+        rng = self.rng
+        speed_min, speed_max = wave_speed_range(self.level)
+        for i in range(min(spawn_count, self.count - len(self.spawns))):
+
+            # Random start position along one side of the playfield border
+            side = rng.randrange(4)
+            if side < 2:
+                x = rng.randrange(self.x_min, self.x_max)
+                y = self.y_min if side == 0 else self.y_max
+            else:
+                x = self.x_min if side == 2 else self.x_max
+                y = rng.randrange(self.y_min, self.y_max)
+
+            # Random velocity, direction, orientation and face
+            self.spawns.append((
+                x,
+                y,
+                rng.randrange(speed_min, speed_max),
+                rng.angle(),
+                rng.flip(),
+                rng.randrange(self.variant_count)
+            ))
+
+        return len(self.spawns) >= self.count
+
+    def take(self, level, count=None):
+        '''
+        Return the spawn table for ``level``, finishing or replacing the
+        planned wave if it is incomplete or for another wave
+        '''
+        if level != self.level or (count is not None and count != self.count):
+            self.plan(level, count)
+        self.step(self.count)
+        spawns = self.spawns
+        self.level = None
+        self.spawns = []
+        return spawns
@@ -0,0 +1,94 @@
+"""Playfield bounds and camera used for Face Invaders object movement."""
+
+class WorldBounds:
+    '''
+    Size of the playfield that objects move and wrap within, with wrap
+    extents precomputed once per sprite size. The playfield defaults to the
+    display size but may be set independently of it.
+    '''
+
+    def __init__(self, width, height, padded=True):
+        '''
+        Create bounds for a ``width`` by ``height`` pixel playfield. Padded
+        bounds wrap objects only once they are fully past an edge, for
+        playfields shown whole on the display; unpadded bounds wrap
+        seamlessly for playfields larger than the view.
+        '''
+
+        # Playfield size
+        self.width = width
+        self.height = height
+
+        # Whether wrap spans include the sprite size
+        self.padded = padded
+
+        # Wrap extents keyed by (sprite_width, sprite_height)
+        self.extents = {}
+
+    def wrap_extents(self, sprite_width, sprite_height):
+        '''
+        Return (half_width, span_x, half_height, span_y) for a sprite size.
+        A center coordinate wraps as ``((x + half_width) % span_x) - half_width``.
+        '''
+        key = (sprite_width, sprite_height)
+        if key not in self.extents:
+            pad_x = sprite_width if self.padded else 0
+            pad_y = sprite_height if self.padded else 0
+            self.extents[key] = (
+                sprite_width // 2,
+                self.width + pad_x,
+                sprite_height // 2,
+                self.height + pad_y
+            )
+        return self.extents[key]
+
+    def distance_squared(self, x0, y0, x1, y1):
+        """Return the squared wrap-aware distance between two playfield positions."""
+        width = self.width
+        height = self.height
+        dx = abs(x0 - x1) % width
+        dy = abs(y0 - y1) % height
+        dx = min(dx, width - dx)
+        dy = min(dy, height - dy)
+        return dx * dx + dy * dy
+
+
+class Camera:
+    '''
+    View onto a playfield larger than the display. Objects are positioned
+    relative to the camera with wrap-around, and their layers are hidden
+    while outside the view so only visible objects are drawn.
+    '''
+
+    def __init__(self, world, view_width, view_height):
+        """Create a camera showing a ``view_width`` by ``view_height`` area of ``world``."""
+
+        # Playfield being viewed
+        self.world = world
+
+        # View size
+        self.view_width = view_width
+        self.view_height = view_height
+
+        # Playfield position of the view's upper left corner
+        self.x = 0
+        self.y = 0
+
+    def follow(self, x, y):
+        """Center the view on playfield position (x, y), aligned to whole pixels."""
+        self.x = int(x) - self.view_width // 2
+        self.y = int(y) - self.view_height // 2
+
+    def view_x(self, x, margin=0):
+        '''
+        Return the view coordinate of playfield coordinate ``x``, choosing
+        the wrapped copy in the range [-margin, world width - margin)
+        '''
+        return (x - self.x + margin) % self.world.width - margin
+
+    def view_y(self, y, margin=0):
+        '''
+        Return the view coordinate of playfield coordinate ``y``, choosing
+        the wrapped copy in the range [-margin, world height - margin)
+        '''
+        return (y - self.y + margin) % self.world.height - margin
@@ -0,0 +1,13 @@
+"""Host test setup: make the game package importable off the PyBadge."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The board's entry point code.py shadows the standard library code module
+# that pytest's debugger imports, so load pdb before the repository root is
+# searched, then search the root last for the face_invaders package
+sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != ROOT]
+import pdb
+sys.path.append(ROOT)
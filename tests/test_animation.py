@@ -0,0 +1,39 @@
+"""Host tests for the shared Face Invaders animation clock."""
+
+from face_invaders.animation import AnimationScheduler
+
+
+class Sprite:
+    """Stand-in for a face recording the frames it is shown."""
+
+    def __init__(self, frame_count):
+        self.frame_count = frame_count
+        self.frames = []
+
+    def set_frame(self, frame):
+        self.frames.append(frame)
+
+
+def test_sprites_only_touched_on_frame_change():
+    scheduler = AnimationScheduler(0.25, 4)
+    sprite = Sprite(4)
+    still = Sprite(1)
+
+    for _ in range(7):
+        scheduler.advance(0.125, (sprite, still))
+
+    # Updates every half frame step through frames 1, 2 and 3
+    assert sprite.frames == [1, 2, 3]
+    assert still.frames == []
+
+
+def test_long_update_skips_frames_and_wraps():
+    scheduler = AnimationScheduler(0.25, 4)
+    sprite = Sprite(4)
+
+    scheduler.advance(0.75, (sprite,))
+    scheduler.advance(0.5, (sprite,))
+
+    # A whole cycle leaves the frame unchanged and touches no sprite
+    scheduler.advance(1.0, (sprite,))
+    assert sprite.frames == [3, 1]
@@ -0,0 +1,110 @@
+"""Host tests comparing Face Invaders fixed-point motion with float motion."""
+
+import random
+from math import atan2, cos, hypot, pi, radians, sin
+
+import pytest
+
+from face_invaders import ship_sprites
+from face_invaders.fixed import ONE, TIME_ONE, FixedMotion, TickClock
+from face_invaders.space_objects import Ship
+from face_invaders.world import WorldBounds
+
+WIDTH = 160
+HEIGHT = 128
+SHIP_SIZE = 20
+
+
+class Bitmap:
+    """Stand-in for a sprite sheet bitmap."""
+
+    def __init__(self, width):
+        self.width = width
+
+
+class TileGrid(list):
+    """Stand-in for a one tile displayio TileGrid."""
+
+    def __init__(self, tile_count):
+        super().__init__([0])
+        self.bitmap = Bitmap(tile_count * SHIP_SIZE)
+        self.width = self.height = 1
+        self.tile_width = self.tile_height = SHIP_SIZE
+        self.x = self.y = 0
+        self.hidden = False
+
+
+def wrapped_error(a, b, span):
+    """Return the distance between two coordinates wrapping within ``span``."""
+    d = abs(a - b) % span
+    return min(d, span - d)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_constant_velocity_within_one_pixel(seed):
+    rand = random.Random(seed)
+    v = rand.uniform(5, 140)
+    angle = rand.uniform(0, 2 * pi)
+    x = rand.uniform(0, WIDTH)
+    y = rand.uniform(0, HEIGHT)
+    motion = FixedMotion()
+    motion.init_motion(x, y, v, angle, span_x=WIDTH, span_y=HEIGHT)
+    clock = TickClock()
+
+    # Move for about 80 seconds at uneven frame times
+    for tick in range(3000):
+        dt = rand.uniform(0.015, 0.04)
+        x = (x + sin(angle) * v * dt) % WIDTH
+        y = (y - cos(angle) * v * dt) % HEIGHT
+        motion.move(clock.units(dt))
+        assert wrapped_error(motion.fx / ONE, x, WIDTH) < 1
+        assert wrapped_error(motion.fy / ONE, y, HEIGHT) < 1
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_ship_within_one_pixel(seed):
+    rand = random.Random(seed)
+    ship = Ship(TileGrid(ship_sprites.TILE_COUNT), WorldBounds(WIDTH, HEIGHT), WIDTH // 2, HEIGHT // 2)
+    clock = TickClock()
+    span_x = WIDTH + SHIP_SIZE
+    span_y = HEIGHT + SHIP_SIZE
+    half = SHIP_SIZE // 2
+
+    # Float ship stepped over the same time units
+    x, y, vx, vy, heading = WIDTH // 2, HEIGHT // 2, 0.0, 0.0, 0.0
+    turning_rate = ship.turning_fx / ship.heading_scale
+    for tick in range(400):
+        if tick % 37 == 0:
+            ship.turning = rand.choice((-1, 0, 1))
+        if tick % 23 == 0:
+            ship.thrusting = rand.choice((0, 1))
+        units = clock.units(rand.uniform(0.015, 0.04))
+        dt = units / TIME_ONE
+
+        if ship.turning:
+            heading += ship.turning * turning_rate * dt
+        if ship.thrusting:
+            vx = max(min(vx + sin(heading) * ship.thrust_value * dt, ship.vmax), -ship.vmax)
+            vy = max(min(vy - cos(heading) * ship.thrust_value * dt, ship.vmax), -ship.vmax)
+        else:
+            vx *= (1 - ship.v_dropoff) ** dt
+            vy *= (1 - ship.v_dropoff) ** dt
+        x = (x + vx * dt + half) % span_x - half
+        y = (y + vy * dt + half) % span_y - half
+
+        ship.update(units)
+        assert wrapped_error(ship.fx / ONE, x, span_x) < 1
+        assert wrapped_error(ship.fy / ONE, y, span_y) < 1
+
+
+@pytest.mark.parametrize('steps', (256, 360, 100))
+def test_thrust_follows_heading_for_any_step_count(steps, monkeypatch):
+    monkeypatch.setattr(ship_sprites, 'HEADING_STEPS', steps)
+    monkeypatch.setattr(ship_sprites, 'HEADING_TILES', bytes(steps))
+    for degrees in range(0, 360, 15):
+        ship = Ship(TileGrid(ship_sprites.TILE_COUNT), WorldBounds(WIDTH, HEIGHT), heading=radians(degrees))
+        ship.thrusting = 1
+        ship.update(TIME_ONE // 4)
+        thrust = atan2(ship.vx, -ship.vy)
+        assert hypot(ship.vx, ship.vy) > 0
+        assert wrapped_error(thrust, radians(degrees), 2 * pi) < radians(360 / steps) + 0.01
@@ -0,0 +1,33 @@
+"""Host tests of the Face Invaders frame budget governor."""
+
+from face_invaders import governor as G
+
+
+def over_budget(governor, frames):
+    for _ in range(frames):
+        governor.add_frame(0.05, 0.02)
+
+
+def test_particle_half_rate_brought_forward_over_budget():
+    governor = G.FrameGovernor(0.04, window=4, hold_frames=4)
+    assert governor.particle_age(0.6) == 0.6
+
+    # Each raised level lowers the half rate age
+    ages = []
+    for level in range(G.FEWER_PARTICLES, G.HALF_REFRESH + 1):
+        over_budget(governor, 4)
+        assert governor.level == level
+        ages.append(governor.particle_age(0.6))
+    assert ages == sorted(ages, reverse=True)
+    assert ages[-1] < 0.6 / 2
+
+
+def test_particle_age_restored_under_budget():
+    governor = G.FrameGovernor(0.04, window=4, hold_frames=4)
+    over_budget(governor, 8)
+    assert governor.particle_age(0.6) < 0.6
+
+    for _ in range(16):
+        governor.add_frame(0.01, 0.01)
+    assert governor.level == G.FULL_EFFECTS
+    assert governor.particle_age(0.6) == 0.6
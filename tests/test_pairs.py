@@ -0,0 +1,102 @@
+"""Replay tests of Face Invaders collision pair scheduling against exhaustive checks."""
+
+import random
+from math import pi
+
+import pytest
+
+from face_invaders.fixed import TickClock, FixedMotion
+from face_invaders.pairs import PairScheduler
+from face_invaders.world import WorldBounds
+
+
+class Body(FixedMotion):
+    """Moving box wrapping within a playfield like a game object."""
+
+    def __init__(self, world, x, y, v, angle, size):
+        half_width, span_x, half_height, span_y = world.wrap_extents(size, size)
+        self.init_motion(x, y, v, angle, half_width, span_x, half_height, span_y)
+        self.extent_fx = self.half_fx
+        self.extent_fy = self.half_fy
+
+
+def touching(world, obj_1, obj_2):
+    '''
+    Return whether the boxes of two objects overlap as drawn, the short way
+    around seamless playfields
+    '''
+    dx = abs(obj_1.fx - obj_2.fx)
+    dy = abs(obj_1.fy - obj_2.fy)
+    if not world.padded:
+        dx %= world.width << 8
+        dy %= world.height << 8
+        dx = min(dx, (world.width << 8) - dx)
+        dy = min(dy, (world.height << 8) - dy)
+    return dx < obj_1.extent_fx + obj_2.extent_fx and dy < obj_1.extent_fy + obj_2.extent_fy
+
+
+def replay(world, bodies, ticks, rand):
+    '''
+    Move ``bodies`` for ``ticks`` uneven frames, checking every pair
+    exhaustively and through a scheduler. Return the touching pair ticks
+    found by each and the number of pair checks the scheduler skipped.
+    '''
+    scheduler = PairScheduler(world)
+    clock = TickClock()
+    next_times = {}
+    exhaustive = []
+    scheduled = []
+    skips = 0
+    for tick in range(ticks):
+        dt = clock.units(rand.uniform(0.015, 0.04))
+        scheduler.advance(dt)
+        for body in bodies:
+            body.move(dt)
+        for i in range(len(bodies)):
+            for j in range(i + 1, len(bodies)):
+                hit = touching(world, bodies[i], bodies[j])
+                if hit:
+                    exhaustive.append((tick, i, j))
+                next_time = scheduler.due(next_times.get((i, j), 0), bodies[i], bodies[j])
+                next_times[(i, j)] = next_time
+                if next_time > scheduler.time:
+                    skips += 1
+                elif hit:
+                    scheduled.append((tick, i, j))
+    return exhaustive, scheduled, skips
+
+
+@pytest.mark.parametrize('padded', (True, False))
+@pytest.mark.parametrize('seed', range(8))
+def test_scheduled_matches_exhaustive(padded, seed):
+    rand = random.Random(seed)
+    world = WorldBounds(160, 128) if padded else WorldBounds(480, 384, padded=False)
+    bodies = [
+        Body(world, rand.uniform(0, world.width), rand.uniform(0, world.height),
+             rand.uniform(0, 140), rand.uniform(0, 2 * pi), rand.choice((2, 20, 30, 40)))
+        for i in range(12)
+    ]
+    exhaustive, scheduled, skips = replay(world, bodies, 1500, rand)
+    assert exhaustive
+    assert scheduled == exhaustive
+    assert skips
+
+
+@pytest.mark.parametrize('ship_x, face_x', ((458, -8), (-8, 458), (2, 470)))
+def test_hit_across_seam(ship_x, face_x):
+    world = WorldBounds(480, 384, padded=False)
+    ship = Body(world, ship_x, 100, 0, 0, 20)
+    face = Body(world, face_x, 100, 20, pi / 2, 40)
+    assert touching(world, ship, face)
+    exhaustive, scheduled, skips = replay(world, [ship, face], 1, random.Random(0))
+    assert scheduled == exhaustive == [(0, 0, 1)]
+
+
+def test_approach_across_seam():
+    world = WorldBounds(480, 384, padded=False)
+    ship = Body(world, 470, 100, 0, 0, 20)
+    face = Body(world, 60, 100, 30, 3 * pi / 2, 40)
+    exhaustive, scheduled, skips = replay(world, [ship, face], 200, random.Random(1))
+    assert exhaustive and exhaustive[0][0] > 0
+    assert scheduled == exhaustive
+    assert skips
@@ -0,0 +1,153 @@
+"""Host tests driving the Face Invaders frame loop with scripted keys."""
+
+import pytest
+
+from face_invaders import runtime
+from face_invaders.profiling import LatencyTracker
+
+TICK_SECONDS = 0.012
+REFRESH_SECONDS = 0.020
+
+
+class Clock:
+    """Simulated monotonic clock advanced by work and sleeps."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(seconds, 1e-6)
+
+
+class Event:
+    """Stand-in for a keypad event."""
+
+    def __init__(self, key_number, pressed):
+        self.key_number = key_number
+        self.pressed = pressed
+
+
+class EventQueue:
+    """Keypad event queue releasing scripted events at their timestamps."""
+
+    def __init__(self, clock, script):
+        self.clock = clock
+        self.script = sorted(script, key=lambda event: event[0])
+
+    def __len__(self):
+        return sum(1 for time, key, pressed in self.script if time <= self.clock.now)
+
+    def get(self):
+        if self.script and self.script[0][0] <= self.clock.now:
+            time, key, pressed = self.script.pop(0)
+            return Event(key, pressed)
+        return None
+
+
+class Keys:
+    """Stand-in for the keypad."""
+
+    def __init__(self, clock, script):
+        self.events = EventQueue(clock, script)
+
+
+class Display:
+    """Display whose refresh takes a fixed time."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.refreshes = 0
+
+    def refresh(self):
+        self.clock.now += REFRESH_SECONDS
+        self.refreshes += 1
+
+
+class Game:
+    '''
+    Game model whose presses change state in the key handler and whose
+    tick takes a fixed time
+    '''
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.tick_count = 0
+        self.presses = 0
+        self.governor = None
+        self.frame_stats = None
+        self.current_state = 1
+
+    def key_event(self, key_number, pressed=True):
+        if pressed:
+            self.presses += 1
+
+    def input_signature(self):
+        return self.presses
+
+    def tick(self):
+        self.clock.now += TICK_SECONDS
+        self.tick_count += 1
+
+    def frame_seconds(self):
+        return 0
+
+    def skip_elapsed(self):
+        pass
+
+    def save_high_scores(self):
+        pass
+
+    def save_snapshot(self):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(runtime, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(runtime, 'sleep', clock.sleep)
+    return clock
+
+
+def run(clock, script, frames):
+    """Run the polling loop over scripted (time, key, pressed) events."""
+    tracker = LatencyTracker(report_seconds=1000)
+    display = Display(clock)
+    frame_loop = runtime.FrameLoop(Game(clock), display, Keys(clock, script), tracker)
+    for frame in range(frames):
+        frame_loop.run_frame()
+    return tracker
+
+
+def test_latency_is_tick_and_refresh(clock):
+    # Presses and releases spread across frames, one per frame at most
+    script = []
+    for i in range(20):
+        script.append((clock.now + 0.1 * i, 4, True))
+        script.append((clock.now + 0.1 * i + 0.05, 4, False))
+    tracker = run(clock, script, 100)
+
+    # Each press shows after the tick and refresh of the frame reading it;
+    # releases change nothing and are not timed
+    histogram = tracker.histogram
+    assert histogram.count == 20
+    assert tracker.ignored == 20
+    assert histogram.buckets[3] == 20
+    assert histogram.mean() == pytest.approx((TICK_SECONDS + REFRESH_SECONDS) * 1000)
+    assert not tracker.pending
+
+
+def test_queued_keys_timed_from_their_read(clock):
+    # Three presses at once are read one per frame, each timed from its read
+    script = [(clock.now, key, True) for key in (4, 5, 6)]
+    tracker = run(clock, script, 10)
+
+    frame_ms = (TICK_SECONDS + REFRESH_SECONDS) * 1000
+    histogram = tracker.histogram
+    assert histogram.count == 3
+    assert histogram.buckets[3] == 3
+    assert histogram.max == pytest.approx(frame_ms)
+    assert histogram.percentile(0.9) == pytest.approx(frame_ms)
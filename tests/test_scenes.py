@@ -0,0 +1,87 @@
+"""Host tests for Face Invaders scene switching."""
+
+from face_invaders import constants as C
+from face_invaders.scenes import SceneManager
+
+STATES = [value for name, value in vars(C.GameState).items() if not name.startswith('_')]
+MENU_STATES = (C.GameState.OPTIONS_MENU, C.GameState.CONTROLS_MENU)
+
+
+class Group(list):
+    """Stand-in for a display group, compared by identity."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+    def __eq__(self, other):
+        return self is other
+
+    __hash__ = object.__hash__
+
+
+def make_scenes():
+    '''
+    Return the root group, every scene group and a scene table laid out
+    like the game's, with each state drawing one group of its own
+    '''
+    background = Group('background')
+    game = Group('game')
+    own = {state: Group('state {}'.format(state)) for state in STATES}
+    play_groups = (background, game)
+    scenes = {
+        state: (own[state],) if state in MENU_STATES else play_groups + (own[state],)
+        for state in STATES
+    }
+    return Group('root'), [background, game] + list(own.values()), scenes
+
+
+def assert_shown(root, all_groups, expected):
+    """Check only ``expected`` groups are attached to ``root``, in order."""
+    assert [id(group) for group in root] == [id(group) for group in expected]
+    for group in all_groups:
+        if not any(group is shown for shown in expected):
+            assert not any(group is attached for attached in root), group.name
+
+
+def test_every_state_has_a_scene():
+    _, _, scenes = make_scenes()
+    assert sorted(scenes) == sorted(STATES)
+    assert len(STATES) == 7
+
+
+def test_visibility_for_every_state():
+    root, all_groups, scenes = make_scenes()
+    manager = SceneManager(root, scenes)
+    for previous in STATES:
+        for state in STATES:
+            manager.show(previous)
+            manager.show(state)
+            assert manager.state == state
+            assert_shown(root, all_groups, scenes[state])
+
+
+def test_menus_drawn_over_base_state():
+    root, all_groups, scenes = make_scenes()
+    manager = SceneManager(root, scenes)
+    for base_state in STATES:
+        if base_state in MENU_STATES:
+            continue
+        for menu in MENU_STATES:
+            manager.show(base_state)
+            manager.show(menu, base_state=base_state)
+            assert manager.state == menu
+            assert_shown(root, all_groups, scenes[base_state] + scenes[menu])
+
+            # Closing the menu restores the base scene
+            manager.show(base_state)
+            assert_shown(root, all_groups, scenes[base_state])
+
+
+def test_shared_groups_stay_attached():
+    root, _, scenes = make_scenes()
+    manager = SceneManager(root, scenes)
+    manager.show(C.GameState.START_MENU)
+    background, game = root[0], root[1]
+    manager.show(C.GameState.ACTIVE_GAME)
+    assert root[0] is background and root[1] is game
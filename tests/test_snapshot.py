@@ -0,0 +1,22 @@
+"""Host tests of Face Invaders game snapshot packing."""
+
+from face_invaders import snapshot
+
+LAYOUT = snapshot.layout_version((160, 128, 1, 20, 20, 36, 360))
+SHIP = (4000, -2560, 300, -120, 1023, 0, 359 << 8, 17, 0)
+FACES = [(100, 200, -30, 45, 5, 6, 21.5, 2.0, 1, 3, 1, 2), (0, 0, 0, 0, 0, 0, 0.0, 0.0, 3, 0, 0, 0)]
+BULLETS = [(5, 6, 7, 8, 9, 10, 400)]
+
+
+def test_round_trip():
+    data = snapshot.pack_snapshot(LAYOUT, 12345, 2, 7, SHIP, FACES, BULLETS)
+    assert snapshot.unpack_snapshot(data, LAYOUT) == (12345, 2, 7, SHIP, FACES, BULLETS)
+
+
+def test_rejects_other_layouts_and_truncation():
+    data = snapshot.pack_snapshot(LAYOUT, 0, 3, 1, SHIP, FACES, BULLETS)
+    other = snapshot.layout_version((160, 128, 1, 20, 20, 36, 256))
+    assert other != LAYOUT
+    assert snapshot.unpack_snapshot(data, other) is None
+    assert snapshot.unpack_snapshot(data[:-1], LAYOUT) is None
+    assert snapshot.unpack_snapshot(b'FIS1' + data[4:], LAYOUT) is None
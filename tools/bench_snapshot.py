@@ -0,0 +1,94 @@
+"""Measure the size and save/restore time of Face Invaders game snapshots.
+
+Host-side tool, run with desktop Python rather than on the PyBadge. A
+synthetic game with a given number of faces and bullets is packed,
+written, read back and unpacked with ``face_invaders/snapshot.py``, and
+the snapshot size and mean time of each step are printed. Sizes match the
+device; times only compare snapshot layouts and object counts, as the
+PyBadge's flash writes are far slower than a desktop disk.
+
+Usage:
+    python tools/bench_snapshot.py
+    python tools/bench_snapshot.py --faces 26 --bullets 8 --repeat 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+# The board's entry point code.py shadows the standard library code module,
+# so search the repository root last
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from face_invaders import snapshot
+
+
+def synthetic_game(face_count, bullet_count, rng):
+    '''
+    Return (ship, faces, bullets) snapshot records of a game in progress
+    with random positions, velocities and ages
+    '''
+    def motion():
+        return (
+            rng.randrange(-20 << 8, 180 << 8),
+            rng.randrange(-20 << 8, 148 << 8),
+            rng.randrange(-40 << 8, 40 << 8),
+            rng.randrange(-40 << 8, 40 << 8),
+            rng.randrange(1024),
+            rng.randrange(1024)
+        )
+    ship = motion() + (rng.randrange(360 << 8), rng.randrange(1024), 0)
+    faces = [
+        motion() + (rng.uniform(5, 30), rng.uniform(0, 360), rng.randrange(1, 4), rng.randrange(20), rng.randrange(2),
+                    rng.randrange(4))
+        for i in range(face_count)
+    ]
+    bullets = [motion() + (rng.randrange(1024),) for i in range(bullet_count)]
+    return ship, faces, bullets
+
+
+def mean_ms(function, repeat):
+    """Return the mean milliseconds of ``repeat`` calls to ``function``."""
+    start_time = perf_counter()
+    for i in range(repeat):
+        function()
+    return (perf_counter() - start_time) * 1000 / repeat
+
+
+def main():
+    """Parse command line options and time each snapshot step."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--faces', type=int, default=13, help='number of faces in the game')
+    parser.add_argument('--bullets', type=int, default=8, help='number of bullets in the game')
+    parser.add_argument('--repeat', type=int, default=200, help='calls timed per step')
+    parser.add_argument('--seed', type=int, default=3, help='seed of the synthetic game')
+    args = parser.parse_args()
+
+    layout = snapshot.layout_version((160, 128, 0, 20, 20, 64, 64))
+    ship, faces, bullets = synthetic_game(args.faces, args.bullets, random.Random(args.seed))
+    data = snapshot.pack_snapshot(layout, 12345, 2, 4, ship, faces, bullets)
+    assert snapshot.unpack_snapshot(data, layout) is not None
+
+    print('snapshot of {} faces and {} bullets: {} bytes'.format(args.faces, args.bullets, len(data)))
+    print('  header={} ship={} face={} bullet={} bytes'.format(
+        snapshot.HEADER_SIZE, snapshot.SHIP_SIZE, snapshot.FACE_SIZE, snapshot.BULLET_SIZE
+    ))
+
+    # Time each step of saving and restoring, against a temporary file
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'snapshot.bin')
+        steps = (
+            ('pack', lambda: snapshot.pack_snapshot(layout, 12345, 2, 4, ship, faces, bullets)),
+            ('write', lambda: snapshot.save_snapshot(path, data)),
+            ('read', lambda: snapshot.read_snapshot(path)),
+            ('unpack', lambda: snapshot.unpack_snapshot(data, layout))
+        )
+        for name, function in steps:
+            print('  {}: {:.3f} ms'.format(name, mean_ms(function, args.repeat)))
+
+
+if __name__ == '__main__':
+    main()
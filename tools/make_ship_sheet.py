@@ -0,0 +1,221 @@
+"""Build the Face Invaders ship sprite sheet and its lookup tables.
+
+Host-side tool, run with desktop Python rather than on the PyBadge. The
+first tile of each row of the input sheet is used as a master sprite: row 0
+is the plain ship pointing up and row 1 the ship with its thrust flame.
+Each master is rendered at ``--rotations`` evenly spaced clockwise headings
+and packed into a sheet with one row per master, matching the layout read
+by ``Ship.update``.
+
+A Python module is also written holding the heading to tile lookup table
+and a collision mask per tile, so the game never converts headings with
+``degrees``/``round`` or scans sprite pixels at runtime.
+
+Usage:
+    python tools/make_ship_sheet.py --rotations 64
+    python tools/make_ship_sheet.py --index-only
+"""
+
+import argparse
+from math import sin, cos, pi
+from struct import pack, unpack_from
+
+SHEET_PATH = 'face_invaders/img/ships.bmp'
+TABLE_PATH = 'face_invaders/ship_sprites.py'
+
+
+def read_bmp(path):
+    '''
+    Read an uncompressed 1, 4 or 8 bit indexed BMP file.
+    Return (width, height, rows, palette) where rows[y][x] is a color index.
+    '''
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:2] != b'BM':
+        raise ValueError('{} is not a BMP file'.format(path))
+
+    # Parse headers
+    pixel_offset = unpack_from('<I', data, 10)[0]
+    header_size = unpack_from('<I', data, 14)[0]
+    width, height = unpack_from('<ii', data, 18)
+    bits = unpack_from('<H', data, 28)[0]
+    compression = unpack_from('<I', data, 30)[0]
+    color_count = unpack_from('<I', data, 46)[0] or (1 << bits)
+    if bits not in (1, 4, 8) or compression != 0:
+        raise ValueError('{} must be an uncompressed 1, 4 or 8 bit BMP'.format(path))
+
+    # Parse palette as 0xRRGGBB values
+    palette = []
+    for i in range(color_count):
+        blue, green, red = data[14 + header_size + 4 * i:17 + header_size + 4 * i]
+        palette.append((red << 16) | (green << 8) | blue)
+
+    # Parse pixel rows, stored bottom up unless height is negative
+    bottom_up = height > 0
+    height = abs(height)
+    stride = (width * bits + 31) // 32 * 4
+    rows = []
+    for row in range(height):
+        start = pixel_offset + row * stride
+        values = []
+        for x in range(width):
+            byte = data[start + x * bits // 8]
+            shift = 8 - bits - (x * bits) % 8
+            values.append((byte >> shift) & ((1 << bits) - 1))
+        rows.append(values)
+    if bottom_up:
+        rows.reverse()
+
+    return width, height, rows, palette
+
+
+def write_bmp(path, width, height, rows, palette):
+    """Write an uncompressed indexed BMP using the fewest bits per pixel."""
+    bits = 1 if len(palette) <= 2 else 4 if len(palette) <= 16 else 8
+    color_count = 1 << bits
+    stride = (width * bits + 31) // 32 * 4
+
+    # Pack pixel rows bottom up
+    pixel_data = bytearray()
+    for values in reversed(rows):
+        row = bytearray(stride)
+        for x, value in enumerate(values):
+            row[x * bits // 8] |= value << (8 - bits - (x * bits) % 8)
+        pixel_data += row
+
+    # Pad palette to the full color count
+    palette_data = bytearray()
+    for i in range(color_count):
+        color = palette[i] if i < len(palette) else 0
+        palette_data += pack('<BBBB', color & 0xFF, (color >> 8) & 0xFF, color >> 16, 0)
+
+    pixel_offset = 14 + 40 + len(palette_data)
+    with open(path, 'wb') as file:
+        file.write(pack('<2sIHHI', b'BM', pixel_offset + len(pixel_data), 0, 0, pixel_offset))
+        file.write(pack('<IiiHHIIiiII', 40, width, height, 1, bits, 0, len(pixel_data), 2835, 2835, len(palette), 0))
+        file.write(palette_data)
+        file.write(pixel_data)
+
+
+def crop(rows, x, y, width, height):
+    """Return the pixel rows of a rectangular region."""
+    return [row[x:x + width] for row in rows[y:y + height]]
+
+
+def rotate(tile, angle, background):
+    '''
+    Rotate a tile clockwise by ``angle`` radians around its center using
+    nearest neighbour sampling
+    '''
+    height = len(tile)
+    width = len(tile[0])
+    center_x = (width - 1) / 2
+    center_y = (height - 1) / 2
+    cos_angle = cos(angle)
+    sin_angle = sin(angle)
+
+    rotated = []
+    for y in range(height):
+        values = []
+        for x in range(width):
+
+            # Map each destination pixel back onto the master tile
+            dx = x - center_x
+            dy = y - center_y
+            source_x = round(center_x + dx * cos_angle + dy * sin_angle)
+            source_y = round(center_y - dx * sin_angle + dy * cos_angle)
+            if 0 <= source_x < width and 0 <= source_y < height:
+                values.append(tile[source_y][source_x])
+            else:
+                values.append(background)
+        rotated.append(values)
+
+    return rotated
+
+
+def tile_mask(tile, background):
+    """Return one bitmask per tile row, bit n set where column n is opaque."""
+    masks = []
+    for values in tile:
+        mask = 0
+        for x, value in enumerate(values):
+            if value != background:
+                mask |= 1 << x
+        masks.append(mask)
+    return masks
+
+
+def heading_tiles(tile_count, steps):
+    '''
+    Return a table mapping each heading step (a 1/steps turn) to the tile
+    whose heading is nearest to the step's center
+    '''
+    return [((2 * step + 1) * tile_count + steps) // (2 * steps) % tile_count for step in range(steps)]
+
+
+def write_table(path, tile_width, tile_height, tile_count, steps, masks):
+    """Write the generated lookup tables as a Python module."""
+    with open(path, 'w') as file:
+        file.write('"""Ship sprite tables generated by tools/make_ship_sheet.py; do not edit."""\n\n')
+        file.write('TILE_WIDTH = {}\n'.format(tile_width))
+        file.write('TILE_HEIGHT = {}\n'.format(tile_height))
+        file.write('TILE_COUNT = {}\n'.format(tile_count))
+        file.write('HEADING_STEPS = {}\n\n'.format(steps))
+        file.write('# Tile index for each heading step\n')
+        file.write('HEADING_TILES = bytes((\n')
+        table = heading_tiles(tile_count, steps)
+        for start in range(0, steps, 16):
+            file.write('    {},\n'.format(', '.join(str(tile) for tile in table[start:start + 16])))
+        file.write('))\n\n')
+        file.write('# Opaque pixel bitmask per row of each tile\n')
+        file.write('MASKS = (\n')
+        for tile in masks:
+            file.write('    ({}),\n'.format(', '.join(str(mask) for mask in tile)))
+        file.write(')\n')
+
+
+def main():
+    """Parse command line options and build the sheet and tables."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sheet', default=SHEET_PATH, help='input sheet whose first column holds the master sprites')
+    parser.add_argument('--tile-size', type=int, default=20, help='square tile size in pixels')
+    parser.add_argument('--rotations', type=int, default=36, help='number of headings rendered per master')
+    parser.add_argument('--steps', type=int, default=256, help='heading resolution of the lookup table')
+    parser.add_argument('--out-sheet', default=SHEET_PATH, help='output sprite sheet')
+    parser.add_argument('--out-table', default=TABLE_PATH, help='output lookup table module')
+    parser.add_argument('--index-only', action='store_true', help='only write tables for the existing sheet')
+    args = parser.parse_args()
+
+    width, height, rows, palette = read_bmp(args.sheet)
+    size = args.tile_size
+    background = rows[0][0]
+    master_count = height // size
+
+    # Use the existing tiles, or render each master at every heading
+    if args.index_only:
+        tile_count = width // size
+        tiles = [crop(rows, column * size, row * size, size, size)
+                 for row in range(master_count) for column in range(tile_count)]
+    else:
+        tile_count = args.rotations
+        tiles = []
+        for row in range(master_count):
+            master = crop(rows, 0, row * size, size, size)
+            for column in range(tile_count):
+                tiles.append(rotate(master, 2 * pi * column / tile_count, background))
+
+        # Pack tiles into the output sheet
+        sheet = [[background] * (tile_count * size) for _ in range(master_count * size)]
+        for index, tile in enumerate(tiles):
+            for y, values in enumerate(tile):
+                start = (index % tile_count) * size
+                sheet[(index // tile_count) * size + y][start:start + size] = values
+        write_bmp(args.out_sheet, tile_count * size, master_count * size, sheet, palette)
+        print('wrote', args.out_sheet, '({} tiles)'.format(len(tiles)))
+
+    write_table(args.out_table, size, size, tile_count, args.steps, [tile_mask(tile, background) for tile in tiles])
+    print('wrote', args.out_table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""Optimize the Face Invaders sound effects and write their manifest.
+
+Host-side tool, run with desktop Python rather than on the PyBadge. Each
+sound in ``SOUND_SPECS`` is read from the source directory, mixed down to
+mono, resampled to the mixer's sample rate, trimmed of leading and trailing
+silence and written at the mixer's bit depth. 8-bit samples are the
+narrowest the ``audiomixer.Mixer`` accepts and halve the flash read on every
+play; WAV files store them unsigned.
+
+A Python module is also written mapping each sound name to its mixer voice,
+playback priority and file path. ``AudioManager.load_sounds`` checks every
+file against the mixer format at boot, so the format options here must
+match the ``AUDIO_*`` settings in ``face_invaders/constants.py``.
+
+Usage:
+    python tools/optimize_sounds.py
+    python tools/optimize_sounds.py --bits 16 --threshold 0
+"""
+
+import argparse
+import os
+import struct
+import wave
+
+SOUNDS_DIR = 'face_invaders/snds'
+MANIFEST_PATH = 'face_invaders/sound_manifest.py'
+
+# Sound name: (file name, mixer voice, priority); a voice plays one sound at
+# a time, and higher priority sounds win when sounds compete for a voice
+SOUND_SPECS = {
+    'continue': ('continue.wav', 2, 2),
+    'game_over': ('game_over.wav', 2, 3),
+    'new_ship': ('new_ship.wav', 2, 2),
+    'bullet': ('bullet.wav', 0, 0),
+    'click': ('click.wav', 0, 1),
+    'ship_thrust': ('ship_thrust.wav', 0, 0),
+    'ship_explosion': ('ship_explosion.wav', 1, 3),
+    'explosion_small': ('face_explosion_small.wav', 1, 1),
+    'explosion_medium': ('face_explosion_medium.wav', 1, 1),
+    'explosion_large': ('face_explosion_large.wav', 1, 2),
+}
+
+
+def read_wav(path):
+    """Return the sample rate and mono samples scaled to 16-bit signed."""
+    with wave.open(path, 'rb') as file:
+        channels = file.getnchannels()
+        width = file.getsampwidth()
+        rate = file.getframerate()
+        data = file.readframes(file.getnframes())
+
+    # Decode 8-bit unsigned or 16-bit signed samples
+    if width == 1:
+        values = [(value - 128) << 8 for value in data]
+    elif width == 2:
+        values = list(struct.unpack('<{}h'.format(len(data) // 2), data))
+    else:
+        raise ValueError('{}: unsupported sample width {}'.format(path, width))
+
+    # Mix interleaved channels down to mono
+    if channels > 1:
+        values = [sum(values[i:i + channels]) // channels for i in range(0, len(values), channels)]
+    return rate, values
+
+
+def resample(samples, rate, target_rate):
+    """Resample to ``target_rate`` by linear interpolation."""
+    if rate == target_rate or not samples:
+        return samples
+    count = max(1, len(samples) * target_rate // rate)
+    last = len(samples) - 1
+    result = []
+    for i in range(count):
+        position = i * rate / target_rate
+        index = min(int(position), last)
+        fraction = position - index
+        following = samples[min(index + 1, last)]
+        result.append(int(round(samples[index] + (following - samples[index]) * fraction)))
+    return result
+
+
+def trim_silence(samples, threshold, pad):
+    '''
+    Return samples with leading and trailing runs quieter than
+    ``threshold`` removed, keeping ``pad`` samples either side of the sound
+    '''
+    loud = [i for i, value in enumerate(samples) if abs(value) > threshold]
+    if not loud:
+        return samples[:1]
+    return samples[max(0, loud[0] - pad):loud[-1] + pad + 1]
+
+
+def quantize(samples, bits):
+    '''
+    Return 16-bit signed samples rounded to the nearest value representable
+    at ``bits`` depth, so silence is trimmed as it will be heard and
+    rerunning on optimized sounds leaves them unchanged
+    '''
+    if bits == 8:
+        return [min(127, max(-128, value + 128 >> 8)) << 8 for value in samples]
+    return samples
+
+
+def encode(samples, bits):
+    """Return WAV frame bytes for quantized 16-bit signed samples at ``bits`` depth."""
+    if bits == 8:
+        return bytes((value >> 8) + 128 for value in samples)
+    return struct.pack('<{}h'.format(len(samples)), *samples)
+
+
+def write_wav(path, samples, rate, bits):
+    """Write mono samples as a WAV file."""
+    with wave.open(path, 'wb') as file:
+        file.setnchannels(1)
+        file.setsampwidth(bits // 8)
+        file.setframerate(rate)
+        file.writeframes(encode(samples, bits))
+
+
+def write_manifest(path, sounds_dir):
+    """Write the sound manifest as a Python module."""
+    with open(path, 'w') as file:
+        file.write('"""Sound manifest generated by tools/optimize_sounds.py; do not edit."""\n\n')
+        file.write('# Sound name: (mixer voice, priority, file path)\n')
+        file.write('SOUNDS = {\n')
+        for name, (fname, voice, priority) in SOUND_SPECS.items():
+            file.write("    '{}': ({}, {}, '{}/{}'),\n".format(name, voice, priority, sounds_dir, fname))
+        file.write('}\n')
+
+
+def main():
+    """Parse command line options and optimize every sound."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--src', default=SOUNDS_DIR, help='directory of source sounds')
+    parser.add_argument('--out', default=SOUNDS_DIR, help='directory for optimized sounds')
+    parser.add_argument('--manifest', default=MANIFEST_PATH, help='output manifest module')
+    parser.add_argument('--rate', type=int, default=22050, help='mixer sample rate')
+    parser.add_argument('--bits', type=int, choices=(8, 16), default=8, help='mixer bits per sample')
+    parser.add_argument('--threshold', type=float, default=0.01,
+                        help='silence threshold as a fraction of full scale')
+    parser.add_argument('--pad-ms', type=int, default=5, help='milliseconds kept around trimmed sounds')
+    args = parser.parse_args()
+
+    threshold = int(args.threshold * 32768)
+    pad = args.rate * args.pad_ms // 1000
+    before = after = 0
+    for name, (fname, voice, priority) in SOUND_SPECS.items():
+        source = os.path.join(args.src, fname)
+        target = os.path.join(args.out, fname)
+        size = os.path.getsize(source)
+
+        rate, samples = read_wav(source)
+        samples = quantize(resample(samples, rate, args.rate), args.bits)
+        samples = trim_silence(samples, threshold, pad)
+        write_wav(target, samples, args.rate, args.bits)
+
+        before += size
+        after += os.path.getsize(target)
+        print('wrote {} ({} -> {} bytes)'.format(target, size, os.path.getsize(target)))
+
+    write_manifest(args.manifest, args.out)
+    print('wrote', args.manifest)
+    print('total {} -> {} bytes'.format(before, after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""Compare input latency and frame timing of the Face Invaders main loops.
+
+Host-side tool, run with desktop Python rather than on the PyBadge. The
+real ``FrameLoop`` is driven by the polling main loop and by the asyncio
+runtime in turn, against a model game whose tick and a display whose
+refresh block for fixed times, as they do on the device. Key events arrive
+on the wall clock at scripted random times, and latency is measured from
+each key's arrival in the queue, so time spent waiting to be read counts.
+
+Each run prints the input latency histogram, the interval between display
+refreshes and the duty cycle. Timing follows the host's scheduler, so runs
+show the difference between the loops rather than device figures.
+
+Usage:
+    python tools/simulate_runtime.py
+    python tools/simulate_runtime.py --seconds 30 --tick-ms 15 --refresh-ms 30
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+from time import monotonic, sleep
+
+# The board's entry point code.py shadows the standard library code module,
+# so search the repository root last
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from face_invaders import constants as C
+from face_invaders import async_runtime
+from face_invaders.profiling import DutyCycle, FrameStats, LatencyTracker
+from face_invaders.runtime import FrameLoop
+
+
+class KeyEvent:
+    """Stand-in for a keypad event."""
+
+    def __init__(self, key_number, pressed):
+        self.key_number = key_number
+        self.pressed = pressed
+
+
+class ScriptedKeys:
+    '''
+    Keypad whose event queue releases scripted (arrival, key, pressed)
+    events once the wall clock passes their arrival time
+    '''
+
+    def __init__(self, script):
+        self.events = self
+        self.script = script
+        self.last_arrival = None
+
+    def __len__(self):
+        now = monotonic()
+        return sum(1 for arrival, key, pressed in self.script if arrival <= now)
+
+    def get(self):
+        if self.script and self.script[0][0] <= monotonic():
+            arrival, key_number, pressed = self.script.pop(0)
+            self.last_arrival = arrival
+            return KeyEvent(key_number, pressed)
+        return None
+
+
+class ArrivalLatency(LatencyTracker):
+    """Latency tracker timing keys from their arrival rather than their read."""
+
+    def __init__(self, keys):
+        super().__init__(report_seconds=1e9, bucket_ms=10, bucket_count=10)
+        self.keys = keys
+
+    def key_read(self, key_number, timestamp):
+        super().key_read(key_number, self.keys.last_arrival)
+
+
+class ModelGame:
+    '''
+    Game running at the full frame rate whose tick blocks for a fixed time.
+    Key presses change the game state; releases do not.
+    '''
+
+    def __init__(self, tick_seconds):
+        self.tick_seconds = tick_seconds
+        self.tick_count = 0
+        self.presses = 0
+        self.current_state = C.GameState.ACTIVE_GAME
+        self.governor = None
+        self.frame_stats = FrameStats(report_seconds=1e9)
+
+    def frame_seconds(self):
+        return 0
+
+    def skip_elapsed(self):
+        pass
+
+    def input_signature(self):
+        return self.presses
+
+    def key_event(self, key_number, pressed):
+        if pressed:
+            self.presses += 1
+
+    def tick(self):
+        sleep(self.tick_seconds)
+        self.tick_count += 1
+
+    def save_high_scores(self):
+        pass
+
+    def save_snapshot(self):
+        pass
+
+
+class Display:
+    """Display whose refresh blocks for a fixed time."""
+
+    def __init__(self, refresh_seconds):
+        self.refresh_seconds = refresh_seconds
+
+    def refresh(self):
+        sleep(self.refresh_seconds)
+
+
+def key_script(seconds, rate, rng):
+    '''
+    Return (arrival, key, pressed) events arriving at random on the wall
+    clock over ``seconds``, alternating presses and releases
+    '''
+    script = []
+    start = monotonic() + 0.5
+    arrival = 0
+    pressed = True
+    while True:
+        arrival += rng.expovariate(rate)
+        if arrival >= seconds:
+            return script
+        script.append((start + arrival, rng.randrange(8), pressed))
+        pressed = not pressed
+
+
+def run(name, args):
+    '''
+    Run one main loop for ``args.seconds`` against the model game and print
+    its latency, refresh interval and duty cycle
+    '''
+    keys = ScriptedKeys(key_script(args.seconds, args.key_rate, random.Random(args.seed)))
+    game = ModelGame(args.tick_ms / 1000)
+    latency_tracker = ArrivalLatency(keys)
+    duty_cycle = DutyCycle({C.GameState.ACTIVE_GAME: 'ACTIVE_GAME'}, report_seconds=1e9)
+    frame_loop = FrameLoop(game, Display(args.refresh_ms / 1000), keys, latency_tracker, duty_cycle)
+
+    # Run the loop until the time is up
+    if name == 'async':
+        try:
+            asyncio.run(asyncio.wait_for(async_runtime.main(frame_loop), args.seconds))
+        except asyncio.TimeoutError:
+            pass
+    else:
+        end_time = monotonic() + args.seconds
+        while monotonic() < end_time:
+            frame_loop.run_frame()
+
+    print(name + ':')
+    print('  input latency ms:', latency_tracker.histogram.format(), 'ignored={}'.format(latency_tracker.ignored))
+    print('  frame interval ms:', game.frame_stats.histograms['frame_interval'].format())
+    print('  ', end='')
+    duty_cycle.report()
+
+
+def main():
+    """Parse command line options and run both main loops."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--seconds', type=float, default=20, help='run time of each main loop')
+    parser.add_argument('--tick-ms', type=float, default=12, help='blocking time of each game tick')
+    parser.add_argument('--refresh-ms', type=float, default=25, help='blocking time of each display refresh')
+    parser.add_argument('--key-rate', type=float, default=6, help='mean key events per second')
+    parser.add_argument('--seed', type=int, default=3, help='seed of the key script')
+    args = parser.parse_args()
+
+    for name in ('poll', 'async'):
+        run(name, args)
+
+
+if __name__ == '__main__':
+    main()